@@ -0,0 +1,88 @@
+"""Movie full-text search documents
+
+Revision ID: 3c5e7a1d9b20
+Revises: 1bd978aeb627
+Create Date: 2026-10-16 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c5e7a1d9b20'
+down_revision: Union[str, Sequence[str], None] = '1bd978aeb627'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+POSTGRESQL_BACKFILL = """
+UPDATE movies SET search_vector =
+    setweight(to_tsvector('simple'::regconfig, coalesce(movies.name, '')), 'A')
+    || setweight(to_tsvector('simple'::regconfig, coalesce((
+        SELECT string_agg(actors.name, ' ') FROM actors_movies
+        JOIN actors ON actors_movies.actor_id = actors.id
+        WHERE actors_movies.movie_id = movies.id
+    ), '')), 'B')
+    || setweight(to_tsvector('simple'::regconfig, coalesce((
+        SELECT string_agg(directors.name, ' ') FROM directors_movies
+        JOIN directors ON directors_movies.director_id = directors.id
+        WHERE directors_movies.movie_id = movies.id
+    ), '')), 'B')
+    || setweight(to_tsvector('simple'::regconfig, coalesce(movies.description, '')), 'C')
+"""
+
+SQLITE_BACKFILL = """
+INSERT INTO movies_search (rowid, name, description, actors, directors)
+SELECT
+    movies.id,
+    movies.name,
+    movies.description,
+    coalesce((
+        SELECT group_concat(actors.name, ' ') FROM actors_movies
+        JOIN actors ON actors_movies.actor_id = actors.id
+        WHERE actors_movies.movie_id = movies.id
+    ), ''),
+    coalesce((
+        SELECT group_concat(directors.name, ' ') FROM directors_movies
+        JOIN directors ON directors_movies.director_id = directors.id
+        WHERE directors_movies.movie_id = movies.id
+    ), '')
+FROM movies
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    op.add_column('movies', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR().with_variant(sa.Text(), 'sqlite'),
+        nullable=True,
+    ))
+
+    if dialect == 'postgresql':
+        op.execute(POSTGRESQL_BACKFILL)
+        op.create_index('ix_movies_search_vector', 'movies', ['search_vector'], postgresql_using='gin')
+    elif dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS movies_search "
+            "USING fts5(name, description, actors, directors, tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(SQLITE_BACKFILL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.drop_index('ix_movies_search_vector', table_name='movies')
+    elif dialect == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS movies_search")
+
+    op.drop_column('movies', 'search_vector')
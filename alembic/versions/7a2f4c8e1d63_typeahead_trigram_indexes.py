@@ -0,0 +1,50 @@
+"""Typeahead trigram indexes
+
+Revision ID: 7a2f4c8e1d63
+Revises: 3c5e7a1d9b20
+Create Date: 2026-10-16 11:04:27.550913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a2f4c8e1d63'
+down_revision: Union[str, Sequence[str], None] = '3c5e7a1d9b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRIGRAM_INDEXES = (
+    ('ix_movies_name_trgm', 'movies'),
+    ('ix_actors_name_trgm', 'actors'),
+    ('ix_directors_name_trgm', 'directors'),
+    ('ix_genres_name_trgm', 'genres'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, table_name in TRIGRAM_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            ['name'],
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for index_name, table_name in TRIGRAM_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,50 @@
+"""Email outbox
+
+Revision ID: a6c8e2f4b157
+Revises: f2a9c4d7e813
+Create Date: 2026-10-16 23:52:17.604381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c8e2f4b157'
+down_revision: Union[str, Sequence[str], None] = 'f2a9c4d7e813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'email_outbox',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            'kind',
+            sa.Enum(
+                'ACTIVATION', 'ACTIVATION_COMPLETE', 'PASSWORD_RESET', 'PASSWORD_RESET_COMPLETE',
+                name='emailkindenum'
+            ),
+            nullable=False
+        ),
+        sa.Column('recipient', sa.String(length=255), nullable=False),
+        sa.Column('link', sa.String(length=1024), nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column(
+            'created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False
+        ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_email_outbox_next_attempt_at'), 'email_outbox', ['next_attempt_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_email_outbox_next_attempt_at'), table_name='email_outbox')
+    op.drop_table('email_outbox')
@@ -0,0 +1,58 @@
+"""Movie rating and reaction aggregates
+
+Revision ID: b4d1e9f3a7c2
+Revises: 7a2f4c8e1d63
+Create Date: 2026-10-16 12:21:09.184377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d1e9f3a7c2'
+down_revision: Union[str, Sequence[str], None] = '7a2f4c8e1d63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+AGGREGATE_COLUMNS = ('ratings_count', 'ratings_sum', 'likes', 'dislikes')
+
+RATING_VALUES = ('ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN', 'EIGHT', 'NINE', 'TEN')
+
+RATING_CASES = " ".join(
+    f"WHEN '{name}' THEN {value}" for value, name in enumerate(RATING_VALUES, start=1)
+)
+
+BACKFILL = f"""
+UPDATE movies SET
+    ratings_count = (SELECT count(*) FROM ratings WHERE ratings.movie_id = movies.id),
+    ratings_sum = (
+        SELECT coalesce(sum(CASE ratings.rating {RATING_CASES} ELSE 0 END), 0)
+        FROM ratings WHERE ratings.movie_id = movies.id
+    ),
+    likes = (
+        SELECT count(*) FROM movie_reactions
+        WHERE movie_reactions.movie_id = movies.id AND movie_reactions.reaction = 'LIKE'
+    ),
+    dislikes = (
+        SELECT count(*) FROM movie_reactions
+        WHERE movie_reactions.movie_id = movies.id AND movie_reactions.reaction = 'DISLIKE'
+    )
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in AGGREGATE_COLUMNS:
+        op.add_column('movies', sa.Column(column, sa.Integer(), server_default='0', nullable=False))
+
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in reversed(AGGREGATE_COLUMNS):
+        op.drop_column('movies', column)
@@ -0,0 +1,28 @@
+"""Movie content hash
+
+Revision ID: c7e2b9d4f061
+Revises: a6c8e2f4b157
+Create Date: 2026-10-17 01:08:42.517903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2b9d4f061'
+down_revision: Union[str, Sequence[str], None] = 'a6c8e2f4b157'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('movies', sa.Column('content_hash', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('movies', 'content_hash')
@@ -0,0 +1,103 @@
+"""Movie aggregate triggers
+
+Revision ID: d8c3a6b5e214
+Revises: b4d1e9f3a7c2
+Create Date: 2026-10-16 13:02:46.771530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8c3a6b5e214'
+down_revision: Union[str, Sequence[str], None] = 'b4d1e9f3a7c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+RATING_VALUES = ('ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN', 'EIGHT', 'NINE', 'TEN')
+
+
+def rating_deltas(row: str, sign: str) -> str:
+    whens = ' '.join(f"WHEN '{name}' THEN {value}" for value, name in enumerate(RATING_VALUES, start=1))
+    return (
+        f"ratings_count = ratings_count {sign} 1, "
+        f"ratings_sum = ratings_sum {sign} (CASE {row}.rating {whens} ELSE 0 END)"
+    )
+
+
+def reaction_deltas(row: str, sign: str) -> str:
+    return (
+        f"likes = likes {sign} (CASE WHEN {row}.reaction = 'LIKE' THEN 1 ELSE 0 END), "
+        f"dislikes = dislikes {sign} (CASE WHEN {row}.reaction = 'DISLIKE' THEN 1 ELSE 0 END)"
+    )
+
+
+TRIGGERS = {
+    'ratings': rating_deltas,
+    'movie_reactions': reaction_deltas,
+}
+
+
+def postgresql_statements(table_name: str, deltas) -> list[str]:
+    return [
+        f"""
+        CREATE OR REPLACE FUNCTION {table_name}_aggregates() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE movies SET {deltas('OLD', '-')} WHERE id = OLD.movie_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE movies SET {deltas('NEW', '+')} WHERE id = NEW.movie_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+        f"""
+        CREATE TRIGGER {table_name}_aggregates
+        AFTER INSERT OR UPDATE OR DELETE ON {table_name}
+        FOR EACH ROW EXECUTE FUNCTION {table_name}_aggregates()
+        """,
+    ]
+
+
+def sqlite_statements(table_name: str, deltas) -> list[str]:
+    old = f"UPDATE movies SET {deltas('OLD', '-')} WHERE id = OLD.movie_id;"
+    new = f"UPDATE movies SET {deltas('NEW', '+')} WHERE id = NEW.movie_id;"
+    return [
+        f"CREATE TRIGGER {table_name}_aggregates_insert AFTER INSERT ON {table_name} BEGIN {new} END",
+        f"CREATE TRIGGER {table_name}_aggregates_update AFTER UPDATE ON {table_name} BEGIN {old} {new} END",
+        f"CREATE TRIGGER {table_name}_aggregates_delete AFTER DELETE ON {table_name} BEGIN {old} END",
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    for table_name, deltas in TRIGGERS.items():
+        if dialect == 'postgresql':
+            statements = postgresql_statements(table_name, deltas)
+        elif dialect == 'sqlite':
+            statements = sqlite_statements(table_name, deltas)
+        else:
+            continue
+
+        for statement in statements:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    for table_name in TRIGGERS:
+        if dialect == 'postgresql':
+            op.execute(f"DROP TRIGGER IF EXISTS {table_name}_aggregates ON {table_name}")
+            op.execute(f"DROP FUNCTION IF EXISTS {table_name}_aggregates()")
+        elif dialect == 'sqlite':
+            for operation in ('insert', 'update', 'delete'):
+                op.execute(f"DROP TRIGGER IF EXISTS {table_name}_aggregates_{operation}")
@@ -0,0 +1,89 @@
+"""Catalogue counters
+
+Revision ID: e5f1a7c3b926
+Revises: d8c3a6b5e214
+Create Date: 2026-10-16 20:14:32.508116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f1a7c3b926'
+down_revision: Union[str, Sequence[str], None] = 'd8c3a6b5e214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+POSTGRESQL_TRIGGERS = [
+    """
+    CREATE OR REPLACE FUNCTION movies_counter() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE catalogue_counters SET value = value + (SELECT count(*) FROM inserted_movies)
+            WHERE name = 'movies';
+        ELSE
+            UPDATE catalogue_counters SET value = value - (SELECT count(*) FROM deleted_movies)
+            WHERE name = 'movies';
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER movies_counter_insert AFTER INSERT ON movies
+    REFERENCING NEW TABLE AS inserted_movies
+    FOR EACH STATEMENT EXECUTE FUNCTION movies_counter()
+    """,
+    """
+    CREATE TRIGGER movies_counter_delete AFTER DELETE ON movies
+    REFERENCING OLD TABLE AS deleted_movies
+    FOR EACH STATEMENT EXECUTE FUNCTION movies_counter()
+    """,
+]
+
+SQLITE_TRIGGERS = [
+    "CREATE TRIGGER movies_counter_insert AFTER INSERT ON movies "
+    "BEGIN UPDATE catalogue_counters SET value = value + 1 WHERE name = 'movies'; END",
+    "CREATE TRIGGER movies_counter_delete AFTER DELETE ON movies "
+    "BEGIN UPDATE catalogue_counters SET value = value - 1 WHERE name = 'movies'; END",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'catalogue_counters',
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('value', sa.Integer(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+    op.execute("INSERT INTO catalogue_counters (name, value) SELECT 'movies', count(*) FROM movies")
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        statements = POSTGRESQL_TRIGGERS
+    elif dialect == 'sqlite':
+        statements = SQLITE_TRIGGERS
+    else:
+        statements = []
+
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP TRIGGER IF EXISTS movies_counter_insert ON movies")
+        op.execute("DROP TRIGGER IF EXISTS movies_counter_delete ON movies")
+        op.execute("DROP FUNCTION IF EXISTS movies_counter()")
+    elif dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS movies_counter_insert")
+        op.execute("DROP TRIGGER IF EXISTS movies_counter_delete")
+
+    op.drop_table('catalogue_counters')
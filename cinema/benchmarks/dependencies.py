@@ -0,0 +1,59 @@
+"""
+Per-request cost of providing the settings, JWT manager, email sender and S3 client.
+
+"per request" builds exactly what the dependencies used to build on every call: settings
+parsed from the environment, a JWTAuthManager, the Jinja environment of an EmailSender and
+the aioboto3 session of an S3StorageClient. It does not go through `ServiceContainer`, whose
+services now also precompile templates and set up connection pools, which the old
+dependencies never did. "container" is what they do now: return the services built once
+by the application lifespan.
+
+    ENVIRONMENT=testing python -m cinema.benchmarks.dependencies --requests 2000
+"""
+import argparse
+import timeit
+
+import aioboto3
+from jinja2 import Environment, FileSystemLoader
+
+from cinema.config.services import ServiceContainer
+from cinema.config.settings import get_settings
+from cinema.security.token_manager import JWTAuthManager
+
+parse_settings = get_settings.__wrapped__
+
+
+def build_per_request() -> None:
+    settings = parse_settings()
+    JWTAuthManager(
+        secret_key_access=settings.SECRET_KEY_ACCESS,
+        secret_key_refresh=settings.SECRET_KEY_REFRESH,
+        algorithm=settings.JWT_SIGNING_ALGORITHM
+    )
+    Environment(loader=FileSystemLoader(settings.PATH_TO_EMAIL_TEMPLATES_DIR))
+    aioboto3.Session(
+        aws_access_key_id=settings.S3_STORAGE_ACCESS_KEY,
+        aws_secret_access_key=settings.S3_STORAGE_SECRET_KEY,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="Simulated requests per strategy.")
+    args = parser.parse_args()
+
+    services = ServiceContainer.from_settings(get_settings())
+
+    def from_container() -> None:
+        get_settings()
+        _ = services.jwt_manager, services.email_sender, services.s3_storage
+
+    print(f"{args.requests} simulated requests")
+    print(f"{'strategy':<12} {'us/request':>12}")
+    for name, provide in (("per request", build_per_request), ("container", from_container)):
+        seconds = min(timeit.repeat(provide, number=args.requests, repeat=3))
+        print(f"{name:<12} {seconds / args.requests * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Login password verification latency per bcrypt cost factor.
+
+Verifies a password `--logins` times per cost through a `PasswordHasher`, keeping
+`--concurrency` logins in flight like a busy worker would, and reports the p50/p99 latency
+(queueing included) and the throughput. Use it to pick `BCRYPT_ROUNDS` for the target
+hardware, e.g.:
+
+    ENVIRONMENT=testing python -m cinema.benchmarks.passwords --costs 10 11 12 13 14 --concurrency 8
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from cinema.security.passwords import PASSWORD_HASHER_MAX_WORKERS, PasswordHasher, create_password_context
+
+PASSWORD = "BenchmarkPassword123!"
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def measure(cost: int, logins: int, concurrency: int, workers: int) -> List[float]:
+    context = create_password_context(cost)
+    hashed_password = context.hash(PASSWORD)
+    hasher = PasswordHasher(context, max_workers=workers, max_pending=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login() -> float:
+        async with semaphore:
+            started_at = time.perf_counter()
+            assert await hasher.verify(PASSWORD, hashed_password)
+            return time.perf_counter() - started_at
+
+    try:
+        return list(await asyncio.gather(*(login() for _ in range(logins))))
+    finally:
+        hasher.shutdown()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--costs", type=int, nargs="+", default=[10, 11, 12, 13, 14])
+    parser.add_argument("--logins", type=int, default=50, help="Logins measured per cost.")
+    parser.add_argument("--concurrency", type=int, default=1, help="Logins in flight at once.")
+    parser.add_argument("--workers", type=int, default=PASSWORD_HASHER_MAX_WORKERS, help="Hashing threads.")
+    args = parser.parse_args()
+
+    print(f"{args.logins} logins per cost, concurrency {args.concurrency}, {args.workers} hashing threads")
+    print(f"{'cost':>4} {'p50 ms':>10} {'p99 ms':>10} {'mean ms':>10} {'logins/s':>10}")
+    for cost in args.costs:
+        started_at = time.perf_counter()
+        samples = await measure(cost, args.logins, args.concurrency, args.workers)
+        elapsed = time.perf_counter() - started_at
+        print(
+            f"{cost:>4} {percentile(samples, 0.50) * 1000:>10.1f} {percentile(samples, 0.99) * 1000:>10.1f} "
+            f"{statistics.mean(samples) * 1000:>10.1f} {len(samples) / elapsed:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
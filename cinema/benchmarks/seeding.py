@@ -0,0 +1,125 @@
+"""
+CSV seeding throughput per stage.
+
+Writes a synthetic catalogue of `--rows` movies in the seed CSV format (drawing genres,
+actors, directors and languages from pools of names, so every name is shared by many
+movies) and seeds it into a fresh SQLite database file once per `--chunk-sizes` value.
+For every stage of `CSVDatabaseSeeder` it reports the time spent and the rows per second:
+
+- "read": reading a chunk of the CSV and preprocessing it;
+- "reference data": exploding the name columns and resolving the names to IDs;
+- "movies": building and inserting the movie rows;
+- "associations": building and inserting the four association tables;
+- "search": building the full-text search documents.
+
+    ENVIRONMENT=testing python -m cinema.benchmarks.seeding --rows 100000 --chunk-sizes 1000 10000
+"""
+import argparse
+import asyncio
+import resource
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from cinema.database.models.base import Base
+from cinema.database.populate import CSVDatabaseSeeder
+
+COUNTRIES = ["US", "GB", "FR", "DE", "CA", "AU", "JP", "IN", "ES", "IT"]
+CERTIFICATIONS = ["G", "PG", "PG13", "R", "NC17"]
+GENRES = [
+    "Action", "Adventure", "Animation", "Comedy", "Crime", "Drama", "Fantasy",
+    "Horror", "Mystery", "Romance", "Science Fiction", "Thriller", "Western",
+]
+
+
+def _names(rng: np.random.Generator, pool: np.ndarray, rows: int, most: int, separator: str) -> np.ndarray:
+    """
+    Join between one and `most` names drawn from `pool` for every row.
+    """
+    counts = rng.integers(1, most + 1, size=rows)
+    picks = pool[rng.integers(0, len(pool), size=(rows, most))]
+    return np.array([separator.join(row[:count]) for row, count in zip(picks, counts)])
+
+
+def write_synthetic_csv(path: Path, rows: int, seed: int = 0) -> None:
+    """
+    Write `rows` random movies to `path`, in the columns of the seed CSV.
+    """
+    rng = np.random.default_rng(seed)
+    actors = np.array([f"Actor{number}" for number in range(max(rows // 5, 10))])
+    directors = np.array([f"Director{number}" for number in range(max(rows // 20, 10))])
+    languages = np.array([f"Language{number}" for number in range(100)])
+    years = rng.integers(1950, 2025, size=rows)
+    pd.DataFrame({
+        "uuid": [str(uuid.UUID(int=int(number), version=4)) for number in rng.integers(0, 2 ** 63, size=rows)],
+        "name": [f"Synthetic Movie {number}" for number in range(rows)],
+        "year": years,
+        "duration": rng.integers(70, 200, size=rows),
+        "imdb": rng.uniform(1, 10, size=rows).round(2),
+        "imdb_votes": rng.integers(0, 2_000_000, size=rows),
+        "description": [f"Synthetic movie number {number}." for number in range(rows)],
+        "budget": rng.uniform(1e5, 3e8, size=rows).round(2),
+        "revenue": rng.uniform(0, 2e9, size=rows).round(2),
+        "country": rng.choice(COUNTRIES, size=rows),
+        "certification": rng.choice(CERTIFICATIONS, size=rows),
+        "price": rng.uniform(1, 30, size=rows).round(2),
+        "genres": _names(rng, np.array(GENRES), rows, 3, ", "),
+        "languages": _names(rng, languages, rows, 2, ","),
+        "actors": _names(rng, actors, rows, 5, ","),
+        "directors": _names(rng, directors, rows, 2, ","),
+    }).to_csv(path, index=False)
+
+
+async def seed(csv_path: Path, db_path: Path, chunk_size: int) -> CSVDatabaseSeeder:
+    """
+    Seed the CSV into a new SQLite database file and return the seeder with its timings.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)  # type: ignore
+    try:
+        async with session_factory() as session:
+            seeder = CSVDatabaseSeeder(str(csv_path), session, chunk_size=chunk_size)
+            await seeder.seed()
+        return seeder
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="Movies in the synthetic CSV.")
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[10_000], help="Seeder chunk sizes to run.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "movies.csv"
+        started_at = time.perf_counter()
+        write_synthetic_csv(csv_path, args.rows)
+        print(f"Wrote {args.rows} movies in {time.perf_counter() - started_at:.1f} s")
+
+        results = []
+        for run, chunk_size in enumerate(args.chunk_sizes):
+            started_at = time.perf_counter()
+            seeder = asyncio.run(seed(csv_path, Path(tmp_dir) / f"cinema-{run}.db", chunk_size))
+            results.append((chunk_size, seeder, time.perf_counter() - started_at))
+
+    for chunk_size, seeder, total in results:
+        print(f"\n{seeder.rows_seeded} rows, chunk size {chunk_size}")
+        print(f"{'stage':<16} {'seconds':>9} {'rows/s':>12}")
+        for stage, seconds in seeder.stage_seconds.items():
+            print(f"{stage:<16} {seconds:>9.2f} {seeder.rows_seeded / seconds:>12.0f}")
+        print(f"{'total':<16} {total:>9.2f} {seeder.rows_seeded / total:>12.0f}")
+
+    print(f"\nPeak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
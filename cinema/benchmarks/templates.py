@@ -0,0 +1,78 @@
+"""
+Email template rendering throughput and startup cost.
+
+Renders the four account email templates in turn, `--renders` times per strategy:
+
+- "new environment": a Jinja environment per email, as when the email sender was built per request;
+- "get_template": a shared environment queried per email, with its up-to-date check;
+- "registry": the precompiled templates of a `TemplateRegistry`.
+
+It then times building a `TemplateRegistry` (loading and compiling all four templates)
+without a bytecode cache, and with a warm one, as a new worker process would.
+
+    ENVIRONMENT=testing python -m cinema.benchmarks.templates --renders 20000
+"""
+import argparse
+import tempfile
+import time
+import timeit
+from itertools import cycle
+
+from jinja2 import Environment, FileSystemLoader
+
+from cinema.config.settings import get_settings
+from cinema.notifications.templates import TemplateRegistry
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--renders", type=int, default=20000, help="Renders per strategy.")
+    parser.add_argument("--builds", type=int, default=50, help="Registry builds per startup measurement.")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    template_dir = settings.PATH_TO_EMAIL_TEMPLATES_DIR
+    names = [
+        settings.ACTIVATION_EMAIL_TEMPLATE_NAME,
+        settings.ACTIVATION_COMPLETE_EMAIL_TEMPLATE_NAME,
+        settings.PASSWORD_RESET_TEMPLATE_NAME,
+        settings.PASSWORD_RESET_COMPLETE_TEMPLATE_NAME,
+    ]
+    context = {
+        "email": "user@example.com",
+        "activation_link": "http://127.0.0.1/accounts/activate/?token=0123456789abcdef&email=user@example.com",
+        "login_link": "http://127.0.0.1/accounts/login/",
+        "reset_link": "http://127.0.0.1/accounts/password-reset-complete/",
+    }
+    shared_env = Environment(loader=FileSystemLoader(template_dir))
+    registry = TemplateRegistry(template_dir, names, bytecode_cache=False)
+
+    strategies = {
+        "new environment": lambda name: Environment(loader=FileSystemLoader(template_dir))
+        .get_template(name).render(**context),
+        "get_template": lambda name: shared_env.get_template(name).render(**context),
+        "registry": lambda name: registry.render(name, **context),
+    }
+
+    print(f"{args.renders} renders per strategy")
+    print(f"{'strategy':<16} {'us/render':>10} {'renders/s':>12}")
+    for strategy, render in strategies.items():
+        templates = cycle(names)
+        seconds = min(timeit.repeat(lambda: render(next(templates)), number=args.renders, repeat=3))
+        print(f"{strategy:<16} {seconds / args.renders * 1e6:>10.1f} {args.renders / seconds:>12.0f}")
+
+    print(f"\nRegistry startup, mean of {args.builds} builds")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        TemplateRegistry(template_dir, names, bytecode_cache_dir=cache_dir)
+        for label, options in (
+                ("no bytecode cache", {"bytecode_cache": False}),
+                ("warm bytecode cache", {"bytecode_cache_dir": cache_dir}),
+        ):
+            started_at = time.perf_counter()
+            for _ in range(args.builds):
+                TemplateRegistry(template_dir, names, **options)
+            print(f"{label:<20} {(time.perf_counter() - started_at) / args.builds * 1000:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
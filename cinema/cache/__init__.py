@@ -0,0 +1,11 @@
+from cinema.cache.ttl import TTLCache
+from cinema.cache.counts import count_cache
+from cinema.cache.principals import (
+    Principal,
+    PrincipalCache,
+    principal_cache,
+)
+from cinema.cache.responses import (
+    ResponseCache,
+    response_cache,
+)
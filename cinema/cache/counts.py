@@ -0,0 +1,11 @@
+from cinema.cache.ttl import TTLCache
+
+# How long a filtered movie count is reused. Writes in this process also invalidate it
+# (the cache key carries the response cache's catalogue version); writes made by other
+# workers become visible once the entry expires.
+COUNT_CACHE_TTL_SECONDS = 10.0
+
+# Maximum number of distinct filter signatures kept.
+COUNT_CACHE_MAX_ENTRIES = 512
+
+count_cache: TTLCache[str, int] = TTLCache(COUNT_CACHE_TTL_SECONDS, COUNT_CACHE_MAX_ENTRIES)
@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from cinema.cache.ttl import TTLCache
+from cinema.database.models.accounts import UserGroupEnum
+
+# How long a principal is trusted without re-reading the user. Writes in this process
+# invalidate it at once; group or activation changes made by other workers (or directly in
+# the database) take effect once the entry expires.
+PRINCIPAL_CACHE_TTL_SECONDS = 15.0
+
+# Maximum number of users kept; the least recently active one is evicted first.
+PRINCIPAL_CACHE_MAX_ENTRIES = 4096
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    The part of a user that authentication and authorization need.
+    """
+    id: int
+    is_active: bool
+    group_name: UserGroupEnum
+    token_version: int
+
+    @property
+    def is_staff(self) -> bool:
+        return self.group_name in (UserGroupEnum.MODERATOR, UserGroupEnum.ADMIN)
+
+    @property
+    def is_admin(self) -> bool:
+        return self.group_name == UserGroupEnum.ADMIN
+
+
+class PrincipalCache:
+    """
+    In-process TTL + LRU cache of principals, keyed by user id.
+
+    Every invalidation bumps a generation counter. A principal is only stored if no
+    invalidation happened since its row was read (`set` takes the generation observed
+    before the read), so a concurrent group change cannot be overwritten by stale data.
+    """
+
+    def __init__(
+            self,
+            ttl: float = PRINCIPAL_CACHE_TTL_SECONDS,
+            max_entries: int = PRINCIPAL_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._entries: TTLCache[int, Principal] = TTLCache(ttl, max_entries)
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        return self._entries.get(user_id)
+
+    def set(self, principal: Principal, generation: int) -> None:
+        if generation == self._generation:
+            self._entries.set(principal.id, principal)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Forget a user's principal; call after committing a change to its group, activation or password.
+        """
+        self._entries.pop(user_id)
+        self._generation += 1
+
+
+principal_cache = PrincipalCache()
@@ -0,0 +1,142 @@
+import hashlib
+import secrets
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from cinema.cache.ttl import TTLCache
+
+# How long a cached body is served, or confirmed with a 304, before it is rebuilt even without
+# a write. Writes made by other worker processes or by the seeder only bump the counters of the
+# process that made them, so this bounds how stale any response of this process can be.
+RESPONSE_CACHE_TTL_SECONDS = 30.0
+
+# Maximum number of cached bodies; the least recently used one is evicted first.
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+# Clients may keep the body but must revalidate it (cheaply, with If-None-Match) before reuse.
+CACHE_CONTROL = "no-cache"
+
+
+@dataclass
+class CachedResponse:
+    etag: str
+    body: bytes
+
+
+class ResponseCache:
+    """
+    In-process cache of rendered JSON responses for the anonymous movie read endpoints.
+
+    Entries are keyed on the route plus its normalised parameters and bounded by a TTL and
+    an LRU limit. Every entry is tagged with a strong ETag derived from version counters:
+
+    - each movie has its own version, bumped by every write that changes its detail payload;
+    - the catalogue version is bumped by every write that can change a movie list.
+
+    Invalidation is therefore O(1): a write bumps the counters, and entries tagged with an
+    older ETag are dropped the next time they are looked up. The ETags also carry a random
+    per-process token, so a counter restarting from zero never reproduces an old tag.
+
+    A conditional request only gets a 304 while this process holds an unexpired entry with
+    the client's ETag, so a 304 is never older than a cached body would be.
+    """
+
+    def __init__(
+            self,
+            ttl: float = RESPONSE_CACHE_TTL_SECONDS,
+            max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._entries: TTLCache[str, CachedResponse] = TTLCache(ttl, max_entries)
+        self._movie_versions: Dict[int, int] = {}
+        self._catalogue_version = 0
+        self._token = secrets.token_hex(4)
+
+    @staticmethod
+    def key(route: str, **params: Any) -> str:
+        """
+        Build a cache key from the route and its parameters; unset (None) parameters are ignored
+        and the order of the parameters does not matter.
+        """
+        query = "&".join(f"{name}={value}" for name, value in sorted(params.items()) if value is not None)
+        return f"{route}?{query}"
+
+    def movie_etag(self, movie_id: int) -> str:
+        return f'"{self._token}-m{movie_id}-{self._movie_versions.get(movie_id, 0)}"'
+
+    @property
+    def catalogue_version(self) -> int:
+        return self._catalogue_version
+
+    def list_etag(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        return f'"{self._token}-l{digest}-{self._catalogue_version}"'
+
+    def respond(self, request: Request, key: str, etag: str) -> Optional[Response]:
+        """
+        Answer from the cache if possible.
+
+        :return: 304 if the entry is current and the client already has it, 200 with the
+                 cached body if the entry is current, or None if the response has to be built.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.etag != etag:
+            self._entries.pop(key)
+            return None
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+        return self._response(entry.body, etag)
+
+    def store(self, key: str, etag: str, content: BaseModel) -> Response:
+        """
+        Render `content`, cache the body under `key` and return it with its ETag.
+
+        `etag` must be computed before the data is read, so a write that lands in between
+        leaves the entry tagged with an outdated version instead of a current one.
+        """
+        body = content.model_dump_json().encode()
+        self._entries.set(key, CachedResponse(etag=etag, body=body))
+        return self._response(body, etag)
+
+    def invalidate_movies(self, movie_ids: Iterable[int], catalogue: bool = True) -> None:
+        """
+        Mark the given movies as changed; call after the write is committed.
+
+        :param movie_ids: IDs of the movies whose detail payload changed.
+        :param catalogue: Whether the change can also affect movie lists (false for comments,
+                          which only appear in the detail).
+        """
+        for movie_id in movie_ids:
+            self._movie_versions[movie_id] = self._movie_versions.get(movie_id, 0) + 1
+        if catalogue:
+            self._catalogue_version += 1
+
+    def invalidate_movie(self, movie_id: int, catalogue: bool = True) -> None:
+        self.invalidate_movies([movie_id], catalogue)
+
+    @staticmethod
+    def _response(body: bytes, etag: str) -> Response:
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+        )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Weak comparison of an `If-None-Match` header against the current ETag (RFC 9110, 13.1.2).
+
+    `*` is not honoured: it would need to know whether the resource exists, which is
+    exactly the lookup the ETag check is meant to skip.
+    """
+    if not if_none_match:
+        return False
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+response_cache = ResponseCache()
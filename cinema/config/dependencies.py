@@ -1,144 +1,309 @@
-from fastapi import Depends, HTTPException
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request
 from sqlalchemy.orm import selectinload
 
-from cinema.config.settings import BaseAppSettings, get_settings
+from cinema.config.services import ServiceContainer
+from cinema.config.settings import BaseAppSettings
 from cinema.notifications.interfaces import EmailSenderInterface
-from cinema.notifications.emails import EmailSender
+from cinema.notifications.outbox import EmailOutboxDispatcher
 from cinema.security.interfaces import JWTAuthManagerInterface
-from cinema.security.token_manager import JWTAuthManager
+from cinema.security.passwords import PasswordHasher, password_hasher
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 from cinema.storages.interfaces import S3StorageInterface
-from cinema.storages.s3 import S3StorageClient
 
 from cinema.database.models.accounts import UserModel, UserGroupEnum, UserGroupModel
 from cinema.database.models.movies import MovieModel
-from cinema.exceptions.security import BaseSecurityError
+from cinema.exceptions.security import BaseSecurityError, TokenRevokedError
 from cinema.security.http import get_token
 from cinema.database import get_db
+from cinema.database.typeahead import TypeaheadIndex, typeahead_index
+from cinema.cache import (
+    Principal,
+    PrincipalCache,
+    ResponseCache,
+    TTLCache,
+    count_cache,
+    principal_cache,
+    response_cache,
+)
+
+
+def get_services(request: Request) -> ServiceContainer:
+    """
+    Retrieve the worker's service container.
+
+    The container is built once by the application lifespan (see `cinema.main`) and stored
+    on the application state.
+
+    Args:
+        request (Request): The current request, giving access to the application.
+
+    Returns:
+        ServiceContainer: The services shared by every request of this worker.
+    """
+    return request.app.state.services
 
 
-def get_jwt_auth_manager(settings: BaseAppSettings = Depends(get_settings)) -> JWTAuthManagerInterface:
+def get_jwt_auth_manager(services: ServiceContainer = Depends(get_services)) -> JWTAuthManagerInterface:
     """
-    Create and return a JWT authentication manager instance.
+    Retrieve the JWT authentication manager.
 
-    This function uses the provided application settings to instantiate a JWTAuthManager, which implements
-    the JWTAuthManagerInterface. The manager is configured with secret keys for access and refresh tokens
-    as well as the JWT signing algorithm specified in the settings.
+    The manager is configured with the secret keys for access and refresh tokens as well as
+    the JWT signing algorithm specified in the settings.
 
     Args:
-        settings (BaseAppSettings, optional): The application settings instance.
-        Defaults to the output of get_settings().
+        services (ServiceContainer): The worker's service container.
 
     Returns:
-        JWTAuthManagerInterface: An instance of JWTAuthManager configured with
-        the appropriate secret keys and algorithm.
+        JWTAuthManagerInterface: The shared JWTAuthManager.
     """
-    return JWTAuthManager(
-        secret_key_access=settings.SECRET_KEY_ACCESS,
-        secret_key_refresh=settings.SECRET_KEY_REFRESH,
-        algorithm=settings.JWT_SIGNING_ALGORITHM
-    )
+    return services.jwt_manager
 
 
 def get_accounts_email_notificator(
-    settings: BaseAppSettings = Depends(get_settings)
+    services: ServiceContainer = Depends(get_services)
 ) -> EmailSenderInterface:
     """
-    Retrieve an instance of the EmailSenderInterface configured with the application settings.
+    Retrieve the email sender used for account notifications (e.g., activation, password reset).
 
-    This function creates an EmailSender using the provided settings, which include details such as the email host,
-    port, credentials, TLS usage, and the directory and filenames for email templates. This allows the application
-    to send various email notifications (e.g., activation, password reset) as required.
+    The sender is configured with the email host, port, credentials, TLS usage, and the directory
+    and filenames for email templates from the settings.
 
     Args:
-        settings (BaseAppSettings, optional): The application settings,
-        provided via dependency injection from `get_settings`.
+        services (ServiceContainer): The worker's service container.
 
     Returns:
-        EmailSenderInterface: An instance of EmailSender configured with the appropriate email settings.
-    """
-    return EmailSender(
-        hostname=settings.EMAIL_HOST,
-        port=settings.EMAIL_PORT,
-        email=settings.EMAIL_HOST_USER,
-        password=settings.EMAIL_HOST_PASSWORD,
-        use_tls=settings.EMAIL_USE_TLS,
-        template_dir=settings.PATH_TO_EMAIL_TEMPLATES_DIR,
-        activation_email_template_name=settings.ACTIVATION_EMAIL_TEMPLATE_NAME,
-        activation_complete_email_template_name=settings.ACTIVATION_COMPLETE_EMAIL_TEMPLATE_NAME,
-        password_email_template_name=settings.PASSWORD_RESET_TEMPLATE_NAME,
-        password_complete_email_template_name=settings.PASSWORD_RESET_COMPLETE_TEMPLATE_NAME
-    )
+        EmailSenderInterface: The shared EmailSender.
+    """
+    return services.email_sender
+
+
+def get_email_outbox(
+    services: ServiceContainer = Depends(get_services)
+) -> EmailOutboxDispatcher:
+    """
+    Retrieve the dispatcher that delivers the emails queued in the email outbox.
+
+    Args:
+        services (ServiceContainer): The worker's service container.
+
+    Returns:
+        EmailOutboxDispatcher: The shared dispatcher.
+    """
+    return services.email_outbox
 
 
 def get_s3_storage_client(
-    settings: BaseAppSettings = Depends(get_settings)
+    services: ServiceContainer = Depends(get_services)
 ) -> S3StorageInterface:
     """
-    Retrieve an instance of the S3StorageInterface configured with the application settings.
+    Retrieve the S3 storage client used for file uploads and URL generation.
 
-    This function instantiates an S3StorageClient using the provided settings, which include the S3 endpoint URL,
-    access credentials, and the bucket name. The returned client can be used to interact with an S3-compatible
-    storage service for file uploads and URL generation.
+    The client is configured with the S3 endpoint URL, access credentials, and the bucket name
+    from the settings.
 
     Args:
-        settings (BaseAppSettings, optional): The application settings,
-        provided via dependency injection from `get_settings`.
+        services (ServiceContainer): The worker's service container.
 
     Returns:
-        S3StorageInterface: An instance of S3StorageClient configured with the appropriate S3 storage settings.
+        S3StorageInterface: The shared S3StorageClient.
     """
-    return S3StorageClient(
-        endpoint_url=settings.S3_STORAGE_ENDPOINT,
-        access_key=settings.S3_STORAGE_ACCESS_KEY,
-        secret_key=settings.S3_STORAGE_SECRET_KEY,
-        bucket_name=settings.S3_BUCKET_NAME
-    )
+    return services.s3_storage
 
 
-async def get_user(
+def get_typeahead_index() -> TypeaheadIndex:
+    """
+    Retrieve the process-wide typeahead index.
+
+    The index is only used on databases without trigram support (SQLite/dev) and is kept
+    current by the movie write endpoints, so every request must share the same instance.
+
+    Returns:
+        TypeaheadIndex: The shared in-process typeahead index.
+    """
+    return typeahead_index
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Retrieve the process-wide response cache of the movie read endpoints.
+
+    The movie, comment, rating and reaction write endpoints invalidate it, so every
+    request must share the same instance.
+
+    Returns:
+        ResponseCache: The shared in-process response cache.
+    """
+    return response_cache
+
+
+def get_password_hasher() -> PasswordHasher:
+    """
+    Retrieve the process-wide password hasher.
+
+    Its thread pool and queue limit only bound the load if every request shares them.
+
+    Returns:
+        PasswordHasher: The shared password hasher.
+    """
+    return password_hasher
+
+
+def get_principal_cache() -> PrincipalCache:
+    """
+    Retrieve the process-wide cache of authenticated principals.
+
+    The account endpoints that change a user's group, activation or password invalidate it,
+    so every request must share the same instance.
+
+    Returns:
+        PrincipalCache: The shared in-process principal cache.
+    """
+    return principal_cache
+
+
+async def load_principal(claims: dict, db: AsyncSession, cache: PrincipalCache) -> Optional[Principal]:
+    """
+    Resolve the principal of decoded access token claims.
+
+    Tokens carrying `group` and `token_version` claims are trusted for their group: on a cache
+    miss only the user's active flag and current token version are read (a primary key lookup),
+    and a token whose version is older than the user's is rejected. Every change of group or
+    password bumps the version, so a trusted group claim is never out of date. Tokens without
+    these claims get the principal, group included, from the database.
+
+    Args:
+        claims (dict): The decoded access token payload.
+        db (AsyncSession): Asynchronous SQLAlchemy database session.
+        cache (PrincipalCache): The shared principal cache.
+
+    Returns:
+        Optional[Principal]: The principal, or None if the user does not exist.
+
+    Raises:
+        TokenRevokedError: If the token's version is not the user's current one.
+    """
+    user_id = claims.get("user_id")
+    group = claims.get("group")
+    token_version = claims.get("token_version")
+
+    principal = cache.get(user_id)
+    if principal is None:
+        generation = cache.generation
+        if group is not None and token_version is not None:
+            stmt = select(UserModel.is_active, UserModel.token_version).where(UserModel.id == user_id)
+            row = (await db.execute(stmt)).one_or_none()
+            if row is None:
+                return None
+            if row.token_version != token_version:
+                raise TokenRevokedError
+            principal = Principal(
+                id=user_id, is_active=row.is_active, group_name=UserGroupEnum(group), token_version=token_version
+            )
+        else:
+            stmt = (
+                select(UserModel.id, UserModel.is_active, UserGroupModel.name, UserModel.token_version)
+                .join(UserModel.group)
+                .where(UserModel.id == user_id)
+            )
+            row = (await db.execute(stmt)).one_or_none()
+            if row is None:
+                return None
+            principal = Principal(
+                id=row.id, is_active=row.is_active, group_name=row.name, token_version=row.token_version
+            )
+        cache.set(principal, generation)
+
+    if token_version is not None and token_version != principal.token_version:
+        raise TokenRevokedError
+    return principal
+
+
+async def get_principal(
     token: str = Depends(get_token),
     jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
     db: AsyncSession = Depends(get_db),
-):
+    cache: PrincipalCache = Depends(get_principal_cache),
+) -> Principal:
     """
-    Retrieve and validate the currently authenticated user.
+    Retrieve and validate the currently authenticated principal.
 
     This dependency:
     1. Decodes the provided JWT access token.
-    2. Extracts the `user_id` from the token payload.
-    3. Fetches the user from the database along with their group.
-    4. Ensures the user exists and is active.
+    2. Resolves its principal with `load_principal`, from the principal cache when possible.
+    3. Ensures the token is not revoked and the user exists and is active.
+
+    Use it instead of `get_user` when the endpoint only needs the user's id or group.
 
     Args:
         token (str): Raw access token extracted from the Authorization header.
         jwt_manager (JWTAuthManagerInterface): Service responsible for decoding and validating JWTs.
         db (AsyncSession): Asynchronous SQLAlchemy database session.
+        cache (PrincipalCache): The shared principal cache.
 
     Returns:
-        UserModel: The authenticated and active user.
+        Principal: The authenticated and active principal.
 
     Raises:
         HTTPException:
-            - 400 Bad Request: If the token is invalid or expired.
+            - 400 Bad Request: If the token is invalid, expired or revoked.
             - 404 Not Found: If the user does not exist.
             - 403 Forbidden: If the user account is inactive.
     """
     try:
         decoded_token = jwt_manager.decode_access_token(token)
-        user_id = decoded_token.get("user_id")
+        principal = await load_principal(decoded_token, db, cache)
     except BaseSecurityError as error:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(error),
         )
 
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found.",
+        )
+
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is inactive.",
+        )
+
+    return principal
+
+
+async def get_user(
+    principal: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_db),
+) -> UserModel:
+    """
+    Retrieve the currently authenticated user as a model instance.
+
+    Authentication is done by `get_principal`; this dependency then loads the user along
+    with their group, for endpoints that modify the user (e.g. change their password).
+
+    Args:
+        principal (Principal): The authenticated principal provided by `get_principal`.
+        db (AsyncSession): Asynchronous SQLAlchemy database session.
+
+    Returns:
+        UserModel: The authenticated and active user.
+
+    Raises:
+        HTTPException:
+            - 400 Bad Request: If the token is invalid or expired.
+            - 404 Not Found: If the user does not exist.
+            - 403 Forbidden: If the user account is inactive.
+    """
     user_stmt = (
         select(UserModel)
         .options(selectinload(UserModel.group))
-        .where(UserModel.id == user_id)
+        .where(UserModel.id == principal.id)
     )
     result_user = await db.execute(user_stmt)
     user = result_user.scalar_one_or_none()
@@ -149,19 +314,12 @@ async def get_user(
             detail="User not found.",
         )
 
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="User account is inactive.",
-        )
-
     return user
 
 
 async def user_is_staff(
-    db: AsyncSession = Depends(get_db),
-    user: UserModel = Depends(get_user),
-):
+    principal: Principal = Depends(get_principal),
+) -> Principal:
     """
     Ensure the authenticated user has staff-level permissions.
 
@@ -170,33 +328,27 @@ async def user_is_staff(
     elevated (but not full admin) privileges.
 
     Args:
-        db (AsyncSession): Asynchronous SQLAlchemy database session.
-        user (UserModel): Authenticated user provided by `get_user`.
+        principal (Principal): Authenticated principal provided by `get_principal`.
 
     Returns:
-        UserModel: The authenticated staff user.
+        Principal: The authenticated staff principal.
 
     Raises:
         HTTPException:
             - 403 Forbidden: If the user is not a moderator or admin.
     """
-    stmt = select(UserGroupModel.name).where(UserGroupModel.id == user.group_id)
-    res = await db.execute(stmt)
-    user_group = res.scalar_one()
-
-    if user_group not in (UserGroupEnum.MODERATOR, UserGroupEnum.ADMIN):
+    if not principal.is_staff:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to perform this action.",
         )
 
-    return user
+    return principal
 
 
 async def user_is_admin(
-    db: AsyncSession = Depends(get_db),
-    user: UserModel = Depends(get_user),
-):
+    principal: Principal = Depends(get_principal),
+) -> Principal:
     """
     Ensure the authenticated user has administrator permissions.
 
@@ -204,27 +356,22 @@ async def user_is_admin(
     to the ADMIN group.
 
     Args:
-        db (AsyncSession): Asynchronous SQLAlchemy database session.
-        user (UserModel): Authenticated user provided by `get_user`.
+        principal (Principal): Authenticated principal provided by `get_principal`.
 
     Returns:
-        UserModel: The authenticated admin user.
+        Principal: The authenticated admin principal.
 
     Raises:
         HTTPException:
             - 403 Forbidden: If the user is not an admin.
     """
-    stmt = select(UserGroupModel.name).where(UserGroupModel.id == user.group_id)
-    res = await db.execute(stmt)
-    user_group = res.scalar_one()
-
-    if user_group not in UserGroupEnum.ADMIN:
+    if not principal.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to perform this action.",
         )
 
-    return user
+    return principal
 
 
 async def get_movie(
@@ -259,3 +406,13 @@ async def get_movie(
         )
 
     return movie
+
+
+def get_count_cache() -> TTLCache[str, int]:
+    """
+    Retrieve the process-wide cache of filtered movie list totals.
+
+    Returns:
+        TTLCache: The shared in-process count cache, keyed by filter signature.
+    """
+    return count_cache
@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+
+from cinema.config.settings import BaseAppSettings
+from cinema.database import get_db_contextmanager
+from cinema.notifications.emails import EmailSender
+from cinema.notifications.interfaces import EmailSenderInterface
+from cinema.notifications.outbox import EmailOutboxDispatcher
+from cinema.security.interfaces import JWTAuthManagerInterface
+from cinema.security.token_manager import JWTAuthManager
+from cinema.storages.interfaces import S3StorageInterface
+from cinema.storages.s3 import S3StorageClient
+
+
+@dataclass(frozen=True)
+class ServiceContainer:
+    """
+    The shared services of one worker process, built once when the application starts
+    (see the lifespan in `cinema.main`) and handed out by the dependencies in
+    `cinema.config.dependencies`.
+
+    Building them per request meant a new Jinja environment and a new aioboto3 session on
+    every call; the services are safe to share because they keep no per-request state.
+    Some do hold per-worker connection pools (the SMTP pool of the email sender, the S3
+    client), which are opened by `open` and closed by `aclose`.
+    """
+    settings: BaseAppSettings
+    jwt_manager: JWTAuthManagerInterface
+    email_sender: EmailSenderInterface
+    email_outbox: EmailOutboxDispatcher
+    s3_storage: S3StorageInterface
+
+    @classmethod
+    def from_settings(cls, settings: BaseAppSettings) -> "ServiceContainer":
+        """
+        Build every service from the application settings.
+
+        Args:
+            settings (BaseAppSettings): The application settings.
+
+        Returns:
+            ServiceContainer: The configured services.
+        """
+        return cls(
+            settings=settings,
+            jwt_manager=JWTAuthManager(
+                secret_key_access=settings.SECRET_KEY_ACCESS,
+                secret_key_refresh=settings.SECRET_KEY_REFRESH,
+                algorithm=settings.JWT_SIGNING_ALGORITHM
+            ),
+            email_sender=EmailSender(
+                hostname=settings.EMAIL_HOST,
+                port=settings.EMAIL_PORT,
+                email=settings.EMAIL_HOST_USER,
+                password=settings.EMAIL_HOST_PASSWORD,
+                use_tls=settings.EMAIL_USE_TLS,
+                template_dir=settings.PATH_TO_EMAIL_TEMPLATES_DIR,
+                activation_email_template_name=settings.ACTIVATION_EMAIL_TEMPLATE_NAME,
+                activation_complete_email_template_name=settings.ACTIVATION_COMPLETE_EMAIL_TEMPLATE_NAME,
+                password_email_template_name=settings.PASSWORD_RESET_TEMPLATE_NAME,
+                password_complete_email_template_name=settings.PASSWORD_RESET_COMPLETE_TEMPLATE_NAME,
+                pool_max_size=settings.EMAIL_POOL_MAX_SIZE,
+                pool_idle_timeout=settings.EMAIL_POOL_IDLE_TIMEOUT,
+                template_auto_reload=settings.EMAIL_TEMPLATES_AUTO_RELOAD,
+            ),
+            email_outbox=EmailOutboxDispatcher(
+                session_factory=get_db_contextmanager,
+                concurrency=settings.EMAIL_POOL_MAX_SIZE,
+            ),
+            s3_storage=S3StorageClient(
+                endpoint_url=settings.S3_STORAGE_ENDPOINT,
+                access_key=settings.S3_STORAGE_ACCESS_KEY,
+                secret_key=settings.S3_STORAGE_SECRET_KEY,
+                bucket_name=settings.S3_BUCKET_NAME,
+                max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                multipart_threshold=settings.S3_MULTIPART_THRESHOLD,
+                multipart_chunk_size=settings.S3_MULTIPART_CHUNK_SIZE,
+            ),
+        )
+
+    async def open(self) -> None:
+        """
+        Open the connection pools of the services; called when the application starts.
+        """
+        await self.s3_storage.open()
+
+    async def aclose(self) -> None:
+        """
+        Release the connections held by the services; called when the application shuts down.
+        """
+        await self.email_sender.aclose()
+        await self.s3_storage.aclose()
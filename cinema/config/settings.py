@@ -1,5 +1,6 @@
 import os
 import secrets
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -19,18 +20,36 @@ class BaseAppSettings(BaseSettings):
 
     LOGIN_TIME_DAYS: int = 7
 
+    # bcrypt cost factor (log2 of the rounds, 4-31); each step doubles the hashing time.
+    # Changing it does not invalidate existing hashes: they are re-hashed on the next login.
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", 14))
+    # How often each worker logs its password hashing pool metrics; 0 disables the log.
+    PASSWORD_HASHER_METRICS_INTERVAL: float = float(os.getenv("PASSWORD_HASHER_METRICS_INTERVAL", 60))
+
     EMAIL_HOST: str = os.getenv("EMAIL_HOST", "host")
     EMAIL_PORT: int = int(os.getenv("EMAIL_PORT", 25))
     EMAIL_HOST_USER: str = os.getenv("EMAIL_HOST_USER", "testuser")
     EMAIL_HOST_PASSWORD: str = os.getenv("EMAIL_HOST_PASSWORD", "test_password")
     EMAIL_USE_TLS: bool = os.getenv("EMAIL_USE_TLS", "False").lower() == "true"
+    EMAIL_POOL_MAX_SIZE: int = int(os.getenv("EMAIL_POOL_MAX_SIZE", 4))
+    EMAIL_POOL_IDLE_TIMEOUT: float = float(os.getenv("EMAIL_POOL_IDLE_TIMEOUT", 60))
+    # Re-read edited email templates on every render; for development only.
+    EMAIL_TEMPLATES_AUTO_RELOAD: bool = os.getenv("EMAIL_TEMPLATES_AUTO_RELOAD", "False").lower() == "true"
+    # How often each worker drains the email outbox for retries; 0 disables the periodic drain.
+    EMAIL_OUTBOX_POLL_INTERVAL: float = float(os.getenv("EMAIL_OUTBOX_POLL_INTERVAL", 15))
     MAILHOG_API_PORT: int = os.getenv("MAILHOG_API_PORT", 8025)
 
+    # How often each worker logs its database connection pool metrics; 0 disables the log.
+    DB_POOL_METRICS_INTERVAL: float = float(os.getenv("DB_POOL_METRICS_INTERVAL", 60))
+
     S3_STORAGE_HOST: str = os.getenv("MINIO_HOST", "minio-cinema")
     S3_STORAGE_PORT: int = os.getenv("MINIO_PORT", 9000)
     S3_STORAGE_ACCESS_KEY: str = os.getenv("MINIO_ROOT_USER", "minioadmin")
     S3_STORAGE_SECRET_KEY: str = os.getenv("MINIO_ROOT_PASSWORD", "some_password")
     S3_BUCKET_NAME: str = os.getenv("MINIO_STORAGE", "cinema-storage")
+    S3_MAX_POOL_CONNECTIONS: int = int(os.getenv("S3_MAX_POOL_CONNECTIONS", 10))
+    S3_MULTIPART_THRESHOLD: int = int(os.getenv("S3_MULTIPART_THRESHOLD", 8 * 1024 * 1024))
+    S3_MULTIPART_CHUNK_SIZE: int = int(os.getenv("S3_MULTIPART_CHUNK_SIZE", 8 * 1024 * 1024))
 
     @property
     def S3_STORAGE_ENDPOINT(self) -> str:
@@ -43,6 +62,18 @@ class Settings(BaseAppSettings):
     POSTGRES_HOST: str = os.getenv("POSTGRES_HOST", "test_host")
     POSTGRES_DB_PORT: int = int(os.getenv("POSTGRES_DB_PORT", 5432))
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "test_db")
+    # Connections per worker process: POSTGRES_POOL_SIZE kept open plus up to POSTGRES_MAX_OVERFLOW
+    # more at peak. Multiplied by the gunicorn workers (10 in production), the total must stay
+    # below the server's max_connections (100 by default), or the PgBouncer pool size.
+    POSTGRES_POOL_SIZE: int = int(os.getenv("POSTGRES_POOL_SIZE", 5))
+    POSTGRES_MAX_OVERFLOW: int = int(os.getenv("POSTGRES_MAX_OVERFLOW", 3))
+    # Seconds a request waits for a free connection before failing.
+    POSTGRES_POOL_TIMEOUT: float = float(os.getenv("POSTGRES_POOL_TIMEOUT", 10))
+    # Seconds after which a connection is replaced when next checked out; -1 keeps connections forever.
+    POSTGRES_POOL_RECYCLE: int = int(os.getenv("POSTGRES_POOL_RECYCLE", 1800))
+    POSTGRES_POOL_PRE_PING: bool = os.getenv("POSTGRES_POOL_PRE_PING", "True").lower() == "true"
+    # Connect through PgBouncer in transaction pooling mode (disables prepared statement caching).
+    POSTGRES_PGBOUNCER: bool = os.getenv("POSTGRES_PGBOUNCER", "False").lower() == "true"
 
     SECRET_KEY_ACCESS: str = os.getenv("SECRET_KEY_ACCESS", secrets.token_hex(32))
     SECRET_KEY_REFRESH: str = os.getenv("SECRET_KEY_REFRESH", secrets.token_hex(32))
@@ -68,8 +99,13 @@ class TestingSettings(BaseAppSettings):
         object.__setattr__(self, "EMAIL_HOST_USER", "")
         object.__setattr__(self, "EMAIL_HOST_PASSWORD", "")
         object.__setattr__(self, "MAILHOG_API_PORT", int(os.getenv("MAILHOG_API_PORT", 8025)))
+        # Tests drain the outbox through the requests that fill it.
+        object.__setattr__(self, "EMAIL_OUTBOX_POLL_INTERVAL", 0)
+        object.__setattr__(self, "DB_POOL_METRICS_INTERVAL", 0)
+        object.__setattr__(self, "PASSWORD_HASHER_METRICS_INTERVAL", 0)
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> BaseAppSettings:
     """
     Retrieve the application settings based on the current environment.
@@ -78,6 +114,9 @@ def get_settings() -> BaseAppSettings:
     and returns a corresponding settings instance. If the environment is 'testing', it returns an instance
     of TestingSettings; otherwise, it returns an instance of Settings.
 
+    The environment is parsed once per process; later calls return the same instance
+    (`get_settings.cache_clear()` forces a re-read).
+
     Returns:
         BaseAppSettings: The settings instance appropriate for the current environment.
     """
@@ -8,7 +8,8 @@ from cinema.database.models.accounts import (
     ActivationTokenModel,
     PasswordResetTokenModel,
     RefreshTokenModel,
-    UserProfileModel
+    UserProfileModel,
+    EmailOutboxModel
 )
 from cinema.database.models.movies import (
     MovieModel,
@@ -28,10 +29,12 @@ environment = os.getenv("ENVIRONMENT", "developing")
 if environment == "testing":
     from cinema.database.session_sqlite import (
         get_sqlite_db_contextmanager as get_db_contextmanager,
-        get_sqlite_db as get_db
+        get_sqlite_db as get_db,
+        sqlite_engine as engine
     )
 else:
     from cinema.database.session_postgresql import (
         get_postgresql_db_contextmanager as get_db_contextmanager,
-        get_postgresql_db as get_db
+        get_postgresql_db as get_db,
+        postgresql_engine as engine
     )
@@ -0,0 +1,89 @@
+import asyncio
+from typing import List, Optional
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cinema.database import get_db_contextmanager
+from cinema.database.models.movies import (
+    CatalogueCounterModel,
+    MOVIES_COUNTER,
+    MovieModel,
+    MovieReactionModel,
+    RatingModel,
+    RatingTypeEnum,
+    ReactionTypeEnum,
+)
+
+# RatingModel.rating is stored as the enum name, so the numeric value has to be mapped back in SQL.
+RATING_VALUE = case(
+    *[(RatingModel.rating == member, int(member.value)) for member in RatingTypeEnum],
+    else_=0,
+)
+
+
+async def rebuild_movie_aggregates(session: AsyncSession, movie_ids: Optional[List[int]] = None) -> None:
+    """
+    Recompute the rating and reaction aggregates from the raw `ratings`/`movie_reactions` rows.
+
+    The aggregates are normally kept current by database triggers (see
+    `cinema.database.models.movies`); this recomputes them after the triggers were
+    bypassed (bulk loads, restored dumps) or the columns were edited by hand.
+    Runs as a single UPDATE with correlated subqueries; the caller commits.
+
+    :param session: The async database session.
+    :param movie_ids: IDs of the movies to rebuild, or None to rebuild every movie.
+    """
+    def reactions_of(reaction: ReactionTypeEnum):
+        return (
+            select(func.count())
+            .where(MovieReactionModel.movie_id == MovieModel.id, MovieReactionModel.reaction == reaction)
+            .scalar_subquery()
+        )
+
+    stmt = update(MovieModel).values(
+        ratings_count=select(func.count()).where(RatingModel.movie_id == MovieModel.id).scalar_subquery(),
+        ratings_sum=(
+            select(func.coalesce(func.sum(RATING_VALUE), 0))
+            .where(RatingModel.movie_id == MovieModel.id)
+            .scalar_subquery()
+        ),
+        likes=reactions_of(ReactionTypeEnum.LIKE),
+        dislikes=reactions_of(ReactionTypeEnum.DISLIKE),
+    )
+    if movie_ids is not None:
+        stmt = stmt.where(MovieModel.id.in_(movie_ids))
+
+    await session.execute(stmt.execution_options(synchronize_session=False))
+
+
+async def rebuild_catalogue_counters(session: AsyncSession) -> None:
+    """
+    Recompute the `catalogue_counters` rows (the movie count) from the tables they count.
+
+    Needed after the counter triggers were bypassed, e.g. by TRUNCATE or a restored dump;
+    the caller commits.
+
+    :param session: The async database session.
+    """
+    await session.execute(
+        update(CatalogueCounterModel)
+        .where(CatalogueCounterModel.name == MOVIES_COUNTER)
+        .values(value=select(func.count(MovieModel.id)).scalar_subquery())
+    )
+
+
+async def main() -> None:
+    """
+    Rebuild the aggregates of every movie and the catalogue counters, e.g. after a bulk
+    import or a manual data fix.
+    """
+    async with get_db_contextmanager() as db_session:
+        await rebuild_movie_aggregates(db_session)
+        await rebuild_catalogue_counters(db_session)
+        await db_session.commit()
+        print("Movie aggregates and catalogue counters rebuilt successfully.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,237 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterable, List, Mapping, Sequence, TypeVar
+
+import asyncpg
+from sqlalchemy import column, func, insert, select, table, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cinema.database.dialects import get_dialect_name, is_postgresql, upsert_insert
+
+CHUNK_SIZE = 1000
+
+# Per-connection SQLite settings applied by `bulk_load_pragmas`: a 64 MiB page cache, so a
+# large load does not spill dirty pages to disk before its commit. `bulk_load_pragmas` runs
+# inside the load's transaction, where SQLite refuses to change `temp_store`, `synchronous`
+# or `journal_mode`; the cache size can be changed there, and a load committed as one
+# transaction only syncs once anyway.
+SQLITE_BULK_LOAD_PRAGMAS = {"cache_size": -64 * 1024}
+
+# Temporary table `get_or_create_ids` copies the values to resolve into on PostgreSQL.
+_staging = table("bulk_staging_values", column("position"), column("value"))
+
+ModelT = TypeVar("ModelT")
+
+
+def _chunks(items: List[str]) -> Iterable[List[str]]:
+    for i in range(0, len(items), CHUNK_SIZE):
+        yield items[i: i + CHUNK_SIZE]
+
+
+async def get_or_create_bulk(
+        session: AsyncSession,
+        model: type[ModelT],
+        items: Iterable[str],
+        unique_field: str = "name",
+) -> Dict[str, ModelT]:
+    """
+    Resolve unique values (e.g. genre names) to model instances, creating the missing ones.
+
+    Per chunk of `CHUNK_SIZE` values this costs one `IN (...)` SELECT and, if anything is
+    missing, one multi-row `INSERT ... ON CONFLICT DO NOTHING RETURNING`. Rows inserted
+    concurrently by another transaction are not returned by the INSERT and are picked up
+    by a final SELECT, so the call never fails on the unique constraint.
+
+    :param session: The async database session.
+    :param model: The SQLAlchemy model class (e.g., GenreModel).
+    :param items: The values to resolve; duplicates are ignored.
+    :param unique_field: The unique column the values belong to (e.g., "name" or "code").
+    :return: A dict mapping each value to its model instance, in the order of `items`.
+    """
+    field = getattr(model, unique_field)
+    items = list(dict.fromkeys(items))
+    resolved: Dict[str, ModelT] = {}
+
+    for chunk in _chunks(items):
+        result = await session.execute(select(model).where(field.in_(chunk)))
+        for obj in result.scalars():
+            resolved[getattr(obj, unique_field)] = obj
+
+    missing = [item for item in items if item not in resolved]
+    for chunk in _chunks(missing):
+        stmt = (
+            upsert_insert(session, model)
+            .values([{unique_field: item} for item in chunk])
+            .on_conflict_do_nothing(index_elements=[unique_field])
+            .returning(model)
+        )
+        result = await session.execute(stmt)
+        for obj in result.scalars():
+            resolved[getattr(obj, unique_field)] = obj
+
+    raced = [item for item in missing if item not in resolved]
+    for chunk in _chunks(raced):
+        result = await session.execute(select(model).where(field.in_(chunk)))
+        for obj in result.scalars():
+            resolved[getattr(obj, unique_field)] = obj
+
+    return {item: resolved[item] for item in items if item in resolved}
+
+
+async def get_or_create_ids(
+        session: AsyncSession,
+        model,
+        items: Iterable[str],
+        unique_field: str = "name",
+) -> Dict[str, int]:
+    """
+    Resolve unique values to the IDs of their rows, creating the missing ones.
+
+    On PostgreSQL the values are copied into a temporary staging table, then inserted with
+    a single `INSERT ... SELECT ... ON CONFLICT DO NOTHING` and read back with a join, so
+    any number of values costs one COPY and three statements. Other databases fall back
+    to `get_or_create_bulk`.
+
+    :param session: The async database session.
+    :param model: The SQLAlchemy model class (e.g., GenreModel).
+    :param items: The values to resolve; duplicates are ignored.
+    :param unique_field: The unique column the values belong to (e.g., "name" or "code").
+    :return: A dict mapping each value to its ID, in the order of `items`.
+    """
+    items = list(dict.fromkeys(items))
+    if not items:
+        return {}
+    if not is_postgresql(session):
+        resolved = await get_or_create_bulk(session, model, items, unique_field)
+        return {item: obj.id for item, obj in resolved.items()}
+
+    await session.execute(text(
+        f"CREATE TEMPORARY TABLE IF NOT EXISTS {_staging.name} "
+        "(position integer NOT NULL, value text NOT NULL) ON COMMIT DROP"
+    ))
+    await session.execute(text(f"TRUNCATE {_staging.name}"))
+    await copy_rows(session, _staging, ["position", "value"], enumerate(items))
+
+    field = getattr(model, unique_field)
+    await session.execute(
+        postgresql_insert(model)
+        .from_select(
+            [unique_field],
+            select(_staging.c.value).group_by(_staging.c.value).order_by(func.min(_staging.c.position))
+        )
+        .on_conflict_do_nothing(index_elements=[unique_field])
+    )
+    result = await session.execute(select(field, model.id).join(_staging, field == _staging.c.value))
+    resolved = dict(result.all())
+    return {item: resolved[item] for item in items}
+
+
+async def _driver_connection(session: AsyncSession) -> asyncpg.Connection:
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    return raw_connection.driver_connection
+
+
+async def copy_rows(
+        session: AsyncSession,
+        target,
+        columns: Sequence[str],
+        records: Iterable[Sequence],
+) -> None:
+    """
+    Insert rows in bulk, within the session's transaction.
+
+    On PostgreSQL the rows are streamed with asyncpg's binary COPY (`copy_records_to_table`);
+    the session must already have executed a statement, so that the transaction is open on
+    the driver connection. Other databases get a single executemany `INSERT`. Unique and
+    foreign key violations are raised as `IntegrityError` on both paths.
+
+    :param session: The async database session.
+    :param target: The model or table to insert into.
+    :param columns: The columns to fill.
+    :param records: Row tuples, in the order of `columns`.
+    """
+    target_table = getattr(target, "__table__", target)
+    records = list(records)
+    if not records:
+        return
+
+    if not is_postgresql(session):
+        await session.execute(insert(target_table), [dict(zip(columns, record)) for record in records])
+        return
+
+    driver_connection = await _driver_connection(session)
+    try:
+        await driver_connection.copy_records_to_table(
+            target_table.name,
+            records=records,
+            columns=list(columns),
+            schema_name=target_table.schema,
+        )
+    except asyncpg.exceptions.IntegrityConstraintViolationError as e:
+        raise IntegrityError(f"COPY {target_table.name}", None, e) from e
+
+
+async def copy_new_rows(
+        session: AsyncSession,
+        model,
+        columns: Sequence[str],
+        records: Iterable[Sequence],
+) -> List[int]:
+    """
+    Insert new rows with `copy_rows` and return their IDs.
+
+    COPY cannot return the generated keys, so on PostgreSQL they are drawn from the `id`
+    sequence up front and copied along with the rows. Other databases use an executemany
+    `INSERT ... RETURNING`.
+
+    :param session: The async database session.
+    :param model: The SQLAlchemy model class, with an `id` primary key.
+    :param columns: The columns to fill, without `id`.
+    :param records: Row tuples, in the order of `columns`.
+    :return: The IDs of the new rows, in the order of `records`.
+    """
+    records = list(records)
+    if not records:
+        return []
+
+    if not is_postgresql(session):
+        result = await session.execute(
+            insert(model).returning(model.id, sort_by_parameter_order=True),
+            [dict(zip(columns, record)) for record in records]
+        )
+        return list(result.scalars())
+
+    result = await session.execute(
+        select(func.nextval(func.pg_get_serial_sequence(model.__tablename__, "id")))
+        .select_from(func.generate_series(1, len(records)))
+    )
+    ids = sorted(result.scalars())
+    await copy_rows(session, model, ["id", *columns], [(id_, *record) for id_, record in zip(ids, records)])
+    return ids
+
+
+async def _set_pragmas(session: AsyncSession, pragmas: Mapping[str, object]) -> None:
+    for name, value in pragmas.items():
+        await session.execute(text(f"PRAGMA {name} = {value}"))
+
+
+@asynccontextmanager
+async def bulk_load_pragmas(session: AsyncSession) -> AsyncIterator[None]:
+    """
+    Apply `SQLITE_BULK_LOAD_PRAGMAS` to the session's SQLite connection for the duration of a
+    bulk load, restoring the previous values afterwards. Does nothing on other databases.
+
+    :param session: The async database session.
+    """
+    if get_dialect_name(session) != "sqlite":
+        yield
+        return
+
+    previous = {name: await session.scalar(text(f"PRAGMA {name}")) for name in SQLITE_BULK_LOAD_PRAGMAS}
+    await _set_pragmas(session, SQLITE_BULK_LOAD_PRAGMAS)
+    try:
+        yield
+    finally:
+        await _set_pragmas(session, previous)
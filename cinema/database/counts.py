@@ -0,0 +1,57 @@
+import json
+from typing import Optional
+
+from sqlalchemy import ClauseElement, Executable, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+
+from cinema.database.dialects import is_postgresql
+from cinema.database.models.movies import CatalogueCounterModel
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    """
+    `EXPLAIN (FORMAT JSON) <statement>`; only compiled for PostgreSQL.
+    """
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(_ExplainJSON, "postgresql")
+def _compile_explain_json(element: _ExplainJSON, compiler, **kwargs) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kwargs)
+
+
+async def read_counter(session: AsyncSession, name: str) -> int:
+    """
+    Read a trigger-maintained row count from `catalogue_counters`.
+
+    :param session: The async database session.
+    :param name: The counter name (e.g. `MOVIES_COUNTER`).
+    :return: The exact count (0 if the counter row is missing).
+    """
+    value = await session.scalar(select(CatalogueCounterModel.value).where(CatalogueCounterModel.name == name))
+    return value or 0
+
+
+async def estimate_row_count(session: AsyncSession, stmt: Select) -> Optional[int]:
+    """
+    Estimate the number of rows `stmt` returns from the PostgreSQL planner statistics,
+    without executing it.
+
+    The estimate is only as good as the latest ANALYZE and can be far off for selective
+    filters; it is meant for pagination UIs that tolerate approximate totals.
+
+    :param session: The async database session.
+    :param stmt: The SELECT to estimate.
+    :return: The estimated row count, or None on databases without a usable planner estimate.
+    """
+    if not is_postgresql(session):
+        return None
+
+    plan = (await session.execute(_ExplainJSON(stmt))).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
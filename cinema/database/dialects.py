@@ -0,0 +1,36 @@
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def get_dialect_name(session: AsyncSession) -> str:
+    """
+    Return the name of the SQL dialect the session is bound to (e.g. "postgresql" or "sqlite").
+
+    :param session: The async database session.
+    :return: The dialect name.
+    """
+    return session.bind.dialect.name
+
+
+def is_postgresql(session: AsyncSession) -> bool:
+    """
+    Check whether the session is bound to a PostgreSQL database.
+
+    :param session: The async database session.
+    :return: True for PostgreSQL, False otherwise.
+    """
+    return get_dialect_name(session) == "postgresql"
+
+
+def upsert_insert(session: AsyncSession, table):
+    """
+    Build a dialect-specific INSERT supporting `on_conflict_do_nothing`/`on_conflict_do_update`.
+
+    :param session: The async database session.
+    :param table: The model or table to insert into.
+    :return: A PostgreSQL or SQLite `Insert` construct.
+    """
+    if is_postgresql(session):
+        return postgresql_insert(table)
+    return sqlite_insert(table)
@@ -0,0 +1,177 @@
+from typing import Dict, List, Tuple
+
+from sqlalchemy import or_, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cinema.cache import ResponseCache
+from cinema.database.bulk import copy_new_rows, copy_rows, get_or_create_ids
+from cinema.database.models.movies import (
+    ActorModel,
+    ActorsMoviesModel,
+    CountryModel,
+    DirectorModel,
+    DirectorsMoviesModel,
+    GenreModel,
+    LanguageModel,
+    MovieModel,
+    MoviesGenresModel,
+    MoviesLanguagesModel,
+)
+from cinema.database.search import refresh_search_documents
+from cinema.database.typeahead import TypeaheadIndex
+from cinema.schemas.movies import MovieBulkResultSchema, MovieCreateSchema
+
+# Number of movies inserted (and committed) per transaction by the bulk endpoint.
+BULK_CHUNK_SIZE = 500
+
+# Many-to-many relations of a movie: (model, association table, association column).
+MOVIE_RELATIONS = {
+    "genres": (GenreModel, MoviesGenresModel, "genre_id"),
+    "actors": (ActorModel, ActorsMoviesModel, "actor_id"),
+    "directors": (DirectorModel, DirectorsMoviesModel, "director_id"),
+    "languages": (LanguageModel, MoviesLanguagesModel, "language_id"),
+}
+
+TYPEAHEAD_RELATIONS = ("genres", "actors", "directors")
+
+
+class MovieBulkIngestor:
+    """
+    Insert validated movies chunk by chunk, the way `CSVDatabaseSeeder` seeds the CSV.
+
+    Relation names are resolved once per batch: the name -> ID maps are shared across
+    chunks, so a name only costs a lookup the first time it is seen. Every chunk is
+    inserted with one COPY (PostgreSQL) or executemany INSERT (SQLite) per table and
+    committed on its own, so an arbitrarily long batch never holds more than one chunk
+    in memory or in a transaction.
+    """
+
+    def __init__(self, db_session: AsyncSession, typeahead: TypeaheadIndex, cache: ResponseCache) -> None:
+        self._db_session = db_session
+        self._typeahead = typeahead
+        self._cache = cache
+        self._country_map: Dict[str, int] = {}
+        self._relation_maps: Dict[str, Dict[str, int]] = {relation: {} for relation in MOVIE_RELATIONS}
+
+    async def ingest(self, items: List[Tuple[int, MovieCreateSchema]]) -> List[MovieBulkResultSchema]:
+        """
+        Insert one chunk of validated movies and commit it.
+
+        Movies whose `(name, year)` or `uuid` already exists (in the database or earlier in
+        the chunk) are reported as duplicates. If a concurrent writer inserts one of the
+        movies first, the chunk is rolled back and retried once against the new state.
+
+        :param items: `(index, movie)` pairs; the index is only echoed back in the results.
+        :return: One result per item, ordered by index.
+        :raises SQLAlchemyError: If the retry fails as well, or the chunk fails for another
+                                 reason; call `rollback` before ingesting the next chunk.
+        """
+        try:
+            return await self._ingest(items)
+        except IntegrityError:
+            await self.rollback()
+            return await self._ingest(items)
+
+    async def rollback(self) -> None:
+        """
+        Roll back the chunk in progress.
+        """
+        await self._db_session.rollback()
+        # IDs created by the rolled back transaction are gone.
+        self._country_map.clear()
+        for relation_map in self._relation_maps.values():
+            relation_map.clear()
+
+    async def _ingest(self, items: List[Tuple[int, MovieCreateSchema]]) -> List[MovieBulkResultSchema]:
+        new_items, duplicates = await self._split_duplicates(items)
+        results = [MovieBulkResultSchema(index=index, status="duplicate") for index in duplicates]
+        if not new_items:
+            return results
+
+        await self._resolve_relations([movie for _, movie in new_items])
+
+        movie_rows = [
+            {
+                **movie.model_dump(exclude={"country", *MOVIE_RELATIONS}),
+                "country_id": self._country_map[movie.country],
+            }
+            for _, movie in new_items
+        ]
+        movie_ids = await copy_new_rows(
+            self._db_session,
+            MovieModel,
+            list(movie_rows[0]),
+            [tuple(row.values()) for row in movie_rows],
+        )
+
+        for relation, (_, association, column) in MOVIE_RELATIONS.items():
+            relation_map = self._relation_maps[relation]
+            rows = [
+                (movie_id, relation_map[name])
+                for movie_id, (_, movie) in zip(movie_ids, new_items)
+                for name in dict.fromkeys(getattr(movie, relation))
+            ]
+            await copy_rows(self._db_session, association, ["movie_id", column], rows)
+
+        await refresh_search_documents(self._db_session, movie_ids)
+        await self._db_session.commit()
+        self._cache.invalidate_movies(movie_ids)
+
+        self._typeahead.add("movies", [(movie_id, movie.name) for movie_id, (_, movie) in zip(movie_ids, new_items)])
+        for relation in TYPEAHEAD_RELATIONS:
+            relation_map = self._relation_maps[relation]
+            names = dict.fromkeys(name for _, movie in new_items for name in getattr(movie, relation))
+            self._typeahead.add(relation, [(relation_map[name], name) for name in names])
+
+        results.extend(
+            MovieBulkResultSchema(index=index, status="created", id=movie_id)
+            for movie_id, (index, _) in zip(movie_ids, new_items)
+        )
+        return sorted(results, key=lambda item: item.index)
+
+    async def _split_duplicates(
+            self,
+            items: List[Tuple[int, MovieCreateSchema]]
+    ) -> Tuple[List[Tuple[int, MovieCreateSchema]], List[int]]:
+        """
+        Separate movies that already exist from the new ones with a single lookup.
+        """
+        result = await self._db_session.execute(
+            select(MovieModel.name, MovieModel.year, MovieModel.uuid).where(
+                or_(
+                    tuple_(MovieModel.name, MovieModel.year).in_([(movie.name, movie.year) for _, movie in items]),
+                    MovieModel.uuid.in_([movie.uuid for _, movie in items]),
+                )
+            )
+        )
+        seen_keys = set()
+        seen_uuids = set()
+        for name, year, uuid in result:
+            seen_keys.add((name, year))
+            seen_uuids.add(uuid)
+
+        new_items = []
+        duplicates = []
+        for index, movie in items:
+            if (movie.name, movie.year) in seen_keys or movie.uuid in seen_uuids:
+                duplicates.append(index)
+                continue
+            seen_keys.add((movie.name, movie.year))
+            seen_uuids.add(movie.uuid)
+            new_items.append((index, movie))
+        return new_items, duplicates
+
+    async def _resolve_relations(self, movies: List[MovieCreateSchema]) -> None:
+        """
+        Look up or create the countries and relation names of the chunk that are not mapped yet.
+        """
+        countries = [movie.country for movie in movies if movie.country not in self._country_map]
+        if countries:
+            self._country_map.update(await get_or_create_ids(self._db_session, CountryModel, countries, "code"))
+
+        for relation, (model, _, _) in MOVIE_RELATIONS.items():
+            relation_map = self._relation_maps[relation]
+            names = [name for movie in movies for name in getattr(movie, relation) if name not in relation_map]
+            if names:
+                relation_map.update(await get_or_create_ids(self._db_session, model, names))
@@ -14,6 +14,7 @@ from sqlalchemy import (
     Date,
     UniqueConstraint
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -23,7 +24,7 @@ from sqlalchemy.orm import (
 
 from cinema.database.models.base import Base
 from cinema.database.validators import accounts as validators
-from cinema.security.passwords import hash_password, verify_password
+from cinema.security.passwords import PasswordHasher, hash_password, verify_password
 from cinema.security.utils import generate_secure_token
 
 
@@ -38,6 +39,13 @@ class GenderEnum(str, enum.Enum):
     WOMAN = "woman"
 
 
+class EmailKindEnum(str, enum.Enum):
+    ACTIVATION = "activation"
+    ACTIVATION_COMPLETE = "activation_complete"
+    PASSWORD_RESET = "password_reset"
+    PASSWORD_RESET_COMPLETE = "password_reset_complete"
+
+
 class UserGroupModel(Base):
     __tablename__ = "user_groups"
 
@@ -57,6 +65,8 @@ class UserModel(Base):
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     _hashed_password: Mapped[str] = mapped_column("hashed_password", String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Carried by access tokens; bumping it revokes every access token issued before.
+    token_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -128,6 +138,13 @@ class UserModel(Base):
         user.password = raw_password
         return user
 
+    @hybrid_property
+    def hashed_password(self) -> str:
+        """
+        The stored hash, read-only; use the `password` setter or `set_password_async` to change it.
+        """
+        return self._hashed_password
+
     @property
     def password(self) -> None:
         raise AttributeError("Password is write-only. Use the setter to set the password.")
@@ -146,6 +163,25 @@ class UserModel(Base):
         """
         return verify_password(raw_password, self._hashed_password)
 
+    async def set_password_async(self, raw_password: str, hasher: PasswordHasher) -> None:
+        """
+        Like the `password` setter, but hashes in the hasher's thread pool instead of blocking the event loop.
+        """
+        validators.validate_password_strength(raw_password)
+        self._hashed_password = await hasher.hash(raw_password)
+
+    async def verify_password_async(self, raw_password: str, hasher: PasswordHasher) -> bool:
+        """
+        Like `verify_password`, but verifies in the hasher's thread pool instead of blocking the event loop.
+        """
+        return await hasher.verify(raw_password, self._hashed_password)
+
+    def revoke_access_tokens(self) -> None:
+        """
+        Invalidate every access token issued so far; they carry the previous `token_version`.
+        """
+        self.token_version += 1
+
     @validates("email")
     def validate_email(self, key, value):
         return validators.validate_email(value.lower())
@@ -243,3 +279,35 @@ class RefreshTokenModel(TokenBaseModel):
 
     def __repr__(self):
         return f"<RefreshTokenModel(id={self.id}, token={self.token}, expires_at={self.expires_at})>"
+
+
+class EmailOutboxModel(Base):
+    """
+    An account email waiting to be sent, written in the same transaction as the change it
+    announces and delivered afterwards by `cinema.notifications.outbox.EmailOutboxDispatcher`.
+    The row is deleted once the email is sent.
+    """
+    __tablename__ = "email_outbox"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[EmailKindEnum] = mapped_column(Enum(EmailKindEnum), nullable=False)
+    recipient: Mapped[str] = mapped_column(String(255), nullable=False)
+    link: Mapped[str] = mapped_column(String(1024), nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    # When the email is due: creation, the next retry, or the end of a dispatcher's lease.
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        index=True
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self):
+        return (
+            f"<EmailOutboxModel(id={self.id}, kind={self.kind}, recipient={self.recipient}, "
+            f"attempts={self.attempts})>"
+        )
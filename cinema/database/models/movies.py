@@ -10,16 +10,33 @@ from sqlalchemy import (
     Table,
     Column,
     Integer,
+    BigInteger,
     Enum,
     DateTime,
     func,
     Numeric,
+    Index,
+    DDL,
+    event,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from cinema.database.models.base import Base
 
 
+def trigram_index(name: str, column: str) -> Index:
+    """
+    GIN trigram index for substring/typeahead lookups on a name column (PostgreSQL only).
+    """
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
+
+
 MoviesGenresModel = Table(
     "movies_genres",
     Base.metadata,
@@ -105,6 +122,10 @@ class GenreModel(Base):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
 
+    __table_args__ = (
+        trigram_index("ix_genres_name_trgm", "name"),
+    )
+
     movies: Mapped[list["MovieModel"]] = relationship(
         "MovieModel",
         secondary=MoviesGenresModel,
@@ -121,6 +142,10 @@ class ActorModel(Base):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
 
+    __table_args__ = (
+        trigram_index("ix_actors_name_trgm", "name"),
+    )
+
     movies: Mapped[list["MovieModel"]] = relationship(
         "MovieModel",
         secondary=ActorsMoviesModel,
@@ -137,6 +162,10 @@ class DirectorModel(Base):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
 
+    __table_args__ = (
+        trigram_index("ix_directors_name_trgm", "name"),
+    )
+
     movies: Mapped[list["MovieModel"]] = relationship(
         "MovieModel",
         secondary=DirectorsMoviesModel,
@@ -309,13 +338,193 @@ class MovieModel(Base):
         back_populates="movie"
     )
 
+    # Denormalised rating/reaction aggregates, maintained by the triggers at the end of this module.
+    ratings_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    ratings_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    likes: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    dislikes: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    # Full-text search document (name, actors, directors, description). Populated by
+    # cinema.database.search on PostgreSQL; SQLite keeps the document in the
+    # `movies_search` FTS5 table instead and leaves this column empty.
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR().with_variant(Text(), "sqlite"),
+        nullable=True,
+        deferred=True
+    )
+
+    # Hash of the seed CSV row the movie was last written from (see
+    # CSVDatabaseSeeder.sync); NULL for movies created through the API.
+    content_hash: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True, deferred=True)
+
     __table_args__ = (
         UniqueConstraint("name", "year", "duration", name="unique_movie_constraint"),
+        Index("ix_movies_search_vector", "search_vector", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        trigram_index("ix_movies_name_trgm", "name"),
     )
 
+    @property
+    def average_rating(self) -> Optional[Decimal]:
+        if not self.ratings_count:
+            return None
+        return round(Decimal(self.ratings_sum) / self.ratings_count, 2)
+
     @classmethod
     def default_order_by(cls):
         return [cls.id.desc()]
 
     def __repr__(self):
         return f"<Movie(name='{self.name}', year='{self.year}', imdb={self.imdb})>"
+
+
+class CatalogueCounterModel(Base):
+    """
+    Exact row counts of catalogue tables, maintained by the triggers at the end of this module,
+    so the unfiltered movie list total is a primary key lookup instead of a `count(*)` scan.
+    """
+    __tablename__ = "catalogue_counters"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    def __repr__(self):
+        return f"<CatalogueCounter(name='{self.name}', value={self.value})>"
+
+
+MOVIES_COUNTER = "movies"
+
+
+event.listen(
+    MovieModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS movies_search "
+        "USING fts5(name, description, actors, directors, tokenize='unicode61 remove_diacritics 2')"
+    ).execute_if(dialect="sqlite")
+)
+event.listen(
+    MovieModel.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS movies_search").execute_if(dialect="sqlite")
+)
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+
+# Triggers keeping MovieModel.ratings_count/ratings_sum/likes/dislikes in step with the
+# `ratings` and `movie_reactions` rows, so every write path (including single-statement
+# upserts that cannot report the previous value) updates them in the same transaction.
+# cinema.database.aggregates.rebuild_movie_aggregates recomputes them from scratch.
+def _rating_value_sql(row: str) -> str:
+    whens = " ".join(f"WHEN '{member.name}' THEN {int(member.value)}" for member in RatingTypeEnum)
+    return f"(CASE {row}.rating {whens} ELSE 0 END)"
+
+
+def _reaction_deltas_sql(row: str, sign: str) -> str:
+    return (
+        f"likes = likes {sign} (CASE WHEN {row}.reaction = '{ReactionTypeEnum.LIKE.name}' THEN 1 ELSE 0 END), "
+        f"dislikes = dislikes {sign} (CASE WHEN {row}.reaction = '{ReactionTypeEnum.DISLIKE.name}' THEN 1 ELSE 0 END)"
+    )
+
+
+def _rating_deltas_sql(row: str, sign: str) -> str:
+    return f"ratings_count = ratings_count {sign} 1, ratings_sum = ratings_sum {sign} {_rating_value_sql(row)}"
+
+
+AGGREGATE_TRIGGERS = {
+    "ratings": _rating_deltas_sql,
+    "movie_reactions": _reaction_deltas_sql,
+}
+
+
+def _postgresql_aggregate_trigger_ddl(table_name: str, deltas) -> list[str]:
+    return [
+        f"""
+        CREATE OR REPLACE FUNCTION {table_name}_aggregates() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE movies SET {deltas("OLD", "-")} WHERE id = OLD.movie_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE movies SET {deltas("NEW", "+")} WHERE id = NEW.movie_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+        f"""
+        CREATE TRIGGER {table_name}_aggregates
+        AFTER INSERT OR UPDATE OR DELETE ON {table_name}
+        FOR EACH ROW EXECUTE FUNCTION {table_name}_aggregates()
+        """,
+    ]
+
+
+def _sqlite_aggregate_trigger_ddl(table_name: str, deltas) -> list[str]:
+    old = f"UPDATE movies SET {deltas('OLD', '-')} WHERE id = OLD.movie_id;"
+    new = f"UPDATE movies SET {deltas('NEW', '+')} WHERE id = NEW.movie_id;"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {table_name}_aggregates_insert AFTER INSERT ON {table_name} BEGIN {new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table_name}_aggregates_update AFTER UPDATE ON {table_name} "
+        f"BEGIN {old} {new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table_name}_aggregates_delete AFTER DELETE ON {table_name} BEGIN {old} END",
+    ]
+
+
+for _table, _deltas in AGGREGATE_TRIGGERS.items():
+    for _statement in _postgresql_aggregate_trigger_ddl(_table, _deltas):
+        event.listen(Base.metadata.tables[_table], "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+    for _statement in _sqlite_aggregate_trigger_ddl(_table, _deltas):
+        event.listen(Base.metadata.tables[_table], "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+
+
+# Trigger keeping the `movies` row of CatalogueCounterModel equal to the number of movies.
+# PostgreSQL counts each statement's transition table once, so bulk inserts touch the
+# counter row once per statement rather than once per movie.
+# cinema.database.aggregates.rebuild_catalogue_counters recomputes it from scratch.
+MOVIES_COUNTER_POSTGRESQL_DDL = [
+    f"""
+    CREATE OR REPLACE FUNCTION movies_counter() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE catalogue_counters SET value = value + (SELECT count(*) FROM inserted_movies)
+            WHERE name = '{MOVIES_COUNTER}';
+        ELSE
+            UPDATE catalogue_counters SET value = value - (SELECT count(*) FROM deleted_movies)
+            WHERE name = '{MOVIES_COUNTER}';
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER movies_counter_insert AFTER INSERT ON movies
+    REFERENCING NEW TABLE AS inserted_movies
+    FOR EACH STATEMENT EXECUTE FUNCTION movies_counter()
+    """,
+    """
+    CREATE TRIGGER movies_counter_delete AFTER DELETE ON movies
+    REFERENCING OLD TABLE AS deleted_movies
+    FOR EACH STATEMENT EXECUTE FUNCTION movies_counter()
+    """,
+]
+
+MOVIES_COUNTER_SQLITE_DDL = [
+    "CREATE TRIGGER IF NOT EXISTS movies_counter_insert AFTER INSERT ON movies "
+    f"BEGIN UPDATE catalogue_counters SET value = value + 1 WHERE name = '{MOVIES_COUNTER}'; END",
+    "CREATE TRIGGER IF NOT EXISTS movies_counter_delete AFTER DELETE ON movies "
+    f"BEGIN UPDATE catalogue_counters SET value = value - 1 WHERE name = '{MOVIES_COUNTER}'; END",
+]
+
+event.listen(
+    CatalogueCounterModel.__table__,
+    "after_create",
+    DDL(f"INSERT INTO catalogue_counters (name, value) VALUES ('{MOVIES_COUNTER}', 0)")
+)
+for _statement in MOVIES_COUNTER_POSTGRESQL_DDL:
+    event.listen(MovieModel.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in MOVIES_COUNTER_SQLITE_DDL:
+    event.listen(MovieModel.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
@@ -0,0 +1,92 @@
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+@dataclass(frozen=True)
+class PoolMetrics:
+    """
+    Snapshot of an `InstrumentedAsyncQueuePool`; checkout times are in seconds, the total cumulative.
+    """
+    size: int
+    in_use: int
+    idle: int
+    overflow: int
+    checkouts: int
+    waits: int
+    timeouts: int
+    checkout_seconds: float
+    max_checkout_seconds: float
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    An `AsyncAdaptedQueuePool` that counts and times connection checkouts.
+
+    A checkout waits when every pooled and overflow connection is in use; waits, and the
+    checkouts that gave up after `pool_timeout`, are counted apart, so a pool sized too
+    small for its worker shows up before requests start failing.
+    """
+
+    def __init__(self, creator, pool_size: int = 5, max_overflow: int = 10, **kwargs) -> None:
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kwargs)
+        # A negative max_overflow means no limit: checkouts never wait.
+        self._metrics_capacity: Optional[int] = pool_size + max_overflow if max_overflow >= 0 else None
+        self._metrics_lock = threading.Lock()
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._checkout_time = 0.0
+        self._max_checkout_time = 0.0
+
+    def connect(self):
+        waits = (
+            self._metrics_capacity is not None
+            and self.checkedin() == 0
+            and self.checkedout() >= self._metrics_capacity
+        )
+        started_at = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started_at
+            with self._metrics_lock:
+                self._checkouts += 1
+                self._waits += waits
+                self._timeouts += timed_out
+                self._checkout_time += elapsed
+                self._max_checkout_time = max(self._max_checkout_time, elapsed)
+
+    def metrics(self) -> PoolMetrics:
+        in_use = self.checkedout()
+        with self._metrics_lock:
+            return PoolMetrics(
+                size=self.size(),
+                in_use=in_use,
+                idle=self.checkedin(),
+                overflow=max(in_use - self.size(), 0),
+                checkouts=self._checkouts,
+                waits=self._waits,
+                timeouts=self._timeouts,
+                checkout_seconds=self._checkout_time,
+                max_checkout_seconds=self._max_checkout_time,
+            )
+
+
+async def log_pool_metrics(pool: InstrumentedAsyncQueuePool, interval: float) -> None:
+    """
+    Log a `PoolMetrics` snapshot of the pool every `interval` seconds until cancelled.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        logging.info(f"Database connection pool: {pool.metrics()}")
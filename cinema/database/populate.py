@@ -1,45 +1,114 @@
+import argparse
 import asyncio
-import math
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import List, Dict, Tuple
+from itertools import compress
+from typing import Dict, Iterator, List, Sequence, Set, Tuple
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import insert, select, func
+from sqlalchemy import bindparam, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from tqdm import tqdm
 
 from cinema.config.settings import get_settings
 from cinema.database.models.movies import (
+    CommentModel,
     CountryModel,
-    GenreModel,
-    ActorModel,
-    MoviesGenresModel,
-    ActorsMoviesModel,
-    LanguageModel,
-    MoviesLanguagesModel,
-    MovieModel, DirectorsMoviesModel, DirectorModel
+    FavouritesMoviesModel,
+    MovieModel,
+    MovieReactionModel,
+    RatingModel,
 )
 from cinema.database.models.accounts import UserGroupModel, UserGroupEnum
+from cinema.database.bulk import bulk_load_pragmas, copy_new_rows, copy_rows, get_or_create_ids
+from cinema.database.ingest import MOVIE_RELATIONS
+from cinema.database.search import delete_search_documents, refresh_search_documents
 from cinema.database import get_db_contextmanager
 
+# Number of CSV rows read, transformed and inserted at a time; bounds the seeder's memory.
+SEED_CHUNK_SIZE = 10_000
+
+# CSV columns holding a country code or comma-separated names, filled with "Unknown" when empty.
+NAME_COLUMNS = ["actors", "genres", "country", "languages", "directors"]
+
+# Pattern removed from the names of every relation before they are split: all whitespace
+# for people and languages, non-breaking spaces for genres (whose names contain spaces).
+NAME_CLEANUP = {"actors": r"\s+", "directors": r"\s+", "languages": r"\s+", "genres": "\u00A0"}
+
+# CSV columns copied into `movies`. The decimal ones are read as text and converted to
+# Decimal, so their values are not rounded through floats.
+MOVIE_COLUMNS = [
+    "uuid", "name", "year", "duration", "imdb", "imdb_votes", "description",
+    "budget", "revenue", "certification", "price",
+]
+DECIMAL_COLUMNS = ["imdb", "budget", "revenue", "price"]
+
+# CSV columns hashed into `movies.content_hash`, so `sync` can tell which rows changed.
+CONTENT_COLUMNS = MOVIE_COLUMNS + NAME_COLUMNS
+
+# Stored hash of movies that have none yet (created through the API, or seeded before
+# content hashes existed); it never matches a CSV row, so `sync` rewrites them once.
+UNSYNCED_HASH = 0
+
+# Number of movie IDs per `IN (...)` lookup or delete.
 CHUNK_SIZE = 1000
 
+# User content referencing movies without ON DELETE CASCADE; `sync` keeps movies that have any.
+USER_CONTENT_MODELS = (CommentModel, RatingModel, MovieReactionModel)
+
+# Stages timed by the seeder, in `CSVDatabaseSeeder.stage_seconds`.
+SEED_STAGES = ("read", "reference data", "movies", "associations", "search")
+
+
+@dataclass
+class SyncSummary:
+    """
+    Movies inserted, updated, deleted and left unchanged by `CSVDatabaseSeeder.sync`;
+    `kept` counts the movies missing from the CSV that were not deleted because users
+    commented on, rated or reacted to them.
+    """
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    kept: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.inserted} inserted, {self.updated} updated, "
+            f"{self.deleted} deleted, {self.unchanged} unchanged, {self.kept} kept"
+        )
+
 
 class CSVDatabaseSeeder:
     """
     A class responsible for seeding the database from a CSV file using asynchronous SQLAlchemy.
+
+    The CSV is streamed in chunks of `chunk_size` rows and every chunk is transformed with
+    vectorised Pandas/NumPy operations, so memory stays bounded by the chunk size (plus the
+    name -> ID maps and the seen (name, year) keys) however large the catalogue is.
     """
 
-    def __init__(self, csv_file_path: str, db_session: AsyncSession) -> None:
+    def __init__(self, csv_file_path: str, db_session: AsyncSession, chunk_size: int = SEED_CHUNK_SIZE) -> None:
         """
         Initialize the seeder with the path to the CSV file and an async database session.
 
         :param csv_file_path: The path to the CSV file containing movie data.
         :param db_session: An instance of AsyncSession for performing database operations.
+        :param chunk_size: The number of CSV rows processed at a time.
         """
         self._csv_file_path = csv_file_path
         self._db_session = db_session
+        self._chunk_size = chunk_size
+        self._country_ids: Dict[str, int] = {}
+        self._name_ids: Dict[str, Dict[str, int]] = {relation: {} for relation in MOVIE_RELATIONS}
+        self._seen_movies: Set[Tuple[str, int]] = set()
+        self.rows_seeded = 0
+        self.stage_seconds: Dict[str, float] = dict.fromkeys(SEED_STAGES, 0.0)
 
     async def is_db_populated(self) -> bool:
         """
@@ -51,38 +120,71 @@ class CSVDatabaseSeeder:
         first_movie = result.scalars().first()
         return first_movie is not None
 
-    def _preprocess_csv(self) -> pd.DataFrame:
+    @contextmanager
+    def _stage(self, stage: str) -> Iterator[None]:
         """
-        Load the CSV, remove duplicates, convert relevant columns to strings, and clean up data.
-        Saves the cleaned CSV back to the same path, then returns the Pandas DataFrame.
+        Add the wall-clock time spent in the block to `stage_seconds[stage]`.
+        """
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds[stage] += time.perf_counter() - started_at
 
-        :return: A Pandas DataFrame containing cleaned movie data.
+    def _read_csv(self) -> Iterator[pd.DataFrame]:
         """
-        data = pd.read_csv(self._csv_file_path)
-        data = data.drop_duplicates(subset=['name', 'year'], keep='first')
+        Read the CSV `chunk_size` rows at a time, yielding each chunk once it is preprocessed.
 
-        for col in ['actors', 'genres', 'country', 'languages', 'directors']:
-            data[col] = data[col].fillna('Unknown').astype(str)
+        Only the current chunk is held in memory; the file itself is left untouched.
 
-        data['actors'] = (
-            data['actors']
-            .str.replace(r'\s+', '', regex=True)
-            .apply(lambda x: ','.join(sorted(set(x.split(',')))) if x != 'Unknown' else x)
+        :return: An iterator over preprocessed Pandas DataFrames, indexed from 0.
+        """
+        reader = pd.read_csv(
+            self._csv_file_path,
+            chunksize=self._chunk_size,
+            dtype={column: str for column in DECIMAL_COLUMNS},
         )
+        with reader:
+            while True:
+                with self._stage("read"):
+                    chunk = next(reader, None)
+                    if chunk is not None:
+                        chunk = self._preprocess_chunk(chunk)
+                if chunk is None:
+                    return
+                if not chunk.empty:
+                    yield chunk
+
+    def _preprocess_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Remove movies already seen (by name and year, in this chunk or an earlier one)
+        and hash the content of the remaining rows into a `content_hash` column.
 
-        data['directors'] = (
-            data['directors']
-            .str.replace(r'\s+', '', regex=True)
-            .apply(lambda x: ','.join(sorted(set(x.split(',')))) if x != 'Unknown' else x)
-        )
+        :param chunk: A chunk of raw CSV rows.
+        :return: The deduplicated chunk, indexed from 0.
+        """
+        chunk = chunk.drop_duplicates(subset=["name", "year"], keep="first")
+        keys = list(zip(chunk["name"], chunk["year"]))
+        is_new = np.fromiter((key not in self._seen_movies for key in keys), dtype=bool, count=len(keys))
+        self._seen_movies.update(compress(keys, is_new))
+        chunk = chunk[is_new].reset_index(drop=True)
 
-        data['genres'] = data['genres'].str.replace('\u00A0', '', regex=True)
-        data['languages'] = data['languages'].str.replace(r'\s+', '', regex=True)
+        hashes = pd.util.hash_pandas_object(chunk[CONTENT_COLUMNS].astype(str), index=False)
+        return chunk.assign(content_hash=hashes.to_numpy().view(np.int64))
 
-        print("Preprocessing CSV file...")
-        data.to_csv(self._csv_file_path, index=False)
-        print(f"CSV file saved to {self._csv_file_path}")
-        return data
+    def _clean_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fill in the country and convert the decimal columns of the rows about to be written.
+        The relation name columns are cleaned up as they are parsed (see `_parse_names`).
+
+        :param chunk: A preprocessed chunk of the CSV.
+        :return: The cleaned chunk.
+        """
+        chunk = chunk.copy()
+        chunk["country"] = chunk["country"].fillna("Unknown").astype(str)
+        for column in DECIMAL_COLUMNS:
+            chunk[column] = chunk[column].map(Decimal)
+        return chunk
 
     async def _seed_user_groups(self) -> None:
         """
@@ -103,215 +205,283 @@ class CSVDatabaseSeeder:
 
             print("User groups seeded successfully.")
 
-    async def _get_or_create_bulk(
+    async def _bulk_insert(self, table, rows: pd.DataFrame) -> None:
+        """
+        Insert the rows of a frame into the given table, with a binary COPY on PostgreSQL
+        and an executemany INSERT on SQLite (see `copy_rows`).
+
+        :param table: The SQLAlchemy table or model to insert into.
+        :param rows: A DataFrame whose columns are the table columns to fill.
+        """
+        await copy_rows(self._db_session, table, list(rows.columns), _records(rows))
+
+    async def _resolve_ids(
             self,
             model,
-            items: List[str],
-            unique_field: str
-    ) -> Dict[str, object]:
+            names: Sequence[str],
+            unique_field: str,
+            known_ids: Dict[str, int]
+    ) -> np.ndarray:
         """
-        For a given model and a list of item names/keys (e.g., a list of genres),
-        retrieves any existing records in the database matching these items.
-        If some items are not found, they are created in bulk. Returns a dictionary
-        mapping the item string to the corresponding model instance.
+        Map unique names to the IDs of their rows, creating the missing ones.
+
+        Names resolved for an earlier chunk are taken from `known_ids`, so each name costs
+        one lookup per seeding run. On PostgreSQL the missing names are upserted through a
+        staging table (see `get_or_create_ids`).
 
         :param model: The SQLAlchemy model class (e.g., GenreModel).
-        :param items: A list of string values to create or retrieve (e.g., ["Comedy", "Action"]).
+        :param names: Unique values to resolve.
         :param unique_field: The field name that should be unique (e.g., "name").
-        :return: A dict mapping each item to its model instance.
+        :param known_ids: The name -> ID map of the model, updated in place.
+        :return: The IDs, in the order of `names`.
         """
-        existing_dict: Dict[str, object] = {}
+        missing = [name for name in names if name not in known_ids]
+        if missing:
+            known_ids.update(await get_or_create_ids(self._db_session, model, missing, unique_field))
+        return np.fromiter((known_ids[name] for name in names), dtype=np.int64, count=len(names))
 
-        if items:
-            for i in range(0, len(items), CHUNK_SIZE):
-                chunk = items[i: i + CHUNK_SIZE]
-                result = await self._db_session.execute(
-                    select(model).where(getattr(model, unique_field).in_(chunk))
-                )
-                existing_in_chunk = result.scalars().all()
-                for obj in existing_in_chunk:
-                    key = getattr(obj, unique_field)
-                    existing_dict[key] = obj
-
-        new_items = [item for item in items if item not in existing_dict]
-        new_records = [{unique_field: item} for item in new_items]
-
-        if new_records:
-            for i in range(0, len(new_records), CHUNK_SIZE):
-                chunk = new_records[i: i + CHUNK_SIZE]
-                await self._db_session.execute(insert(model).values(chunk))
-                await self._db_session.flush()
-
-            for i in range(0, len(new_items), CHUNK_SIZE):
-                chunk = new_items[i: i + CHUNK_SIZE]
-                result_new = await self._db_session.execute(
-                    select(model).where(getattr(model, unique_field).in_(chunk))
-                )
-                inserted_in_chunk = result_new.scalars().all()
-                for obj in inserted_in_chunk:
-                    key = getattr(obj, unique_field)
-                    existing_dict[key] = obj
+    async def _prepare_reference_data(
+            self,
+            chunk: pd.DataFrame
+    ) -> Tuple[np.ndarray, Dict[str, Tuple[np.ndarray, np.ndarray]]]:
+        """
+        Resolve the country and the genre, actor, director and language names of a chunk to IDs.
 
-        return existing_dict
+        Every name column is split and exploded into one entry per (row, name), and its
+        distinct names are resolved once; the IDs are then spread back over the entries.
+        The lookups run on the seeding session, so the rows they create are committed or
+        rolled back with the rest of the seed.
 
-    async def _bulk_insert(self, table, data_list: List[Dict[str, int]]) -> None:
+        :param chunk: A cleaned chunk of the CSV.
+        :return: The country ID of every row, and per relation (see `MOVIE_RELATIONS`) the row
+                 positions and the IDs of its exploded names.
         """
-        Insert data_list into the given table in chunks, displaying progress via tqdm.
+        codes, countries = pd.factorize(chunk["country"])
+        country_ids = (await self._resolve_ids(CountryModel, countries, "code", self._country_ids))[codes]
 
-        :param table: The SQLAlchemy table or model to insert into.
-        :param data_list: A list of dictionaries, where each dict represents a row to insert.
-        """
-        total_records = len(data_list)
-        if total_records == 0:
-            return
+        references: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for relation, (model, _, _) in MOVIE_RELATIONS.items():
+            rows, codes, uniques = _parse_names(chunk[relation], NAME_CLEANUP[relation])
+            ids = await self._resolve_ids(model, uniques, "name", self._name_ids[relation])
+            references[relation] = (rows, ids[codes])
 
-        num_chunks = math.ceil(total_records / CHUNK_SIZE)
-        table_name = getattr(table, '__tablename__', str(table))
+        return country_ids, references
 
-        for chunk_index in tqdm(range(num_chunks), desc=f"Inserting into {table_name}"):
-            start = chunk_index * CHUNK_SIZE
-            end = start + CHUNK_SIZE
-            chunk = data_list[start:end]
-            if chunk:
-                await self._db_session.execute(insert(table).values(chunk))
+    def _prepare_movies_data(
+            self,
+            chunk: pd.DataFrame,
+            country_ids: np.ndarray
+    ) -> pd.DataFrame:
+        """
+        Build the rows of a chunk to be inserted into MovieModel.
 
-        await self._db_session.flush()
+        :param chunk: A preprocessed chunk of the CSV.
+        :param country_ids: The country ID of every row of the chunk.
+        :return: A DataFrame whose columns are the movie columns to fill.
+        """
+        return chunk[MOVIE_COLUMNS + ["content_hash"]].assign(country_id=country_ids)
 
-    async def _prepare_reference_data(
+    def _prepare_associations(
             self,
-            data: pd.DataFrame
-    ) -> Tuple[Dict[str, object], Dict[str, object], Dict[str, object], Dict[str, object], Dict[str, object]]:
-        """
-        Gather unique values for countries, genres, actors, and languages from the DataFrame.
-        Then call _get_or_create_bulk for each to ensure they exist in the database.
-
-        :param data: The preprocessed Pandas DataFrame containing movie info.
-        :return: A tuple of four dictionaries:
-                 (country_map, genre_map, actor_map, language_map).
-        """
-        countries = list(data['country'].unique())
-        genres = {
-            genre.strip()
-            for genres_ in data['genres'].dropna() for genre in genres_.split(',')
-            if genre.strip()
-        }
-        actors = {
-            actor.strip()
-            for actors in data['actors'].dropna() for actor in actors.split(',')
-            if actor.strip()
-        }
-        directors = {
-            director.strip()
-            for directors in data['directors'].dropna() for director in directors.split(',')
-            if director.strip()
-        }
-        languages = {
-            lang.strip()
-            for langs in data['languages'].dropna() for lang in langs.split(',')
-            if lang.strip()
-        }
-
-        country_map = await self._get_or_create_bulk(CountryModel, countries, 'code')
-        genre_map = await self._get_or_create_bulk(GenreModel, list(genres), 'name')
-        actor_map = await self._get_or_create_bulk(ActorModel, list(actors), 'name')
-        director_map = await self._get_or_create_bulk(DirectorModel, list(directors), 'name')
-        language_map = await self._get_or_create_bulk(LanguageModel, list(languages), 'name')
-
-        return country_map, genre_map, actor_map, director_map, language_map
+            movie_ids: np.ndarray,
+            references: Dict[str, Tuple[np.ndarray, np.ndarray]]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Build the movie-genre, movie-actor, movie-director and movie-language association
+        rows of a chunk, as frames of two ID columns.
 
-    def _prepare_movies_data(
-            self,
-            data: pd.DataFrame,
-            country_map: Dict[str, object]
-    ) -> List[Dict[str, object]]:
-        """
-        Build a list of dictionaries representing movie records to be inserted into MovieModel.
-
-        :param data: The preprocessed DataFrame.
-        :param country_map: A mapping of country codes to CountryModel instances.
-        :return: A list of dictionaries, each representing a new movie record.
-        """
-        movies_data: List[Dict[str, object]] = []
-        for _, row in tqdm(data.iterrows(), total=data.shape[0], desc="Processing movies"):
-            country = country_map[row['country']]
-            movie = {
-                "uuid": row['uuid'],
-                "name": row['name'],
-                "year": row['year'],
-                "duration": row['duration'],
-                "imdb": Decimal(row['imdb']),
-                "imdb_votes": row['imdb_votes'],
-                "description": row['description'],
-                "budget": Decimal(row['budget']),
-                "revenue": Decimal(row['revenue']),
-                "certification": row['certification'],
-                "price": Decimal(row['price']),
-                "country_id": country.id
-            }
-            movies_data.append(movie)
-        return movies_data
+        :param movie_ids: The IDs of the inserted movies, in the order of the chunk rows.
+        :param references: The row positions and IDs of the names of every relation,
+                           as returned by `_prepare_reference_data`.
+        :return: A dict mapping each relation to its association rows, without duplicates.
+        """
+        associations: Dict[str, pd.DataFrame] = {}
+        for relation, (_, _, column) in MOVIE_RELATIONS.items():
+            rows, ids = references[relation]
+            associations[relation] = pd.DataFrame({"movie_id": movie_ids[rows], column: ids}).drop_duplicates()
+        return associations
 
-    def _prepare_associations(
+    async def _seed_chunk(self, chunk: pd.DataFrame) -> None:
+        """
+        Insert the movies of a chunk with their associations and search documents.
+
+        :param chunk: A preprocessed chunk of the CSV.
+        """
+        with self._stage("read"):
+            chunk = self._clean_chunk(chunk)
+
+        with self._stage("reference data"):
+            country_ids, references = await self._prepare_reference_data(chunk)
+
+        with self._stage("movies"):
+            movies = self._prepare_movies_data(chunk, country_ids)
+            ids = await copy_new_rows(self._db_session, MovieModel, list(movies.columns), _records(movies))
+            movie_ids = np.array(ids, dtype=np.int64)
+
+        with self._stage("associations"):
+            associations = self._prepare_associations(movie_ids, references)
+            for relation, rows in associations.items():
+                _, table, _ = MOVIE_RELATIONS[relation]
+                await self._bulk_insert(table, rows)
+
+        with self._stage("search"):
+            await refresh_search_documents(self._db_session, movie_ids.tolist())
+
+        self.rows_seeded += len(chunk)
+
+    async def _update_chunk(self, chunk: pd.DataFrame, movie_ids: np.ndarray) -> None:
+        """
+        Rewrite changed movies of a chunk in place, with their associations and search documents.
+
+        :param chunk: A preprocessed chunk of the CSV, holding only changed movies.
+        :param movie_ids: The IDs of the movies, in the order of the chunk rows.
+        """
+        with self._stage("read"):
+            chunk = self._clean_chunk(chunk)
+
+        with self._stage("reference data"):
+            country_ids, references = await self._prepare_reference_data(chunk)
+
+        with self._stage("movies"):
+            movies = self._prepare_movies_data(chunk, country_ids).assign(id=movie_ids)
+            await self._db_session.execute(update(MovieModel), movies.astype(object).to_dict("records"))
+
+        with self._stage("associations"):
+            associations = self._prepare_associations(movie_ids, references)
+            for relation, rows in associations.items():
+                await self._sync_associations(relation, movie_ids, rows)
+
+        with self._stage("search"):
+            await refresh_search_documents(self._db_session, movie_ids.tolist())
+
+    async def _sync_associations(self, relation: str, movie_ids: np.ndarray, rows: pd.DataFrame) -> None:
+        """
+        Bring the association rows of a relation for the given movies in line with `rows`,
+        inserting the missing pairs and deleting the ones no longer listed.
+
+        :param relation: The relation, a key of `MOVIE_RELATIONS`.
+        :param movie_ids: The movies whose associations are replaced.
+        :param rows: Their expected association rows, as built by `_prepare_associations`.
+        """
+        _, table, column = MOVIE_RELATIONS[relation]
+        current = []
+        for start in range(0, len(movie_ids), CHUNK_SIZE):
+            result = await self._db_session.execute(
+                select(table.c.movie_id, table.c[column])
+                .where(table.c.movie_id.in_(movie_ids[start: start + CHUNK_SIZE].tolist()))
+            )
+            current.extend(tuple(row) for row in result)
+        current_rows = pd.DataFrame(current, columns=["movie_id", column], dtype=np.int64)
+
+        diff = rows.merge(current_rows, how="outer", indicator=True)
+        added = diff.loc[diff["_merge"] == "left_only", ["movie_id", column]]
+        removed = diff.loc[diff["_merge"] == "right_only", ["movie_id", column]]
+
+        if not removed.empty:
+            await self._db_session.execute(
+                delete(table).where(
+                    table.c.movie_id == bindparam("old_movie_id"),
+                    table.c[column] == bindparam("old_reference_id"),
+                ),
+                [
+                    {"old_movie_id": movie_id, "old_reference_id": reference_id}
+                    for movie_id, reference_id in _records(removed)
+                ]
+            )
+        await self._bulk_insert(table, added)
+
+    async def _load_content_hashes(self) -> pd.DataFrame:
+        """
+        Load the ID and stored content hash of every movie, indexed by UUID.
+
+        :return: A DataFrame with `id` and `content_hash` columns (`UNSYNCED_HASH` when unset).
+        """
+        result = await self._db_session.execute(
+            select(MovieModel.uuid, MovieModel.id, func.coalesce(MovieModel.content_hash, UNSYNCED_HASH))
+        )
+        stored = pd.DataFrame([tuple(row) for row in result], columns=["uuid", "id", "content_hash"])
+        return stored.astype({"id": np.int64, "content_hash": np.int64}).set_index("uuid")
+
+    async def _sync_chunk(
             self,
-            data: pd.DataFrame,
-            movie_ids: List[int],
-            genre_map: Dict[str, object],
-            actor_map: Dict[str, object],
-            director_map: Dict[str, object],
-            language_map: Dict[str, object]
-    ) -> Tuple[List[Dict[str, int]], List[Dict[str, int]], List[Dict[str, int]], List[Dict[str, int]]]:
-        """
-        Prepare three lists of dictionaries: movie-genre, movie-actor, and movie-language
-        associations for all movies in the DataFrame.
-
-        :param data: The DataFrame containing movie info.
-        :param movie_ids: The list of newly inserted movie IDs, in the same order as DataFrame rows.
-        :param genre_map: A mapping of genre names to GenreModel instances.
-        :param actor_map: A mapping of actor names to ActorModel instances.
-        :param language_map: A mapping of language names to LanguageModel instances.
-        :return: A tuple of three lists:
-                 (movie_genres_data, movie_actors_data, movie_languages_data),
-                 each containing dictionaries for bulk insertion.
-        """
-        movie_genres_data: List[Dict[str, int]] = []
-        movie_actors_data: List[Dict[str, int]] = []
-        movie_directors_data: List[Dict[str, int]] = []
-        movie_languages_data: List[Dict[str, int]] = []
-
-        for i, (_, row) in enumerate(tqdm(data.iterrows(), total=data.shape[0], desc="Processing associations")):
-            movie_id = movie_ids[i]
-
-            for genre_name in row['genres'].split(','):
-                genre_name = genre_name.strip()
-                if genre_name:
-                    genre = genre_map[genre_name]
-                    movie_genres_data.append({"movie_id": movie_id, "genre_id": genre.id})
-
-            for actor_name in row['actors'].split(','):
-                actor_name = actor_name.strip()
-                if actor_name:
-                    actor = actor_map[actor_name]
-                    movie_actors_data.append({"movie_id": movie_id, "actor_id": actor.id})
-
-            for director_name in row['directors'].split(','):
-                director_name = director_name.strip()
-                if director_name:
-                    actor = director_map[director_name]
-                    movie_directors_data.append({"movie_id": movie_id, "director_id": actor.id})
-
-            for lang_name in row['languages'].split(','):
-                lang_name = lang_name.strip()
-                if lang_name:
-                    language = language_map[lang_name]
-                    movie_languages_data.append({"movie_id": movie_id, "language_id": language.id})
-
-        return movie_genres_data, movie_actors_data, movie_directors_data, movie_languages_data
+            chunk: pd.DataFrame,
+            stored: pd.DataFrame,
+            seen: np.ndarray,
+            summary: SyncSummary
+    ) -> None:
+        """
+        Insert the new movies of a chunk and rewrite the changed ones, leaving unchanged
+        movies untouched.
+
+        :param chunk: A preprocessed chunk of the CSV.
+        :param stored: The stored movies, as returned by `_load_content_hashes`.
+        :param seen: Flags of the stored movies found in the CSV so far, updated in place.
+        :param summary: The running sync summary, updated in place.
+        """
+        with self._stage("read"):
+            positions = stored.index.get_indexer(chunk["uuid"])
+            known = positions >= 0
+            seen[positions[known]] = True
+
+            stored_ids = np.zeros(len(chunk), dtype=np.int64)
+            stored_ids[known] = stored["id"].to_numpy()[positions[known]]
+            stored_hashes = np.full(len(chunk), UNSYNCED_HASH, dtype=np.int64)
+            stored_hashes[known] = stored["content_hash"].to_numpy()[positions[known]]
+            changed = known & (stored_hashes != chunk["content_hash"].to_numpy())
+
+        if not known.all():
+            await self._seed_chunk(chunk[~known].reset_index(drop=True))
+        if changed.any():
+            await self._update_chunk(chunk[changed].reset_index(drop=True), stored_ids[changed])
+
+        summary.inserted += int((~known).sum())
+        summary.updated += int(changed.sum())
+        summary.unchanged += int((known & ~changed).sum())
+
+    async def _movies_with_user_content(self, movie_ids: List[int]) -> Set[int]:
+        """
+        Find the movies that have comments, ratings or reactions.
+
+        :param movie_ids: IDs of the movies to check.
+        :return: The IDs of those with user content.
+        """
+        referenced: Set[int] = set()
+        for start in range(0, len(movie_ids), CHUNK_SIZE):
+            chunk = movie_ids[start: start + CHUNK_SIZE]
+            for model in USER_CONTENT_MODELS:
+                result = await self._db_session.execute(
+                    select(model.movie_id).where(model.movie_id.in_(chunk)).distinct()
+                )
+                referenced.update(result.scalars())
+        return referenced
+
+    async def _delete_movies(self, movie_ids: List[int]) -> None:
+        """
+        Delete movies with their associations, favourites and search documents.
+
+        The movies must have no comments, ratings or reactions (see `_movies_with_user_content`):
+        those reference `movies` without ON DELETE CASCADE.
+
+        :param movie_ids: IDs of the movies to delete.
+        """
+        for start in range(0, len(movie_ids), CHUNK_SIZE):
+            chunk = movie_ids[start: start + CHUNK_SIZE]
+            for table in [*(table for _, table, _ in MOVIE_RELATIONS.values()), FavouritesMoviesModel]:
+                await self._db_session.execute(delete(table).where(table.c.movie_id.in_(chunk)))
+            await self._db_session.execute(
+                delete(MovieModel).where(MovieModel.id.in_(chunk)).execution_options(synchronize_session=False)
+            )
+        await delete_search_documents(self._db_session, movie_ids)
 
     async def seed(self) -> None:
         """
         Main method to seed the database with movie data from the CSV.
-        It pre-processes the CSV, prepares reference data (countries, genres, actors, languages),
-        inserts all movies, then inserts many-to-many relationships (genres, actors, languages).
+
+        The CSV is read and seeded one chunk at a time: the chunk's reference data (countries,
+        genres, actors, directors, languages) is resolved, its movies are inserted, then their
+        many-to-many relationships and full-text search documents. Rows are streamed with a
+        binary COPY on PostgreSQL; on SQLite they are inserted with executemany under
+        `bulk_load_pragmas`. Everything is committed at the end, in a single transaction.
         """
         try:
             if self._db_session.in_transaction():
@@ -320,33 +490,62 @@ class CSVDatabaseSeeder:
 
             await self._seed_user_groups()
 
-            data = self._preprocess_csv()
+            async with bulk_load_pragmas(self._db_session):
+                with tqdm(desc="Seeding movies", unit=" movies") as progress:
+                    for chunk in self._read_csv():
+                        await self._seed_chunk(chunk)
+                        progress.update(len(chunk))
 
-            country_map, genre_map, actor_map, director_map, language_map = await self._prepare_reference_data(data)
+            await self._db_session.commit()
+            print(f"Seeding completed: {self.rows_seeded} movies.")
 
-            movies_data = self._prepare_movies_data(data, country_map)
+        except SQLAlchemyError as e:
+            print(f"An error occurred: {e}")
+            raise
+        except Exception as e:
+            print(f"Unexpected error: {e}")
+            raise
 
-            result = await self._db_session.execute(
-                insert(MovieModel).returning(MovieModel.id),
-                movies_data
-            )
-            movie_ids = list(result.scalars().all())
-
-            (movie_genres_data,
-             movie_actors_data,
-             movie_directors_data,
-             movie_languages_data
-             ) = self._prepare_associations(
-                data, movie_ids, genre_map, actor_map, director_map, language_map
-            )
+    async def sync(self) -> SyncSummary:
+        """
+        Bring the database in line with the CSV, writing only what changed since the last run.
+
+        Every CSV row is hashed and matched by `uuid` against the hashes stored with the
+        movies: new rows are inserted as in `seed`, rows whose hash differs are updated
+        together with their association diffs and search documents, and seeded movies no
+        longer in the CSV are deleted, unless users commented on, rated or reacted to them:
+        those are kept and counted in the summary. Unchanged rows are neither cleaned nor written, so
+        re-running on an unchanged CSV only costs reading and hashing it. Everything is
+        committed at the end, in a single transaction.
+
+        :return: The number of movies inserted, updated, deleted and left unchanged.
+        """
+        summary = SyncSummary()
+        try:
+            if self._db_session.in_transaction():
+                print("Rolling back existing transaction.")
+                await self._db_session.rollback()
 
-            await self._bulk_insert(MoviesGenresModel, movie_genres_data)
-            await self._bulk_insert(ActorsMoviesModel, movie_actors_data)
-            await self._bulk_insert(DirectorsMoviesModel, movie_directors_data)
-            await self._bulk_insert(MoviesLanguagesModel, movie_languages_data)
+            await self._seed_user_groups()
+            stored = await self._load_content_hashes()
+            seen = np.zeros(len(stored), dtype=bool)
+
+            async with bulk_load_pragmas(self._db_session):
+                with tqdm(desc="Syncing movies", unit=" movies") as progress:
+                    for chunk in self._read_csv():
+                        await self._sync_chunk(chunk, stored, seen, summary)
+                        progress.update(len(chunk))
+
+                stale = ~seen & (stored["content_hash"].to_numpy() != UNSYNCED_HASH)
+                stale_ids = stored["id"].to_numpy()[stale].tolist()
+                kept = await self._movies_with_user_content(stale_ids)
+                await self._delete_movies([movie_id for movie_id in stale_ids if movie_id not in kept])
+                summary.deleted = len(stale_ids) - len(kept)
+                summary.kept = len(kept)
 
             await self._db_session.commit()
-            print("Seeding completed.")
+            print(f"Sync completed: {summary}.")
+            return summary
 
         except SQLAlchemyError as e:
             print(f"An error occurred: {e}")
@@ -356,16 +555,48 @@ class CSVDatabaseSeeder:
             raise
 
 
-async def main() -> None:
+def _records(frame: pd.DataFrame) -> Iterator[tuple]:
+    """
+    Iterate over the rows of a frame as tuples of Python scalars, as the database drivers expect.
+    """
+    return frame.astype(object).itertuples(index=False, name=None)
+
+
+def _parse_names(column: pd.Series, cleanup: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Clean up a column of comma-separated names, split it into one entry per (row, name) and
+    factorize the names.
+
+    :param column: The name column of a chunk, indexed from 0.
+    :param cleanup: A pattern removed from the names (see `NAME_CLEANUP`).
+    :return: The row position of every entry, the code of its name, and the distinct names
+             the codes index into.
+    """
+    names = column.fillna("Unknown").astype(str).str.replace(cleanup, "", regex=True)
+    names = names.str.split(",").explode().str.strip()
+    names = names[names.str.len() > 0]
+    codes, uniques = pd.factorize(names)
+    return names.index.to_numpy(), codes, np.asarray(uniques, dtype=object)
+
+
+async def main(sync: bool = False) -> None:
     """
     The main async entry point for running the database seeder.
     Checks if the database is already populated, and if not, performs the seeding process.
+    With `sync`, applies the changes between the CSV and the database instead (see
+    `CSVDatabaseSeeder.sync`), whether or not the database is populated.
     """
     settings = get_settings()
     async with get_db_contextmanager() as db_session:
         seeder = CSVDatabaseSeeder(settings.PATH_TO_MOVIES_CSV, db_session)
 
-        if not await seeder.is_db_populated():
+        if sync:
+            try:
+                await seeder.sync()
+                print("Database sync completed successfully.")
+            except Exception as e:
+                print(f"Failed to sync the database: {e}")
+        elif not await seeder.is_db_populated():
             try:
                 await seeder.seed()
                 print("Database seeding completed successfully.")
@@ -376,4 +607,10 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Seed the database from the movies CSV.")
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Insert, update and delete movies to match the CSV instead of seeding an empty database.",
+    )
+    asyncio.run(main(parser.parse_args().sync))
@@ -0,0 +1,195 @@
+import re
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    cast,
+    column,
+    delete,
+    false,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    table,
+    update,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cinema.database.dialects import is_postgresql
+from cinema.database.models.movies import (
+    ActorModel,
+    ActorsMoviesModel,
+    DirectorModel,
+    DirectorsMoviesModel,
+    MovieModel,
+)
+
+CHUNK_SIZE = 1000
+
+# Text search configuration used for both documents and queries. "simple" does not stem,
+# so prefix queries keep matching partial words the way the former ILIKE search did.
+SEARCH_TS_CONFIG = "simple"
+
+# SQLite FTS5 table created alongside `movies` (see cinema.database.models.movies).
+# The FTS rowid is the movie ID.
+movies_search_table = table(
+    "movies_search",
+    column("rowid"),
+    column("name"),
+    column("description"),
+    column("actors"),
+    column("directors"),
+)
+
+# bm25 weights for the (name, description, actors, directors) FTS5 columns.
+FTS5_COLUMN_WEIGHTS = (10.0, 1.0, 5.0, 5.0)
+
+
+def _search_terms(search: str) -> List[str]:
+    """
+    Split free-form user input into lowercase word tokens.
+    """
+    return re.findall(r"\w+", search.lower())
+
+
+def _ts_config() -> ColumnElement:
+    return cast(SEARCH_TS_CONFIG, REGCONFIG)
+
+
+def _related_names(name_column, association, foreign_key, aggregate) -> ColumnElement:
+    """
+    Correlated scalar subquery returning the space-separated related names of the outer movie row.
+    """
+    return (
+        select(aggregate(name_column, literal(" ")))
+        .select_from(association.join(name_column.class_, foreign_key == name_column.class_.id))
+        .where(association.c.movie_id == MovieModel.id)
+        .scalar_subquery()
+    )
+
+
+def _chunks(movie_ids: List[int]) -> Iterable[List[int]]:
+    for i in range(0, len(movie_ids), CHUNK_SIZE):
+        yield movie_ids[i: i + CHUNK_SIZE]
+
+
+async def _refresh_postgresql(session: AsyncSession, movie_ids: Optional[List[int]]) -> None:
+    actors = _related_names(ActorModel.name, ActorsMoviesModel, ActorsMoviesModel.c.actor_id, func.string_agg)
+    directors = _related_names(
+        DirectorModel.name, DirectorsMoviesModel, DirectorsMoviesModel.c.director_id, func.string_agg
+    )
+
+    def weighted(expression, weight: str) -> ColumnElement:
+        return func.setweight(func.to_tsvector(_ts_config(), func.coalesce(expression, "")), weight)
+
+    document = (
+        weighted(MovieModel.name, "A")
+        .op("||")(weighted(actors, "B"))
+        .op("||")(weighted(directors, "B"))
+        .op("||")(weighted(MovieModel.description, "C"))
+    )
+
+    stmt = update(MovieModel).values(search_vector=document)
+    if movie_ids is None:
+        await session.execute(stmt)
+        return
+
+    for chunk in _chunks(movie_ids):
+        await session.execute(stmt.where(MovieModel.id.in_(chunk)))
+
+
+async def _refresh_sqlite(session: AsyncSession, movie_ids: Optional[List[int]]) -> None:
+    actors = _related_names(ActorModel.name, ActorsMoviesModel, ActorsMoviesModel.c.actor_id, func.group_concat)
+    directors = _related_names(
+        DirectorModel.name, DirectorsMoviesModel, DirectorsMoviesModel.c.director_id, func.group_concat
+    )
+
+    documents = select(
+        MovieModel.id,
+        MovieModel.name,
+        MovieModel.description,
+        func.coalesce(actors, ""),
+        func.coalesce(directors, ""),
+    )
+    target_columns = ["rowid", "name", "description", "actors", "directors"]
+
+    if movie_ids is None:
+        await session.execute(delete(movies_search_table))
+        await session.execute(insert(movies_search_table).from_select(target_columns, documents))
+        return
+
+    for chunk in _chunks(movie_ids):
+        await session.execute(delete(movies_search_table).where(movies_search_table.c.rowid.in_(chunk)))
+        await session.execute(
+            insert(movies_search_table).from_select(target_columns, documents.where(MovieModel.id.in_(chunk)))
+        )
+
+
+async def refresh_search_documents(session: AsyncSession, movie_ids: Optional[List[int]] = None) -> None:
+    """
+    Rebuild the full-text search documents of the given movies from their current
+    name, description, actors and directors.
+
+    Must be called after the movie and its associations are flushed and before the
+    transaction is committed, so the document is updated atomically with the movie.
+
+    :param session: The async database session.
+    :param movie_ids: IDs of the movies to refresh, or None to rebuild every document.
+    """
+    if is_postgresql(session):
+        await _refresh_postgresql(session, movie_ids)
+    else:
+        await _refresh_sqlite(session, movie_ids)
+
+
+async def delete_search_documents(session: AsyncSession, movie_ids: List[int]) -> None:
+    """
+    Remove the search documents of deleted movies.
+
+    On PostgreSQL the document is a column of `movies` and goes away with the row,
+    so only the SQLite FTS5 table needs an explicit delete.
+
+    :param session: The async database session.
+    :param movie_ids: IDs of the deleted movies.
+    """
+    if is_postgresql(session):
+        return
+
+    for chunk in _chunks(movie_ids):
+        await session.execute(delete(movies_search_table).where(movies_search_table.c.rowid.in_(chunk)))
+
+
+def apply_search(session: AsyncSession, stmt: Select, search: str) -> Tuple[Select, ColumnElement]:
+    """
+    Restrict a SELECT over `movies` to rows matching the search input and build a relevance score.
+
+    Every word of the input must match (as a prefix) the title, description, an actor
+    or a director. Higher scores mean better matches on both backends.
+
+    :param session: The async database session (used to pick the dialect).
+    :param stmt: A SELECT whose FROM clause contains `movies`.
+    :param search: Free-form search input.
+    :return: The filtered statement and the relevance expression to order by (descending).
+    """
+    terms = _search_terms(search)
+    if not terms:
+        return stmt.where(false()), literal(0)
+
+    if is_postgresql(session):
+        query = func.to_tsquery(_ts_config(), " & ".join(f"{term}:*" for term in terms))
+        stmt = stmt.where(MovieModel.search_vector.op("@@")(query))
+        return stmt, func.ts_rank(MovieModel.search_vector, query)
+
+    fts_table = literal_column("movies_search")
+    match = " ".join(f'"{term}"*' for term in terms)
+    stmt = (
+        stmt
+        .join(movies_search_table, movies_search_table.c.rowid == MovieModel.id)
+        .where(fts_table.op("MATCH")(match))
+    )
+    # bm25() is lower for better matches, negate it so callers can always sort descending.
+    return stmt, -func.bm25(fts_table, *FTS5_COLUMN_WEIGHTS)
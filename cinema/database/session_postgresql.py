@@ -1,17 +1,49 @@
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
+from uuid import uuid4
 
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
-from cinema.config.settings import get_settings
+from cinema.config.settings import Settings, get_settings
+from cinema.database.pool import InstrumentedAsyncQueuePool
 
 settings = get_settings()
 
+
+def get_engine_options(settings: Settings) -> Dict[str, Any]:
+    """
+    Build the pool options of the async PostgreSQL engine from the POSTGRES_POOL_* settings.
+
+    Behind PgBouncer in transaction pooling mode, consecutive transactions of one client
+    connection may run on different server connections, so asyncpg's named, per-connection
+    prepared statements would be missing (or clash) there. With `POSTGRES_PGBOUNCER` both
+    statement caches are disabled and every prepared statement gets a unique name.
+
+    :param settings: The application settings.
+    :return: Keyword arguments for `create_async_engine`.
+    """
+    options: Dict[str, Any] = {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": settings.POSTGRES_POOL_SIZE,
+        "max_overflow": settings.POSTGRES_MAX_OVERFLOW,
+        "pool_timeout": settings.POSTGRES_POOL_TIMEOUT,
+        "pool_recycle": settings.POSTGRES_POOL_RECYCLE,
+        "pool_pre_ping": settings.POSTGRES_POOL_PRE_PING,
+    }
+    if settings.POSTGRES_PGBOUNCER:
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return options
+
+
 POSTGRESQL_DATABASE_URL = (f"postgresql+asyncpg://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@"
                            f"{settings.POSTGRES_HOST}:{settings.POSTGRES_DB_PORT}/{settings.POSTGRES_DB}")
-postgresql_engine = create_async_engine(POSTGRESQL_DATABASE_URL, echo=False)
+postgresql_engine = create_async_engine(POSTGRESQL_DATABASE_URL, echo=False, **get_engine_options(settings))
 AsyncPostgresqlSessionLocal = sessionmaker(  # type: ignore
     bind=postgresql_engine,
     class_=AsyncSession,
@@ -0,0 +1,77 @@
+from typing import Any, Optional, Type, Union
+
+from sqlalchemy import Row, delete, exists, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cinema.database.dialects import is_postgresql
+from cinema.database.models.movies import MovieReactionModel, RatingModel
+
+ToggleModel = Union[Type[RatingModel], Type[MovieReactionModel]]
+
+
+async def toggle_user_movie_value(
+        session: AsyncSession,
+        model: ToggleModel,
+        value_column: str,
+        user_id: int,
+        movie_id: int,
+        value: Any,
+) -> Optional[Row]:
+    """
+    Toggle a per-(user, movie) value such as a rating or a reaction without a prior SELECT.
+
+    - No row yet -> insert it.
+    - A row with the same value -> delete it (toggle off).
+    - A row with a different value -> update it.
+
+    PostgreSQL runs this as one statement: a `DELETE ... RETURNING` CTE followed by an
+    `INSERT ... ON CONFLICT DO UPDATE` that only runs when nothing was deleted. SQLite has
+    no data-modifying CTEs, so it runs the same two statements back to back in the same
+    transaction (SQLite serialises writers, so nothing can slip in between).
+
+    Concurrent toggles never violate the `(user_id, movie_id)` unique constraint; the
+    movie aggregates are maintained by the table triggers. The caller commits.
+
+    :param session: The async database session.
+    :param model: RatingModel or MovieReactionModel.
+    :param value_column: Name of the toggled column (`rating` or `reaction`).
+    :param user_id: ID of the acting user.
+    :param movie_id: ID of the movie.
+    :param value: The submitted value.
+    :return: A `(value, created_at)` row with the current state, or None if the value was removed.
+    """
+    table = model.__table__
+    column = table.c[value_column]
+    removed = (
+        delete(table)
+        .where(table.c.user_id == user_id, table.c.movie_id == movie_id, column == value)
+        .returning(table.c.id)
+    )
+
+    def upsert(stmt):
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.movie_id],
+            set_={value_column: stmt.excluded[value_column]},
+        ).returning(column, table.c.created_at)
+
+    if is_postgresql(session):
+        removed_cte = removed.cte("removed")
+        stmt = upsert(
+            postgresql_insert(table).from_select(
+                ["user_id", "movie_id", value_column, "created_at"],
+                select(
+                    literal(user_id),
+                    literal(movie_id),
+                    literal(value, type_=column.type),
+                    func.now(),
+                ).where(~exists(select(removed_cte.c.id))),
+            )
+        ).add_cte(removed_cte)
+        return (await session.execute(stmt)).first()
+
+    if (await session.execute(removed)).first() is not None:
+        return None
+    stmt = upsert(sqlite_insert(table).values(user_id=user_id, movie_id=movie_id, **{value_column: value}))
+    return (await session.execute(stmt)).first()
@@ -0,0 +1,296 @@
+import asyncio
+import heapq
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import case, func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cinema.database.dialects import is_postgresql
+from cinema.database.models.movies import ActorModel, DirectorModel, GenreModel, MovieModel
+
+TYPEAHEAD_MODELS = {
+    "movies": MovieModel,
+    "actors": ActorModel,
+    "directors": DirectorModel,
+    "genres": GenreModel,
+}
+
+# Names are indexed up to this many characters from each word start; longer
+# queries are answered from the deepest node and filtered by a string check.
+MAX_INDEXED_PREFIX = 32
+
+TypeaheadMatch = Tuple[int, str]
+
+
+def normalize_name(value: str) -> str:
+    """
+    Casefold, strip accents and collapse whitespace so lookups are case/accent-insensitive.
+    """
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def _word_starts(normalized: str) -> List[int]:
+    return [
+        i for i, char in enumerate(normalized)
+        if char.isalnum() and (i == 0 or not normalized[i - 1].isalnum())
+    ]
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.ids: Set[int] = set()
+
+
+class PrefixTrie:
+    """
+    Prefix trie over names, keyed from every word start.
+
+    "Christopher Nolan" is reachable both from "chr" and from "nol", so a query
+    matches names where it is a prefix of the whole name or of any word in it.
+    Each node keeps the IDs of all names passing through it, so a lookup is a
+    walk of `len(query)` nodes followed by a top-N selection.
+    """
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+        self._names: Dict[int, str] = {}
+        self._normalized: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _keys(self, normalized: str) -> Iterable[str]:
+        for start in _word_starts(normalized):
+            yield normalized[start: start + MAX_INDEXED_PREFIX]
+
+    def add(self, item_id: int, name: str) -> None:
+        """
+        Index a name, replacing the previous name of the same ID if it changed.
+        """
+        if self._names.get(item_id) == name:
+            return
+        self.remove(item_id)
+
+        normalized = normalize_name(name)
+        self._names[item_id] = name
+        self._normalized[item_id] = normalized
+
+        for key in self._keys(normalized):
+            node = self._root
+            for char in key:
+                node = node.children.setdefault(char, _TrieNode())
+                node.ids.add(item_id)
+
+    def remove(self, item_id: int) -> None:
+        normalized = self._normalized.pop(item_id, None)
+        if normalized is None:
+            return
+        del self._names[item_id]
+
+        for key in self._keys(normalized):
+            path = [self._root]
+            for char in key:
+                node = path[-1].children.get(char)
+                if node is None:
+                    break
+                node.ids.discard(item_id)
+                path.append(node)
+
+            # Prune nodes no other name passes through.
+            for depth in range(len(path) - 1, 0, -1):
+                if path[depth].ids:
+                    break
+                del path[depth - 1].children[key[depth - 1]]
+
+    def search(self, query: str, limit: int) -> List[TypeaheadMatch]:
+        """
+        Return up to `limit` `(id, name)` pairs matching the query.
+
+        Names starting with the query come first, then shorter names, then alphabetical order.
+        """
+        normalized_query = normalize_name(query)
+        if not normalized_query:
+            return []
+
+        node = self._root
+        for char in normalized_query[:MAX_INDEXED_PREFIX]:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        candidates: Iterable[int] = node.ids
+        if len(normalized_query) > MAX_INDEXED_PREFIX:
+            candidates = [
+                item_id for item_id in candidates
+                if any(
+                    self._normalized[item_id].startswith(normalized_query, start)
+                    for start in _word_starts(self._normalized[item_id])
+                )
+            ]
+
+        best = heapq.nsmallest(
+            limit,
+            candidates,
+            key=lambda item_id: (
+                not self._normalized[item_id].startswith(normalized_query),
+                len(self._normalized[item_id]),
+                self._normalized[item_id],
+                item_id,
+            ),
+        )
+        return [(item_id, self._names[item_id]) for item_id in best]
+
+
+class TypeaheadIndex:
+    """
+    In-process typeahead index used when the database has no trigram support (SQLite/dev).
+
+    The tries are loaded from the database on first use and then kept current by the
+    movie write endpoints through `add`/`remove`. Until loaded, updates are ignored
+    (or queued while a load is in flight), since the load reads the committed state anyway.
+    """
+
+    def __init__(self) -> None:
+        self._tries: Dict[str, PrefixTrie] = {kind: PrefixTrie() for kind in TYPEAHEAD_MODELS}
+        self._loaded = False
+        self._loading = False
+        self._pending: List[Tuple[str, str, Sequence]] = []
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    async def ensure_loaded(self, session: AsyncSession) -> None:
+        if self._loaded:
+            return
+
+        async with self._lock:
+            if self._loaded:
+                return
+
+            self._loading = True
+            try:
+                tries = {kind: PrefixTrie() for kind in TYPEAHEAD_MODELS}
+                for kind, model in TYPEAHEAD_MODELS.items():
+                    result = await session.execute(select(model.id, model.name))
+                    for item_id, name in result:
+                        tries[kind].add(item_id, name)
+
+                self._tries = tries
+                self._loaded = True
+                for operation, kind, payload in self._pending:
+                    self._apply(operation, kind, payload)
+            finally:
+                self._loading = False
+                self._pending.clear()
+
+    def _apply(self, operation: str, kind: str, payload: Sequence) -> None:
+        trie = self._tries[kind]
+        if operation == "add":
+            for item_id, name in payload:
+                trie.add(item_id, name)
+        else:
+            for item_id in payload:
+                trie.remove(item_id)
+
+    def _submit(self, operation: str, kind: str, payload: Sequence) -> None:
+        if self._loaded:
+            self._apply(operation, kind, payload)
+        elif self._loading:
+            self._pending.append((operation, kind, payload))
+
+    def add(self, kind: str, items: Iterable[TypeaheadMatch]) -> None:
+        """
+        Add or rename `(id, name)` entries of the given kind.
+        """
+        self._submit("add", kind, list(items))
+
+    def remove(self, kind: str, item_ids: Iterable[int]) -> None:
+        self._submit("remove", kind, list(item_ids))
+
+    def add_movie(self, movie: MovieModel) -> None:
+        """
+        Index a movie title together with its (possibly new) genres, actors and directors.
+
+        The relationships must already be loaded.
+        """
+        self.add("movies", [(movie.id, movie.name)])
+        self.add("genres", [(genre.id, genre.name) for genre in movie.genres])
+        self.add("actors", [(actor.id, actor.name) for actor in movie.actors])
+        self.add("directors", [(director.id, director.name) for director in movie.directors])
+
+    def search(self, query: str, limit: int, kinds: Iterable[str]) -> Dict[str, List[TypeaheadMatch]]:
+        return {kind: self._tries[kind].search(query, limit) for kind in kinds}
+
+
+typeahead_index = TypeaheadIndex()
+
+
+async def _search_postgresql(
+        session: AsyncSession,
+        query: str,
+        limit: int,
+        kinds: Sequence[str],
+) -> Dict[str, List[TypeaheadMatch]]:
+    """
+    Run one UNION ALL round trip with a top-N query per kind.
+
+    `ILIKE '%query%'` is served by the `gin_trgm_ops` indexes; prefix matches rank
+    first, then trigram similarity.
+    """
+    parts = []
+    for kind in kinds:
+        model = TYPEAHEAD_MODELS[kind]
+        ranked = (
+            select(model.id, model.name)
+            .where(model.name.icontains(query, autoescape=True))
+            .order_by(
+                case((model.name.istartswith(query, autoescape=True), 0), else_=1),
+                func.similarity(model.name, query).desc(),
+                model.name,
+            )
+            .limit(limit)
+            .subquery()
+        )
+        parts.append(select(literal(kind).label("kind"), ranked.c.id, ranked.c.name))
+
+    results: Dict[str, List[TypeaheadMatch]] = {kind: [] for kind in kinds}
+    rows = await session.execute(union_all(*parts))
+    for kind, item_id, name in rows:
+        results[kind].append((item_id, name))
+    return results
+
+
+async def typeahead_search(
+        session: AsyncSession,
+        index: TypeaheadIndex,
+        query: str,
+        limit: int,
+        kinds: Optional[Sequence[str]] = None,
+) -> Dict[str, List[TypeaheadMatch]]:
+    """
+    Return the top `limit` names per kind matching `query`.
+
+    PostgreSQL answers from the trigram indexes; other backends use the in-process trie index.
+
+    :param session: The async database session.
+    :param index: The in-process index (loaded on first use when needed).
+    :param query: The prefix or substring typed by the user.
+    :param limit: Maximum number of matches per kind.
+    :param kinds: Subset of `TYPEAHEAD_MODELS` keys, or None for all of them.
+    :return: A mapping of kind to `(id, name)` pairs, best match first.
+    """
+    kinds = list(kinds or TYPEAHEAD_MODELS)
+
+    if is_postgresql(session):
+        return await _search_postgresql(session, query, limit, kinds)
+
+    await index.ensure_loaded(session)
+    return index.search(query, limit, kinds)
@@ -1,7 +1,9 @@
 from cinema.exceptions.security import (
     BaseSecurityError,
     InvalidTokenError,
-    TokenExpiredError
+    TokenExpiredError,
+    TokenRevokedError,
+    PasswordHasherBusyError
 )
 from cinema.exceptions.email import BaseEmailError
 from cinema.exceptions.storage import (
@@ -12,3 +14,7 @@ from cinema.exceptions.storage import (
     S3FileNotFoundError,
     S3PermissionError
 )
+from cinema.exceptions.pagination import (
+    BasePaginationError,
+    InvalidCursorError
+)
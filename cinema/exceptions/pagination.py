@@ -0,0 +1,14 @@
+class BasePaginationError(Exception):
+    """Base class for all pagination-related errors."""
+
+    def __init__(self, message=None):
+        if message is None:
+            message = "A pagination error occurred."
+        super().__init__(message)
+
+
+class InvalidCursorError(BasePaginationError):
+    """Raised when a pagination cursor cannot be decoded or does not match the query."""
+
+    def __init__(self, message="Invalid cursor."):
+        super().__init__(message)
@@ -19,3 +19,17 @@ class InvalidTokenError(BaseSecurityError):
 
     def __init__(self, message="Invalid token."):
         super().__init__(message)
+
+
+class TokenRevokedError(BaseSecurityError):
+    """Raised when a token was issued before the user's tokens were revoked."""
+
+    def __init__(self, message="Token has been revoked."):
+        super().__init__(message)
+
+
+class PasswordHasherBusyError(BaseSecurityError):
+    """Raised when the password hashing pool has no room for another job."""
+
+    def __init__(self, message="Too many password operations in progress. Try again later."):
+        super().__init__(message)
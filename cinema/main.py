@@ -1,4 +1,16 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from cinema.config.services import ServiceContainer
+from cinema.config.settings import get_settings
+from cinema.database import engine
+from cinema.database.pool import InstrumentedAsyncQueuePool, log_pool_metrics
+from cinema.exceptions import PasswordHasherBusyError
+from cinema.security.passwords import log_password_hasher_metrics, password_hasher
 
 from cinema.routes import (
     movie_router,
@@ -7,13 +19,59 @@ from cinema.routes import (
     movies_comments_router,
     movies_favourites_router,
     movies_ratings_router,
-    movies_reactions_router
+    movies_reactions_router,
+    movies_typeahead_router,
+    movies_bulk_router
 )
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Build and open the worker's services once at startup and start the periodic email outbox drain
+    and the connection pool and password hasher metrics logs; at shutdown, stop them, close the
+    services' connections and stop the password hashing threads.
+    """
+    settings = get_settings()
+    services = ServiceContainer.from_settings(settings)
+    app.state.services = services
+    await services.open()
+
+    background_tasks = []
+    if settings.EMAIL_OUTBOX_POLL_INTERVAL > 0:
+        background_tasks.append(asyncio.create_task(
+            services.email_outbox.run(services.email_sender, settings.EMAIL_OUTBOX_POLL_INTERVAL)
+        ))
+    if settings.DB_POOL_METRICS_INTERVAL > 0 and isinstance(engine.pool, InstrumentedAsyncQueuePool):
+        background_tasks.append(asyncio.create_task(
+            log_pool_metrics(engine.pool, settings.DB_POOL_METRICS_INTERVAL)
+        ))
+    if settings.PASSWORD_HASHER_METRICS_INTERVAL > 0:
+        background_tasks.append(asyncio.create_task(
+            log_password_hasher_metrics(password_hasher, settings.PASSWORD_HASHER_METRICS_INTERVAL)
+        ))
+    yield
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await services.aclose()
+    password_hasher.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 api_version_prefix = "/api/v1"
 
+
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusyError) -> JSONResponse:
+    """
+    Shed load with 503 when the password hashing pool is saturated; any account route may raise it.
+    """
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"})
+
+
 app.include_router(accounts_router, prefix=f"{api_version_prefix}/accounts", tags=["accounts"])
 app.include_router(profiles_router, prefix=f"{api_version_prefix}/profiles", tags=["profiles"])
 app.include_router(movie_router, prefix=f"{api_version_prefix}/cinema", tags=["cinema"])
@@ -21,3 +79,5 @@ app.include_router(movies_comments_router, prefix=f"{api_version_prefix}/cinema"
 app.include_router(movies_favourites_router, prefix=f"{api_version_prefix}/accounts", tags=["favourites"])
 app.include_router(movies_ratings_router, prefix=f"{api_version_prefix}/cinema", tags=["cinema"])
 app.include_router(movies_reactions_router, prefix=f"{api_version_prefix}/cinema", tags=["cinema"])
+app.include_router(movies_typeahead_router, prefix=f"{api_version_prefix}/cinema", tags=["cinema"])
+app.include_router(movies_bulk_router, prefix=f"{api_version_prefix}/cinema", tags=["cinema"])
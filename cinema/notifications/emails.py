@@ -3,10 +3,11 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
 import aiosmtplib
-from jinja2 import Environment, FileSystemLoader
 
 from cinema.exceptions import BaseEmailError
 from cinema.notifications.interfaces import EmailSenderInterface
+from cinema.notifications.smtp import SMTP_POOL_IDLE_TIMEOUT_SECONDS, SMTP_POOL_MAX_SIZE, SMTPConnectionPool
+from cinema.notifications.templates import TemplateRegistry
 
 
 class EmailSender(EmailSenderInterface):
@@ -23,6 +24,10 @@ class EmailSender(EmailSenderInterface):
         activation_complete_email_template_name: str,
         password_email_template_name: str,
         password_complete_email_template_name: str,
+        pool_max_size: int = SMTP_POOL_MAX_SIZE,
+        pool_idle_timeout: float = SMTP_POOL_IDLE_TIMEOUT_SECONDS,
+        template_auto_reload: bool = False,
+        template_bytecode_cache: bool = True,
     ):
         self._hostname = hostname
         self._port = port
@@ -34,7 +39,40 @@ class EmailSender(EmailSenderInterface):
         self._password_email_template_name = password_email_template_name
         self._password_complete_email_template_name = password_complete_email_template_name
 
-        self._env = Environment(loader=FileSystemLoader(template_dir))
+        self._templates = TemplateRegistry(
+            template_dir,
+            [
+                activation_email_template_name,
+                activation_complete_email_template_name,
+                password_email_template_name,
+                password_complete_email_template_name,
+            ],
+            auto_reload=template_auto_reload,
+            bytecode_cache=template_bytecode_cache,
+        )
+        self._pool = SMTPConnectionPool(
+            hostname=hostname,
+            port=port,
+            username=email,
+            password=password,
+            use_tls=use_tls,
+            max_size=pool_max_size,
+            idle_timeout=pool_idle_timeout,
+        )
+
+    @property
+    def pool(self) -> SMTPConnectionPool:
+        return self._pool
+
+    @property
+    def templates(self) -> TemplateRegistry:
+        return self._templates
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled SMTP connections.
+        """
+        await self._pool.aclose()
 
     async def _send_email(self, recipient: str, subject: str, html_content: str) -> None:
         """
@@ -56,14 +94,7 @@ class EmailSender(EmailSenderInterface):
         message.attach(MIMEText(html_content, "html"))
 
         try:
-            smtp = aiosmtplib.SMTP(hostname=self._hostname, port=self._port, start_tls=self._use_tls)
-            await smtp.connect()
-            if self._use_tls:
-                await smtp.starttls()
-            if self._email and self._password:
-                await smtp.login(self._email, self._password)
-            await smtp.sendmail(sender, [recipient], message.as_string())
-            await smtp.quit()
+            await self._pool.sendmail(sender, [recipient], message.as_string())
         except aiosmtplib.SMTPException as error:
             logging.error(f"Failed to send email to {recipient}: {error}")
             raise BaseEmailError(f"Failed to send email to {recipient}: {error}")
@@ -76,7 +107,7 @@ class EmailSender(EmailSenderInterface):
             email (str): The recipient's email address.
             activation_link (str): The activation link to be included in the email.
         """
-        template = self._env.get_template(self._activation_email_template_name)
+        template = self._templates.get(self._activation_email_template_name)
         html_content = template.render(email=email, activation_link=activation_link)
         subject = "Account Activation"
         await self._send_email(email, subject, html_content)
@@ -89,7 +120,7 @@ class EmailSender(EmailSenderInterface):
             email (str): The recipient's email address.
             login_link (str): The login link to be included in the email.
         """
-        template = self._env.get_template(self._activation_complete_email_template_name)
+        template = self._templates.get(self._activation_complete_email_template_name)
         html_content = template.render(email=email, login_link=login_link)
         subject = "Account Activated Successfully"
         await self._send_email(email, subject, html_content)
@@ -102,7 +133,7 @@ class EmailSender(EmailSenderInterface):
             email (str): The recipient's email address.
             reset_link (str): The reset link to be included in the email.
         """
-        template = self._env.get_template(self._password_email_template_name)
+        template = self._templates.get(self._password_email_template_name)
         html_content = template.render(email=email, reset_link=reset_link)
         subject = "Password Reset Request"
         await self._send_email(email, subject, html_content)
@@ -115,7 +146,7 @@ class EmailSender(EmailSenderInterface):
             email (str): The recipient's email address.
             login_link (str): The login link to be included in the email.
         """
-        template = self._env.get_template(self._password_complete_email_template_name)
+        template = self._templates.get(self._password_complete_email_template_name)
         html_content = template.render(email=email, login_link=login_link)
         subject = "Your Password Has Been Successfully Reset"
         await self._send_email(email, subject, html_content)
@@ -46,3 +46,9 @@ class EmailSenderInterface(ABC):
             login_link (str): The login link to include in the email.
         """
         pass
+
+    async def aclose(self) -> None:
+        """
+        Release the sender's resources, such as open SMTP connections; a no-op by default.
+        """
+        return None
@@ -0,0 +1,187 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import AsyncContextManager, Callable, List, Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cinema.database.models.accounts import EmailKindEnum, EmailOutboxModel
+from cinema.notifications.interfaces import EmailSenderInterface
+
+# Number of emails claimed from the outbox at a time.
+EMAIL_OUTBOX_BATCH_SIZE = 50
+
+# Number of emails of a batch sent at the same time; keep it at or below the SMTP pool size.
+EMAIL_OUTBOX_CONCURRENCY = 4
+
+# After this many failed attempts an email is left in the outbox, and no longer retried.
+EMAIL_OUTBOX_MAX_ATTEMPTS = 8
+
+# Delay before the first retry, doubled after each further failure up to the maximum.
+EMAIL_OUTBOX_RETRY_BACKOFF_SECONDS = 30.0
+EMAIL_OUTBOX_MAX_RETRY_BACKOFF_SECONDS = 3600.0
+
+# A claimed email becomes due again after this long, in case its dispatcher died while sending it.
+EMAIL_OUTBOX_LEASE_SECONDS = 300.0
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+def enqueue_email(db: AsyncSession, kind: EmailKindEnum, recipient: str, link: str) -> None:
+    """
+    Add an email to the outbox; it is sent once the session's transaction is committed.
+
+    Args:
+        db (AsyncSession): The session of the change the email announces.
+        kind (EmailKindEnum): Which account email to send.
+        recipient (str): The recipient's email address.
+        link (str): The link included in the email.
+    """
+    db.add(EmailOutboxModel(kind=kind, recipient=recipient, link=link))
+
+
+async def send_outbox_email(
+        email_sender: EmailSenderInterface,
+        kind: EmailKindEnum,
+        recipient: str,
+        link: str,
+) -> None:
+    """
+    Send an outbox email with the sender method matching its kind.
+    """
+    if kind == EmailKindEnum.ACTIVATION:
+        await email_sender.send_activation_email(recipient, link)
+    elif kind == EmailKindEnum.ACTIVATION_COMPLETE:
+        await email_sender.send_activation_complete_email(recipient, link)
+    elif kind == EmailKindEnum.PASSWORD_RESET:
+        await email_sender.send_password_reset_email(recipient, link)
+    else:
+        await email_sender.send_password_reset_complete_email(recipient, link)
+
+
+class EmailOutboxDispatcher:
+    """
+    Delivers the emails of the `email_outbox` table.
+
+    The account routes only write outbox rows in their own transaction, so a request never
+    waits on SMTP and an email is never lost (or sent) for a change that is rolled back.
+    Emails are then sent by `dispatch_pending`, scheduled after each such request and run
+    periodically by `run` to pick up retries and anything left behind by a crashed worker.
+
+    Due emails are claimed in batches by pushing their `next_attempt_at` past a lease, with
+    `FOR UPDATE SKIP LOCKED` on PostgreSQL, so several workers can drain the outbox side by
+    side without sending an email twice. A failed email is retried with exponential backoff
+    until `max_attempts`; delivery is at least once.
+    """
+
+    def __init__(
+            self,
+            session_factory: SessionFactory,
+            batch_size: int = EMAIL_OUTBOX_BATCH_SIZE,
+            concurrency: int = EMAIL_OUTBOX_CONCURRENCY,
+            max_attempts: int = EMAIL_OUTBOX_MAX_ATTEMPTS,
+            retry_backoff: float = EMAIL_OUTBOX_RETRY_BACKOFF_SECONDS,
+            max_retry_backoff: float = EMAIL_OUTBOX_MAX_RETRY_BACKOFF_SECONDS,
+            lease: float = EMAIL_OUTBOX_LEASE_SECONDS,
+    ) -> None:
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._concurrency = concurrency
+        self._max_attempts = max_attempts
+        self._retry_backoff = retry_backoff
+        self._max_retry_backoff = max_retry_backoff
+        self._lease = lease
+
+    def retry_delay(self, attempts: int) -> timedelta:
+        """
+        Delay before the next attempt of an email that has failed `attempts` times.
+        """
+        return timedelta(seconds=min(self._retry_backoff * 2 ** (attempts - 1), self._max_retry_backoff))
+
+    async def dispatch_pending(self, email_sender: EmailSenderInterface) -> int:
+        """
+        Send the due emails, batch after batch, until none is left.
+
+        Args:
+            email_sender (EmailSenderInterface): The sender to deliver the emails with.
+
+        Returns:
+            int: The number of emails sent.
+        """
+        sent = 0
+        while True:
+            batch = await self._claim()
+            if not batch:
+                return sent
+            slots = asyncio.Semaphore(self._concurrency)
+
+            async def deliver(email: EmailOutboxModel) -> Optional[str]:
+                async with slots:
+                    try:
+                        await send_outbox_email(email_sender, email.kind, email.recipient, email.link)
+                    except Exception as error:
+                        return str(error) or type(error).__name__
+                    return None
+
+            errors = await asyncio.gather(*(deliver(email) for email in batch))
+            sent += await self._record(batch, errors)
+            if len(batch) < self._batch_size:
+                return sent
+
+    async def run(self, email_sender: EmailSenderInterface, poll_interval: float) -> None:
+        """
+        Dispatch the due emails every `poll_interval` seconds until cancelled.
+        """
+        while True:
+            try:
+                await self.dispatch_pending(email_sender)
+            except Exception:
+                logging.exception("Email outbox dispatch failed")
+            await asyncio.sleep(poll_interval)
+
+    async def _claim(self) -> List[EmailOutboxModel]:
+        now = datetime.now(timezone.utc)
+        due = (
+            select(EmailOutboxModel.id)
+            .where(EmailOutboxModel.next_attempt_at <= now, EmailOutboxModel.attempts < self._max_attempts)
+            .order_by(EmailOutboxModel.id)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(due.scalar_subquery()), EmailOutboxModel.next_attempt_at <= now)
+            .values(next_attempt_at=now + timedelta(seconds=self._lease))
+            .returning(EmailOutboxModel)
+            .execution_options(synchronize_session=False)
+        )
+        async with self._session_factory() as db:
+            batch = list((await db.execute(stmt)).scalars())
+            await db.commit()
+        return batch
+
+    async def _record(self, batch: List[EmailOutboxModel], errors: List[Optional[str]]) -> int:
+        sent_ids = [email.id for email, error in zip(batch, errors) if error is None]
+        now = datetime.now(timezone.utc)
+        async with self._session_factory() as db:
+            if sent_ids:
+                await db.execute(
+                    delete(EmailOutboxModel)
+                    .where(EmailOutboxModel.id.in_(sent_ids))
+                    .execution_options(synchronize_session=False)
+                )
+            for email, error in zip(batch, errors):
+                if error is None:
+                    continue
+                attempts = email.attempts + 1
+                if attempts >= self._max_attempts:
+                    logging.error(f"Giving up on outbox email {email.id} after {attempts} attempts: {error}")
+                await db.execute(
+                    update(EmailOutboxModel)
+                    .where(EmailOutboxModel.id == email.id)
+                    .values(attempts=attempts, next_attempt_at=now + self.retry_delay(attempts), last_error=error)
+                    .execution_options(synchronize_session=False)
+                )
+            await db.commit()
+        return len(sent_ids)
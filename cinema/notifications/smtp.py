@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional, Tuple
+
+import aiosmtplib
+
+# Maximum number of connections held open to the relay, busy and idle together; callers
+# beyond it wait for a connection to be released.
+SMTP_POOL_MAX_SIZE = 4
+
+# An idle connection older than this is closed instead of reused. Keep it below the relay's
+# own idle timeout (Postfix drops idle clients after 300 seconds by default).
+SMTP_POOL_IDLE_TIMEOUT_SECONDS = 60.0
+
+# An idle connection older than this is checked with NOOP before it is reused.
+SMTP_POOL_NOOP_AFTER_SECONDS = 5.0
+
+# Errors meaning the connection itself is gone, as opposed to the relay rejecting a message.
+CONNECTION_ERRORS = (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPConnectError, ConnectionError)
+
+
+@dataclass
+class _PooledConnection:
+    smtp: aiosmtplib.SMTP
+    last_used: float
+
+
+class SMTPConnectionPool:
+    """
+    Pool of persistent, authenticated connections to one SMTP relay.
+
+    Opening a connection costs a TCP handshake, EHLO, possibly STARTTLS and a login; the
+    pool pays it once per connection and then sends any number of messages over it.
+
+    - At most `max_size` connections exist at a time.
+    - Idle connections are reused most recently used first, so a quiet period lets the
+      older ones reach `idle_timeout`, after which they are closed.
+    - A connection idle for more than `noop_after` seconds is probed with NOOP first.
+    - If a reused connection turns out to be dropped by the relay, the message is sent once
+      more over a fresh connection.
+    """
+
+    def __init__(
+            self,
+            hostname: str,
+            port: int,
+            username: Optional[str] = None,
+            password: Optional[str] = None,
+            use_tls: bool = False,
+            max_size: int = SMTP_POOL_MAX_SIZE,
+            idle_timeout: float = SMTP_POOL_IDLE_TIMEOUT_SECONDS,
+            noop_after: float = SMTP_POOL_NOOP_AFTER_SECONDS,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._hostname = hostname
+        self._port = port
+        self._username = username
+        self._password = password
+        self._use_tls = use_tls
+        self._idle_timeout = idle_timeout
+        self._noop_after = noop_after
+        self._idle: Deque[_PooledConnection] = deque()
+        self._slots = asyncio.Semaphore(max_size)
+        self.connections_opened = 0
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    async def sendmail(self, sender: str, recipients: List[str], message: str) -> None:
+        """
+        Send a message over a pooled connection.
+
+        Raises:
+            aiosmtplib.SMTPException: If the relay cannot be reached or rejects the message.
+        """
+        async with self._slots:
+            connection, reused = await self._acquire()
+            try:
+                await connection.smtp.sendmail(sender, recipients, message)
+            except CONNECTION_ERRORS as error:
+                self._discard(connection)
+                # A connection opened just now failing means the relay is the problem, not
+                # a stale connection; another handshake would only fail the same way.
+                if not reused:
+                    raise
+                logging.warning(f"SMTP connection to {self._hostname} lost, reconnecting: {error}")
+                connection = await self._connect()
+                try:
+                    await connection.smtp.sendmail(sender, recipients, message)
+                except BaseException:
+                    self._discard(connection)
+                    raise
+            except BaseException:
+                self._discard(connection)
+                raise
+            self._release(connection)
+
+    async def aclose(self) -> None:
+        """
+        Close the idle connections; call when the application shuts down.
+        """
+        while self._idle:
+            await self._close(self._idle.pop())
+
+    async def _acquire(self) -> Tuple[_PooledConnection, bool]:
+        """
+        Take an idle connection, or open one if none is usable; also tell whether it was reused.
+        """
+        while self._idle:
+            connection = self._idle.pop()
+            idle_for = time.monotonic() - connection.last_used
+            if idle_for > self._idle_timeout or not connection.smtp.is_connected:
+                await self._close(connection)
+                continue
+            if idle_for > self._noop_after:
+                try:
+                    await connection.smtp.noop()
+                except aiosmtplib.SMTPException:
+                    self._discard(connection)
+                    continue
+            return connection, True
+        return await self._connect(), False
+
+    async def _connect(self) -> _PooledConnection:
+        smtp = aiosmtplib.SMTP(hostname=self._hostname, port=self._port, start_tls=False)
+        await smtp.connect()
+        try:
+            if self._use_tls:
+                await smtp.starttls()
+            if self._username and self._password:
+                await smtp.login(self._username, self._password)
+        except BaseException:
+            smtp.close()
+            raise
+        self.connections_opened += 1
+        return _PooledConnection(smtp=smtp, last_used=time.monotonic())
+
+    def _release(self, connection: _PooledConnection) -> None:
+        now = time.monotonic()
+        connection.last_used = now
+        self._idle.append(connection)
+        # The least recently used connections sit at the left; drop the ones past their timeout.
+        while self._idle and now - self._idle[0].last_used > self._idle_timeout:
+            self._discard(self._idle.popleft())
+
+    @staticmethod
+    def _discard(connection: _PooledConnection) -> None:
+        connection.smtp.close()
+
+    @staticmethod
+    async def _close(connection: _PooledConnection) -> None:
+        try:
+            await connection.smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            connection.smtp.close()
@@ -0,0 +1,52 @@
+from typing import Dict, Iterable, Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+
+class TemplateRegistry:
+    """
+    The email templates, loaded and compiled once when the registry is built.
+
+    Rendering then goes straight to the compiled `Template`, with no loader lookup or
+    up-to-date check per email. With `auto_reload` (for development), every render goes
+    through the environment instead, so edited templates are picked up.
+
+    Compiled templates are also written to a Jinja bytecode cache, which spares later
+    processes (other workers, restarts) the parsing and compiling. Without a
+    `bytecode_cache_dir`, Jinja's private per-user temporary directory is used.
+    """
+
+    def __init__(
+            self,
+            template_dir: str,
+            template_names: Iterable[str],
+            auto_reload: bool = False,
+            bytecode_cache: bool = True,
+            bytecode_cache_dir: Optional[str] = None,
+    ) -> None:
+        self._auto_reload = auto_reload
+        self._env = Environment(
+            loader=FileSystemLoader(template_dir),
+            auto_reload=auto_reload,
+            bytecode_cache=FileSystemBytecodeCache(bytecode_cache_dir) if bytecode_cache else None,
+        )
+        self._templates: Dict[str, Template] = {name: self._env.get_template(name) for name in template_names}
+
+    def get(self, name: str) -> Template:
+        """
+        Return the compiled template `name`.
+
+        Raises:
+            KeyError: If the template was not registered.
+        """
+        if self._auto_reload:
+            if name not in self._templates:
+                raise KeyError(name)
+            return self._env.get_template(name)
+        return self._templates[name]
+
+    def render(self, name: str, **context) -> str:
+        """
+        Render the template `name` with `context`.
+        """
+        return self.get(name).render(**context)
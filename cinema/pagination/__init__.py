@@ -0,0 +1,5 @@
+from cinema.pagination.cursors import (
+    CursorPayload,
+    encode_cursor,
+    decode_cursor
+)
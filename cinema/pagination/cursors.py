@@ -0,0 +1,76 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict
+
+from cinema.exceptions import InvalidCursorError
+
+
+# Converts the serialized sort value back to the Python type of the sort column.
+CURSOR_VALUE_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "name": str,
+    "price": Decimal,
+    "budget": Decimal,
+    "duration": int,
+}
+
+CURSOR_SORT_ORDERS = ("asc", "desc")
+
+
+@dataclass(frozen=True)
+class CursorPayload:
+    """
+    Decoded keyset position: the active sort key, its direction and the last seen `(value, id)` pair.
+    """
+    sort_by: str
+    sort_order: str
+    value: Any
+    last_id: int
+
+
+def encode_cursor(sort_by: str, sort_order: str, value: Any, last_id: int) -> str:
+    """
+    Build an opaque cursor pointing right after the given `(value, id)` position.
+
+    The sort key and direction are embedded so the next page is always
+    requested with the same ordering the cursor was produced with.
+
+    :param sort_by: The name of the sort key (name/price/budget/duration).
+    :param sort_order: The sort direction (asc/desc).
+    :param value: The sort key value of the last item on the page.
+    :param last_id: The ID of the last item on the page.
+    :return: A URL-safe cursor string.
+    """
+    raw = json.dumps(
+        {"s": sort_by, "o": sort_order, "v": str(value), "id": last_id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> CursorPayload:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    :param cursor: The opaque cursor string received from the client.
+    :return: The decoded keyset position.
+    :raises InvalidCursorError: If the cursor is malformed or refers to an unknown sort key.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        sort_by = data["s"]
+        sort_order = data["o"]
+        parser = CURSOR_VALUE_PARSERS[sort_by]
+        if sort_order not in CURSOR_SORT_ORDERS:
+            raise InvalidCursorError
+        return CursorPayload(
+            sort_by=sort_by,
+            sort_order=sort_order,
+            value=parser(data["v"]),
+            last_id=int(data["id"]),
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError, InvalidOperation):
+        raise InvalidCursorError
@@ -5,3 +5,5 @@ from cinema.routes.movies.movies_comments import router as movies_comments_route
 from cinema.routes.movies.movies_favourites import router as movies_favourites_router
 from cinema.routes.movies.movies_ratings import router as movies_ratings_router
 from cinema.routes.movies.movies_reactions import router as movies_reactions_router
+from cinema.routes.movies.movies_typeahead import router as movies_typeahead_router
+from cinema.routes.movies.movies_bulk import router as movies_bulk_router
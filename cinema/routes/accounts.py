@@ -1,24 +1,32 @@
 from datetime import datetime, timezone, timedelta
 from typing import cast
 
-from fastapi import APIRouter, Depends, status, HTTPException
-from sqlalchemy import select, delete
+from fastapi import APIRouter, BackgroundTasks, Depends, status, HTTPException
+from sqlalchemy import select, delete, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from cinema.config.dependencies import get_jwt_auth_manager, BaseAppSettings, get_accounts_email_notificator
+from cinema.cache import Principal, PrincipalCache
+from cinema.config.dependencies import (
+    get_jwt_auth_manager,
+    BaseAppSettings,
+    get_accounts_email_notificator,
+    get_email_outbox
+)
 from cinema.config.settings import get_settings
 from cinema.database.models.accounts import (
     UserModel,
     UserGroupModel,
     UserGroupEnum,
+    EmailKindEnum,
     ActivationTokenModel,
     PasswordResetTokenModel,
     RefreshTokenModel
 )
-from cinema.exceptions import BaseSecurityError
+from cinema.exceptions import BaseSecurityError, PasswordHasherBusyError
 from cinema.notifications.interfaces import EmailSenderInterface
+from cinema.notifications.outbox import EmailOutboxDispatcher, enqueue_email
 from cinema.schemas.accounts import (
     UserRegistrationRequestSchema,
     UserRegistrationResponseSchema,
@@ -32,15 +40,52 @@ from cinema.schemas.accounts import (
     TokenRefreshResponseSchema
 )
 from cinema.security.interfaces import JWTAuthManagerInterface
+from cinema.security.passwords import PasswordHasher
 
-from cinema.config.dependencies import user_is_admin, get_user
+from cinema.config.dependencies import user_is_admin, get_user, get_password_hasher, get_principal_cache
 from cinema.schemas.accounts import PasswordChangeRequestSchema, UserLogoutRequestSchema, ChangeUserGroupRequestSchema
-from cinema.database import get_db
+from cinema.database import get_db, get_db_contextmanager
 
 
 router = APIRouter()
 
 
+def access_token_claims(user: UserModel) -> dict:
+    """
+    Claims of a new access token: the user id, plus the group and token version that let
+    `get_principal` authorize the request without reading the user's group.
+
+    Args:
+        user (UserModel): The user, with their group loaded.
+
+    Returns:
+        dict: The access token payload.
+    """
+    return {"user_id": user.id, "group": user.group.name.value, "token_version": user.token_version}
+
+
+async def _rehash_password(user_id: int, raw_password: str, old_hash: str, hasher: PasswordHasher) -> None:
+    """
+    Store a fresh hash of a just-verified password at the configured cost.
+
+    The update only applies while the stored hash is still the verified one, so a password
+    change that lands in between is never overwritten. A saturated hasher skips the re-hash;
+    the next login tries again.
+    """
+    try:
+        new_hash = await hasher.hash(raw_password)
+    except PasswordHasherBusyError:
+        return
+
+    async with get_db_contextmanager() as db:
+        await db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id, UserModel.hashed_password == old_hash)
+            .values({UserModel.hashed_password: new_hash})
+        )
+        await db.commit()
+
+
 @router.post(
     "/register/",
     response_model=UserRegistrationResponseSchema,
@@ -68,12 +113,25 @@ router = APIRouter()
                 }
             },
         },
+        503: {
+            "description": "Service Unavailable - Too many password operations in progress.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many password operations in progress. Try again later."
+                    }
+                }
+            },
+        },
     }
 )
 async def register_user(
         user_data: UserRegistrationRequestSchema,
+        background_tasks: BackgroundTasks,
         db: AsyncSession = Depends(get_db),
         email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator),
+        outbox: EmailOutboxDispatcher = Depends(get_email_outbox),
+        hasher: PasswordHasher = Depends(get_password_hasher),
 ) -> UserRegistrationResponseSchema:
     """
     Endpoint for user registration.
@@ -81,11 +139,15 @@ async def register_user(
     Registers a new user, hashes their password, and assigns them to the default user group.
     If a user with the same email already exists, an HTTP 409 error is raised.
     In case of any unexpected issues during the creation process, an HTTP 500 error is returned.
+    The activation email is queued in the email outbox with the user and sent after the response.
 
     Args:
         user_data (UserRegistrationRequestSchema): The registration details including email and password.
+        background_tasks (BackgroundTasks): Drains the email outbox after the response is sent.
         db (AsyncSession): The asynchronous database session.
         email_sender (EmailSenderInterface): The asynchronous email sender.
+        outbox (EmailOutboxDispatcher): The email outbox dispatcher.
+        hasher (PasswordHasher): The password hasher; hashing runs off the event loop.
 
     Returns:
         UserRegistrationResponseSchema: The newly created user's details.
@@ -94,6 +156,7 @@ async def register_user(
         HTTPException:
             - 409 Conflict if a user with the same email exists.
             - 500 Internal Server Error if an error occurs during user creation.
+            - 503 Service Unavailable if the password hasher is saturated.
     """
     stmt = select(UserModel).where(UserModel.email == user_data.email)
     result = await db.execute(stmt)
@@ -113,12 +176,10 @@ async def register_user(
             detail="Default user group not found."
         )
 
+    new_user = UserModel(email=str(user_data.email), group_id=user_group.id)
+    await new_user.set_password_async(user_data.password, hasher)
+
     try:
-        new_user = UserModel.create(
-            email=str(user_data.email),
-            raw_password=user_data.password,
-            group_id=user_group.id,
-        )
         db.add(new_user)
         await db.flush()
 
@@ -127,6 +188,13 @@ async def register_user(
             expires_at=datetime.now(timezone.utc) + timedelta(hours=24),
         )
         db.add(activation_token)
+        await db.flush()
+
+        activation_link = (f""
+                           f"http://127.0.0.1/accounts/activate/"
+                           f"?token={activation_token.token}&"
+                           f"email={new_user.email}")
+        enqueue_email(db, EmailKindEnum.ACTIVATION, new_user.email, activation_link)
 
         await db.commit()
         await db.refresh(new_user)
@@ -137,15 +205,7 @@ async def register_user(
             detail="An error occurred during user creation."
         ) from e
     else:
-        activation_link = (f""
-                           f"http://127.0.0.1/accounts/activate/"
-                           f"?token={activation_token.token}&"
-                           f"email={new_user.email}")
-
-        await email_sender.send_activation_email(
-            new_user.email,
-            activation_link
-        )
+        background_tasks.add_task(outbox.dispatch_pending, email_sender)
 
         return UserRegistrationResponseSchema.model_validate(new_user)
 
@@ -183,8 +243,11 @@ async def register_user(
 )
 async def activate_account(
         activation_data: UserActivationRequestSchema,
+        background_tasks: BackgroundTasks,
         db: AsyncSession = Depends(get_db),
         email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator),
+        outbox: EmailOutboxDispatcher = Depends(get_email_outbox),
+        principals: PrincipalCache = Depends(get_principal_cache),
 ) -> MessageResponseSchema:
     """
     Endpoint to activate a user's account.
@@ -193,11 +256,15 @@ async def activate_account(
     and that it has not expired. If the token is valid and the user's account is not already active,
     the user's account is activated and the activation token is deleted. If the token is invalid, expired,
     or if the account is already active, an HTTP 400 error is raised.
+    Emails are queued in the email outbox with the change and sent after the response.
 
     Args:
         activation_data (UserActivationRequestSchema): Contains the user's email and activation token.
+        background_tasks (BackgroundTasks): Drains the email outbox after the response is sent.
         db (AsyncSession): The asynchronous database session.
         email_sender (EmailSenderInterface): The asynchronous email sender.
+        outbox (EmailOutboxDispatcher): The email outbox dispatcher.
+        principals (PrincipalCache): The principal cache; the user's entry is invalidated.
 
     Returns:
         MessageResponseSchema: A response message confirming successful activation.
@@ -242,9 +309,15 @@ async def activate_account(
                 expires_at=datetime.now(timezone.utc) + timedelta(hours=24),
             )
             db.add(new_token)
+            await db.flush()
+
+            activation_link = (f""
+                               f"http://127.0.0.1/accounts/activate/"
+                               f"?token={new_token.token}&"
+                               f"email={user.email}")
+            enqueue_email(db, EmailKindEnum.ACTIVATION, user.email, activation_link)
 
             await db.commit()
-            await db.refresh(new_token)
         except SQLAlchemyError as e:
             await db.rollback()
             raise HTTPException(
@@ -252,28 +325,18 @@ async def activate_account(
                 detail="An error occurred during token creation."
             ) from e
         else:
-            activation_link = (f""
-                               f"http://127.0.0.1/accounts/activate/"
-                               f"?token={new_token.token}&"
-                               f"email={user.email}")
-
-            await email_sender.send_activation_email(
-                user.email,
-                activation_link
-            )
+            background_tasks.add_task(outbox.dispatch_pending, email_sender)
 
         return MessageResponseSchema(message="New activation token was sent to user.")
 
+    login_link = "http://127.0.0.1/accounts/login/"
+
     user.is_active = True
     await db.delete(token_record)
+    enqueue_email(db, EmailKindEnum.ACTIVATION_COMPLETE, str(activation_data.email), login_link)
     await db.commit()
-
-    login_link = "http://127.0.0.1/accounts/login/"
-
-    await email_sender.send_activation_complete_email(
-        str(activation_data.email),
-        login_link
-    )
+    principals.invalidate(user.id)
+    background_tasks.add_task(outbox.dispatch_pending, email_sender)
 
     return MessageResponseSchema(message="User account activated successfully.")
 
@@ -290,19 +353,24 @@ async def activate_account(
 )
 async def request_password_reset_token(
         data: PasswordResetRequestSchema,
+        background_tasks: BackgroundTasks,
         db: AsyncSession = Depends(get_db),
-        email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator)
+        email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator),
+        outbox: EmailOutboxDispatcher = Depends(get_email_outbox),
 ) -> MessageResponseSchema:
     """
     Endpoint to request a password reset token.
 
     If the user exists and is active, invalidates any existing password reset tokens and generates a new one.
     Always responds with a success message to avoid leaking user information.
+    The email is queued in the email outbox with the token and sent after the response.
 
     Args:
         data (PasswordResetRequestSchema): The request data containing the user's email.
+        background_tasks (BackgroundTasks): Drains the email outbox after the response is sent.
         db (AsyncSession): The asynchronous database session.
         email_sender (EmailSenderInterface): The asynchronous email sender.
+        outbox (EmailOutboxDispatcher): The email outbox dispatcher.
 
     Returns:
         MessageResponseSchema: A success message indicating that instructions will be sent.
@@ -318,16 +386,13 @@ async def request_password_reset_token(
 
     await db.execute(delete(PasswordResetTokenModel).where(PasswordResetTokenModel.user_id == user.id))
 
+    password_reset_complete_link = "http://127.0.0.1/accounts/password-reset-complete/"
+
     reset_token = PasswordResetTokenModel(user_id=cast(int, user.id))
     db.add(reset_token)
+    enqueue_email(db, EmailKindEnum.PASSWORD_RESET, str(data.email), password_reset_complete_link)
     await db.commit()
-
-    password_reset_complete_link = "http://127.0.0.1/accounts/password-reset-complete/"
-
-    await email_sender.send_password_reset_email(
-        str(data.email),
-        password_reset_complete_link
-    )
+    background_tasks.add_task(outbox.dispatch_pending, email_sender)
 
     return MessageResponseSchema(
         message="If you are registered, you will receive an email with instructions."
@@ -375,24 +440,43 @@ async def request_password_reset_token(
                 }
             },
         },
+        503: {
+            "description": "Service Unavailable - Too many password operations in progress.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many password operations in progress. Try again later."
+                    }
+                }
+            },
+        },
     },
 )
 async def reset_password(
         data: PasswordResetCompleteRequestSchema,
+        background_tasks: BackgroundTasks,
         db: AsyncSession = Depends(get_db),
-        email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator)
+        email_sender: EmailSenderInterface = Depends(get_accounts_email_notificator),
+        outbox: EmailOutboxDispatcher = Depends(get_email_outbox),
+        hasher: PasswordHasher = Depends(get_password_hasher),
+        principals: PrincipalCache = Depends(get_principal_cache),
 ) -> MessageResponseSchema:
     """
     Endpoint for resetting a user's password.
 
     Validates the token and updates the user's password if the token is valid and not expired.
     Deletes the token after a successful password reset.
+    The confirmation email is queued in the email outbox with the change and sent after the response.
 
     Args:
         data (PasswordResetCompleteRequestSchema): The request data containing the user's email,
          token, and new password.
+        background_tasks (BackgroundTasks): Drains the email outbox after the response is sent.
         db (AsyncSession): The asynchronous database session.
         email_sender (EmailSenderInterface): The asynchronous email sender.
+        outbox (EmailOutboxDispatcher): The email outbox dispatcher.
+        hasher (PasswordHasher): The password hasher; hashing runs off the event loop.
+        principals (PrincipalCache): The principal cache; the user's entry is invalidated.
 
     Returns:
         MessageResponseSchema: A response message indicating successful password reset.
@@ -401,6 +485,7 @@ async def reset_password(
         HTTPException:
             - 400 Bad Request if the email or token is invalid, or the token has expired.
             - 500 Internal Server Error if an error occurs during the password reset process.
+            - 503 Service Unavailable if the password hasher is saturated.
     """
     stmt = select(UserModel).filter_by(email=data.email)
     result = await db.execute(stmt)
@@ -433,9 +518,14 @@ async def reset_password(
             detail="Invalid email or token."
         )
 
+    await user.set_password_async(data.password, hasher)
+    user.revoke_access_tokens()
+
+    login_link = "http://127.0.0.1/accounts/login/"
+
     try:
-        user.password = data.password
         await db.run_sync(lambda s: s.delete(token_record))
+        enqueue_email(db, EmailKindEnum.PASSWORD_RESET_COMPLETE, str(data.email), login_link)
         await db.commit()
     except SQLAlchemyError:
         await db.rollback()
@@ -443,13 +533,8 @@ async def reset_password(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while resetting the password."
         )
-
-    login_link = "http://127.0.0.1/accounts/login/"
-
-    await email_sender.send_password_reset_complete_email(
-        str(data.email),
-        login_link
-    )
+    principals.invalidate(user.id)
+    background_tasks.add_task(outbox.dispatch_pending, email_sender)
 
     return MessageResponseSchema(message="Password reset successfully.")
 
@@ -495,12 +580,24 @@ async def reset_password(
                 }
             },
         },
+        503: {
+            "description": "Service Unavailable - Too many password operations in progress.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many password operations in progress. Try again later."
+                    }
+                }
+            },
+        },
     },
 )
 async def change_password(
         data: PasswordChangeRequestSchema,
         db: AsyncSession = Depends(get_db),
-        user: UserModel = Depends(get_user)
+        user: UserModel = Depends(get_user),
+        hasher: PasswordHasher = Depends(get_password_hasher),
+        principals: PrincipalCache = Depends(get_principal_cache),
 ) -> MessageResponseSchema:
     """
     Endpoint for changing a user's password.
@@ -511,6 +608,8 @@ async def change_password(
         data (PasswordChangeRequestSchema): The request data containing user's email, old password
         and new password.
         db (AsyncSession): The asynchronous database session.
+        hasher (PasswordHasher): The password hasher; hashing runs off the event loop.
+        principals (PrincipalCache): The principal cache; the user's entry is invalidated.
 
     Returns:
         MessageResponseSchema: A response message indicating successful password change.
@@ -519,22 +618,25 @@ async def change_password(
         HTTPException:
             - 400 Bad Request if the email or password are invalid.
             - 500 Internal Server Error if an error occurs during the password change process.
+            - 503 Service Unavailable if the password hasher is saturated.
     """
 
-    if not user.is_active or not user.verify_password(data.password):
+    if not user.is_active or not await user.verify_password_async(data.password, hasher):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid email or password."
         )
 
-    if user.verify_password(data.new_password):
+    if await user.verify_password_async(data.new_password, hasher):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="New password must be different from old password."
         )
 
+    await user.set_password_async(data.new_password, hasher)
+    user.revoke_access_tokens()
+
     try:
-        user.password = data.new_password
         await db.commit()
     except SQLAlchemyError:
         await db.rollback()
@@ -542,6 +644,7 @@ async def change_password(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while changing the password."
         )
+    principals.invalidate(user.id)
 
     return MessageResponseSchema(message="Password changed successfully.")
 
@@ -583,25 +686,41 @@ async def change_password(
                 }
             },
         },
+        503: {
+            "description": "Service Unavailable - Too many password operations in progress.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many password operations in progress. Try again later."
+                    }
+                }
+            },
+        },
     },
 )
 async def login_user(
         login_data: UserLoginRequestSchema,
+        background_tasks: BackgroundTasks,
         db: AsyncSession = Depends(get_db),
         settings: BaseAppSettings = Depends(get_settings),
         jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
+        hasher: PasswordHasher = Depends(get_password_hasher),
 ) -> UserLoginResponseSchema:
     """
     Endpoint for user login.
 
     Authenticates a user using their email and password.
     If authentication is successful, creates a new refresh token and returns both access and refresh tokens.
+    A password hashed with another bcrypt cost than `BCRYPT_ROUNDS` is re-hashed in the background
+    after the response, so cost changes roll out without invalidating existing passwords.
 
     Args:
         login_data (UserLoginRequestSchema): The login credentials.
+        background_tasks (BackgroundTasks): Runs the re-hash after the response is sent.
         db (AsyncSession): The asynchronous database session.
         settings (BaseAppSettings): The application settings.
         jwt_manager (JWTAuthManagerInterface): The JWT authentication manager.
+        hasher (PasswordHasher): The password hasher; verification runs off the event loop.
 
     Returns:
         UserLoginResponseSchema: A response containing the access and refresh tokens.
@@ -611,12 +730,13 @@ async def login_user(
             - 401 Unauthorized if the email or password is invalid.
             - 403 Forbidden if the user account is not activated.
             - 500 Internal Server Error if an error occurs during token creation.
+            - 503 Service Unavailable if the password hasher is saturated.
     """
-    stmt = select(UserModel).filter_by(email=login_data.email)
+    stmt = select(UserModel).options(joinedload(UserModel.group)).filter_by(email=login_data.email)
     result = await db.execute(stmt)
     user = result.scalars().first()
 
-    if not user or not user.verify_password(login_data.password):
+    if not user or not await user.verify_password_async(login_data.password, hasher):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password.",
@@ -646,7 +766,12 @@ async def login_user(
             detail="An error occurred while processing the request.",
         )
 
-    jwt_access_token = jwt_manager.create_access_token({"user_id": user.id})
+    if hasher.needs_update(user.hashed_password):
+        background_tasks.add_task(
+            _rehash_password, user.id, login_data.password, user.hashed_password, hasher
+        )
+
+    jwt_access_token = jwt_manager.create_access_token(access_token_claims(user))
     return UserLoginResponseSchema(
         access_token=jwt_access_token,
         refresh_token=jwt_refresh_token,
@@ -798,7 +923,9 @@ async def refresh_access_token(
     Endpoint to refresh an access token.
 
     Validates the provided refresh token, extracts the user ID from it, and issues
-    a new access token. If the token is invalid or expired, an error is returned.
+    a new access token carrying the user's current group and token version (so this is also
+    how a client recovers from a revoked access token). If the token is invalid or expired,
+    an error is returned.
 
     Args:
         token_data (TokenRefreshRequestSchema): Contains the refresh token.
@@ -832,7 +959,7 @@ async def refresh_access_token(
             detail="Refresh token not found.",
         )
 
-    stmt = select(UserModel).filter_by(id=user_id)
+    stmt = select(UserModel).options(joinedload(UserModel.group)).filter_by(id=user_id)
     result = await db.execute(stmt)
     user = result.scalars().first()
     if not user:
@@ -841,13 +968,13 @@ async def refresh_access_token(
             detail="User not found.",
         )
 
-    new_access_token = jwt_manager.create_access_token({"user_id": user_id})
+    new_access_token = jwt_manager.create_access_token(access_token_claims(user))
 
     return TokenRefreshResponseSchema(access_token=new_access_token)
 
 
 @router.post(
-    "users/{user_id}/change-user-group/",
+    "/users/{user_id}/change-user-group/",
     summary="Change user group",
     description=(
         "<h3>Change user group</h3>"
@@ -864,7 +991,8 @@ async def change_user_group(
         user_id: int,
         data: ChangeUserGroupRequestSchema,
         db: AsyncSession = Depends(get_db),
-        _requestor: UserModel = Depends(user_is_admin)
+        _requestor: Principal = Depends(user_is_admin),
+        principals: PrincipalCache = Depends(get_principal_cache),
 ):
     """
     Change the group of an existing user.
@@ -873,8 +1001,9 @@ async def change_user_group(
     - Verify that the target user exists.
     - Verify that the requested group exists.
     - Check whether the user is already assigned to the requested group.
-    - Assign the new group to the user.
+    - Assign the new group to the user and revoke their access tokens (which carry the old group).
     - Persist the changes in the database.
+    - Invalidate the user's cached principal, so the new group applies to their next request.
 
     Returns a message describing the result of the operation.
     """
@@ -898,19 +1027,21 @@ async def change_user_group(
             detail="User group not found.",
         )
 
-    if user.group.id == new_group.id:
+    if user.group_id == new_group.id:
         return MessageResponseSchema(message="User is already in this group.")
 
-    user.group = new_group
+    user.group_id = new_group.id
+    user.revoke_access_tokens()
 
     await db.commit()
+    principals.invalidate(user.id)
     await db.refresh(user)
 
     return MessageResponseSchema(message="User group changed successfully.")
 
 
 @router.post(
-    "users/{user_id}/activate/",
+    "/users/{user_id}/activate/",
     summary="Activate user",
     description=(
         "<h3>Activate user account</h3>"
@@ -925,7 +1056,8 @@ async def change_user_group(
 async def activate_user(
         user_id: int,
         db: AsyncSession = Depends(get_db),
-        _requestor: UserModel = Depends(user_is_admin)
+        _requestor: Principal = Depends(user_is_admin),
+        principals: PrincipalCache = Depends(get_principal_cache),
 ):
     """
     Activate an inactive user account.
@@ -935,6 +1067,7 @@ async def activate_user(
     - Check whether the user is already active.
     - Set the user's `is_active` flag to True.
     - Persist the changes in the database.
+    - Invalidate the user's cached principal.
 
     Returns a message describing the result of the operation.
     """
@@ -953,6 +1086,7 @@ async def activate_user(
 
     user.is_active = True
     await db.commit()
+    principals.invalidate(user.id)
     await db.refresh(user)
 
     return MessageResponseSchema(message="User has been activated.")
@@ -3,10 +3,11 @@ from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from cinema.config.dependencies import get_user
+from cinema.cache import Principal
+from cinema.config.dependencies import get_principal
 from cinema.database.models.movies import GenreModel, MovieModel
 from cinema.schemas.movies import GenreListResponseSchema, GenreListItemSchema, GenreDetailSchema
-from cinema.database import get_db, UserModel
+from cinema.database import get_db
 
 router = APIRouter()
 
@@ -33,7 +34,7 @@ async def get_genre_list(
         page: int = Query(1, ge=1, description="Page number (1-based index)"),
         per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
         db: AsyncSession = Depends(get_db),
-        _user: UserModel = Depends(get_user)
+        _user: Principal = Depends(get_principal)
 ) -> GenreListResponseSchema:
     """
     Fetch a paginated list of genres from the database (asynchronously).
@@ -123,7 +124,7 @@ async def get_genre_list(
 async def get_movies_by_genre_id(
         genre_id: int,
         db: AsyncSession = Depends(get_db),
-        _user: UserModel = Depends(get_user)
+        _user: Principal = Depends(get_principal)
 ) -> GenreDetailSchema:
     """
     Retrieve movies for a specific genre.
@@ -1,32 +1,162 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func, or_, case
+from typing import Literal, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import ColumnElement, Select, select, func, case, tuple_, literal
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
 from cinema.database import get_db
+from cinema.database.bulk import get_or_create_bulk
+from cinema.database.counts import estimate_row_count, read_counter
+from cinema.database.search import apply_search, refresh_search_documents, delete_search_documents
+from cinema.database.typeahead import TypeaheadIndex
 from cinema.database.models.movies import (
     CountryModel,
     GenreModel,
     ActorModel,
-    LanguageModel
+    LanguageModel,
+    CommentModel,
+    RatingModel,
 )
 from cinema.schemas.movies import (
     MovieListResponseSchema,
     MovieListItemSchema,
     MovieDetailSchema,
     MovieCreateSchema,
-    MovieUpdateSchema
+    MovieUpdateSchema,
+    MovieBaseSchema,
+    MovieReactionsSummarySchema,
+    MovieRatingsSummarySchema,
+    CommentReadSchema,
 )
 
-from cinema.config.dependencies import user_is_staff
-from cinema.database.models.accounts import UserModel
-from cinema.database.models.movies import DirectorModel, MovieModel
+from cinema.cache import Principal, ResponseCache, TTLCache
+from cinema.config.dependencies import get_count_cache, get_response_cache, get_typeahead_index, user_is_staff
+from cinema.database.models.movies import DirectorModel, MovieModel, MOVIES_COUNTER
+from cinema.exceptions import InvalidCursorError
+from cinema.pagination import encode_cursor, decode_cursor
 from cinema.schemas.movies import MovieQueryParamsSchema
 
 router = APIRouter()
 
 
+SORT_COLUMNS = {
+    "price": MovieModel.price,
+    "budget": MovieModel.budget,
+    "duration": MovieModel.duration,
+}
+
+CURSOR_SORT_COLUMNS = {
+    "name": MovieModel.name,
+    **SORT_COLUMNS,
+}
+
+# Number of most recent comments embedded in the movie detail; the full list
+# is served page by page from `/movies/{movie_id}/comments/`.
+MOVIE_DETAIL_COMMENTS_LIMIT = 10
+
+
+def _filter_movies(
+        db: AsyncSession,
+        params: MovieQueryParamsSchema,
+        *columns
+) -> Tuple[Select, Optional[ColumnElement]]:
+    """
+    Build a SELECT of the given columns over movies with the search/year/imdb filters applied.
+
+    Search goes through the full-text search documents (see `cinema.database.search`),
+    so the statement never joins actors or directors and returns each movie at most once.
+
+    Returns the statement and, when searching, the relevance expression to order by (descending).
+    """
+    stmt = select(*columns).select_from(MovieModel)
+
+    rank = None
+    if params.search:
+        stmt, rank = apply_search(db, stmt, params.search)
+
+    if params.year is not None:
+        stmt = stmt.where(MovieModel.year == params.year)
+
+    if params.imdb is not None:
+        stmt = stmt.where(MovieModel.imdb >= params.imdb)
+
+    return stmt, rank
+
+
+async def _fetch_movies_in_order(db: AsyncSession, movie_ids: Sequence[int]) -> list[MovieListItemSchema]:
+    """
+    Load full movie rows for the given IDs, preserving the order of `movie_ids`.
+    """
+    order_by_ids = case({mid: idx for idx, mid in enumerate(movie_ids)}, value=MovieModel.id)
+
+    movies_stmt = select(MovieModel).where(MovieModel.id.in_(movie_ids)).order_by(order_by_ids)
+    movies = (await db.execute(movies_stmt)).scalars().all()
+
+    return [MovieListItemSchema.model_validate(m) for m in movies]
+
+
+async def _get_movie_list_by_cursor(
+        cursor: Optional[str],
+        per_page: int,
+        params: MovieQueryParamsSchema,
+        db: AsyncSession,
+) -> MovieListResponseSchema:
+    """
+    Keyset pagination over `(sort column, id)`.
+
+    The page is located with a `(sort_col, id) > (value, last_id)` predicate (or `<` for
+    descending order), so the cost of a page does not depend on its depth and no total
+    count is computed. The cursor carries the ordering; `next_page` carries the filters.
+    """
+    sort_by, sort_order = params.sort_by, params.sort_order
+    position = None
+    if cursor:
+        try:
+            position = decode_cursor(cursor)
+        except InvalidCursorError as error:
+            raise HTTPException(status_code=400, detail=str(error))
+        sort_by, sort_order = position.sort_by, position.sort_order
+
+    sort_column = CURSOR_SORT_COLUMNS[sort_by]
+    ids_stmt, _rank = _filter_movies(db, params, MovieModel.id, sort_column)
+
+    if position is not None:
+        row_position = tuple_(sort_column, MovieModel.id)
+        last_position = tuple_(literal(position.value, sort_column.type), literal(position.last_id))
+        ids_stmt = ids_stmt.where(
+            row_position > last_position if sort_order == "asc" else row_position < last_position
+        )
+
+    if sort_order == "asc":
+        ids_stmt = ids_stmt.order_by(sort_column.asc(), MovieModel.id.asc())
+    else:
+        ids_stmt = ids_stmt.order_by(sort_column.desc(), MovieModel.id.desc())
+
+    rows = (await db.execute(ids_stmt.limit(per_page + 1))).all()
+
+    if not rows:
+        raise HTTPException(status_code=404, detail="No movies found.")
+
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+
+    next_cursor = next_page = None
+    if has_next:
+        last_id, last_value = rows[-1]
+        next_cursor = encode_cursor(sort_by, sort_order, last_value, last_id)
+        filters = params.model_dump(include={"search", "year", "imdb"}, exclude_none=True)
+        next_page = f"/cinema/movies/?{urlencode({'cursor': next_cursor, 'per_page': per_page, **filters})}"
+
+    return MovieListResponseSchema(
+        movies=await _fetch_movies_in_order(db, [movie_id for movie_id, _ in rows]),
+        next_page=next_page,
+        next_cursor=next_cursor,
+    )
+
+
 @router.get(
     "/movies/",
     response_model=MovieListResponseSchema,
@@ -36,15 +166,26 @@ router = APIRouter()
             "<p>Supports:</p>"
             "<ul>"
             "<li><b>Pagination</b> via <code>page</code> and <code>per_page</code></li>"
-            "<li><b>Search</b> via <code>search</code> (matches movie name/description, "
-            "actor name, director name)</li>"
+            "<li><b>Cursor pagination</b> via <code>pagination=cursor</code> and the returned "
+            "<code>next_cursor</code> (no totals, constant cost per page)</li>"
+            "<li><b>Search</b> via <code>search</code> (full-text match on movie name/description, "
+            "actor name, director name, ranked by relevance)</li>"
             "<li><b>Filtering</b> via <code>year</code> and <code>imdb</code> (minimum IMDB rating)</li>"
-            "<li><b>Sorting</b> via <code>sort_by</code> (price/budget/duration) and "
+            "<li><b>Sorting</b> via <code>sort_by</code> (price/budget/duration; name in cursor mode) and "
             "<code>sort_order</code> (asc/desc)</li>"
             "</ul>"
             "<p>The response includes items, total counts, and previous/next page links when applicable.</p>"
     ),
     responses={
+        304: {"description": "The client's copy (`If-None-Match`) is current."},
+        400: {
+            "description": "The cursor is malformed.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid cursor."}
+                }
+            },
+        },
         404: {
             "description": "No movies found or page out of range.",
             "content": {
@@ -59,110 +200,182 @@ router = APIRouter()
     }
 )
 async def get_movie_list(
+        request: Request,
         page: int = Query(1, ge=1, description="Page number (1-based index)"),
         per_page: int = Query(10, ge=1, le=20, description="Number of items per page"),
+        pagination: Literal["page", "cursor"] = Query(
+            "page",
+            description="Pagination mode: `page` (offset, with totals) or `cursor` (keyset, without totals)"
+        ),
+        cursor: Optional[str] = Query(
+            None,
+            description="Opaque cursor from a previous `next_cursor`; implies cursor pagination"
+        ),
+        count: Literal["exact", "estimate"] = Query(
+            "exact",
+            description="How `total_items` is computed for filtered lists: `exact` or `estimate` (planner estimate)"
+        ),
         params: MovieQueryParamsSchema = Depends(),
         db: AsyncSession = Depends(get_db),
-) -> MovieListResponseSchema:
+        cache: ResponseCache = Depends(get_response_cache),
+        counts: TTLCache[str, int] = Depends(get_count_cache),
+) -> Response:
     """
     Retrieve a paginated list of movies with optional search, filtering, and sorting.
 
     Behavior:
     - Pagination uses `page` and `per_page` (1-based index).
-    - Search (`params.search`) matches:
+    - Cursor pagination is used when `pagination=cursor` or a `cursor` is given:
+      - Pages are located by `(sort column, id)` instead of OFFSET.
+      - `next_cursor` points to the next page; totals are not computed.
+      - The cursor carries its sort key and direction, which take precedence over `sort_by`/`sort_order`.
+    - Search (`params.search`) uses the full-text search document of each movie, built from:
       - Movie name
       - Movie description
       - Actor name
       - Director name
+      Every word must match (as a prefix); results are ranked by relevance.
     - Filters:
       - `params.year` filters by exact release year
       - `params.imdb` filters by minimum IMDB rating (`MovieModel.imdb >= params.imdb`)
     - Sorting:
-      - `params.sort_by` supports: price, budget, duration
+      - `params.sort_by` supports: price, budget, duration (and name in cursor mode)
       - `params.sort_order` supports: asc/desc
+      - When searching, relevance ranking follows the custom sort column (page mode only).
       - A model-defined default ordering is appended after custom sorting (if present).
-    - Total count is computed over distinct movie IDs (to avoid duplicates from joins).
+    - Totals (page mode, see `_count_movies`):
+      - Without filters, `total_items` comes from a trigger-maintained counter.
+      - Filtered totals are cached per filter signature for a short TTL.
+      - `count=estimate` uses the PostgreSQL planner estimate for filtered totals;
+        `total_exact` tells whether the total is exact.
+    - Caching (see `ResponseCache`):
+      - Responses are cached per normalised query and carry a strong `ETag`.
+      - A matching `If-None-Match` gets 304 without touching the database.
 
     Returns:
     - 200 with `MovieListResponseSchema` (movies + pagination metadata).
+    - 304 if the client's copy (`If-None-Match`) is current.
 
     Errors:
+    - 400 if `cursor` is malformed (`"Invalid cursor."`)
     - 404 if no movies match the query (`"No movies found."`)
     - 404 if `page` exceeds total pages (`"Page out of range."`)
     """
-    offset = (page - 1) * per_page
-
-    base_from = (
-        select(MovieModel.id)
-        .select_from(MovieModel)
-        .outerjoin(MovieModel.actors)
-        .outerjoin(MovieModel.directors)
+    if cursor:
+        pagination = "cursor"
+    key = cache.key(
+        "movies",
+        pagination=pagination,
+        page=page if pagination == "page" else None,
+        per_page=per_page,
+        cursor=cursor,
+        count=count if pagination == "page" else None,
+        **params.model_dump(),
     )
-
-    if params.search:
-        pattern = f"%{params.search}%"
-        base_from = base_from.where(
-            or_(
-                MovieModel.name.ilike(pattern),
-                MovieModel.description.ilike(pattern),
-                ActorModel.name.ilike(pattern),
-                DirectorModel.name.ilike(pattern),
-            )
+    etag = cache.list_etag(key)
+    cached = cache.respond(request, key, etag)
+    if cached is not None:
+        return cached
+
+    if pagination == "cursor":
+        movie_list = await _get_movie_list_by_cursor(cursor, per_page, params, db)
+    else:
+        movie_list = await _get_movie_list_by_page(
+            page, per_page, params, db, count, counts, cache.catalogue_version
         )
 
-    if params.year is not None:
-        base_from = base_from.where(MovieModel.year == params.year)
+    return cache.store(key, etag, movie_list)
 
-    if params.imdb is not None:
-        base_from = base_from.where(MovieModel.imdb >= params.imdb)
 
-    # ---- count distinct movies ----
-    count_stmt = select(func.count()).select_from(base_from.distinct().subquery())
-    total_items = (await db.execute(count_stmt)).scalar_one()
+async def _count_movies(
+        db: AsyncSession,
+        params: MovieQueryParamsSchema,
+        base_from: Select,
+        count: Literal["exact", "estimate"],
+        counts: TTLCache[str, int],
+        catalogue_version: int,
+) -> Tuple[int, bool]:
+    """
+    Total number of movies matching the filters, and whether that total is exact.
+
+    - No filters: the trigger-maintained `movies` counter (a primary key lookup).
+    - `count=estimate` on PostgreSQL: the planner's row estimate for the filtered query.
+    - Otherwise: `count(*)` of the filtered query, cached per filter signature. The key
+      includes the catalogue version, so writes in this process invalidate it at once;
+      other processes' writes show up after `COUNT_CACHE_TTL_SECONDS`.
+    """
+    if not params.search and params.year is None and params.imdb is None:
+        return await read_counter(db, MOVIES_COUNTER), True
+
+    if count == "estimate":
+        estimate = await estimate_row_count(db, base_from)
+        if estimate is not None:
+            return estimate, False
+
+    signature = ResponseCache.key("movies-count", search=params.search, year=params.year, imdb=params.imdb)
+    key = f"{signature}@{catalogue_version}"
+    total_items = counts.get(key)
+    if total_items is None:
+        count_stmt = select(func.count()).select_from(base_from.subquery())
+        total_items = (await db.execute(count_stmt)).scalar_one()
+        counts.set(key, total_items)
+    return total_items, True
+
+
+async def _get_movie_list_by_page(
+        page: int,
+        per_page: int,
+        params: MovieQueryParamsSchema,
+        db: AsyncSession,
+        count: Literal["exact", "estimate"],
+        counts: TTLCache[str, int],
+        catalogue_version: int,
+) -> MovieListResponseSchema:
+    """
+    Offset pagination with totals, ordered by the requested sort column (and relevance when searching).
+    """
+    offset = (page - 1) * per_page
+
+    base_from, rank = _filter_movies(db, params, MovieModel.id)
+
+    # ---- count movies ----
+    total_items, total_exact = await _count_movies(db, params, base_from, count, counts, catalogue_version)
 
-    if total_items == 0:
+    if total_exact and total_items == 0:
         raise HTTPException(status_code=404, detail="No movies found.")
 
-    total_pages = (total_items + per_page - 1) // per_page
-    if page > total_pages:
+    total_pages = max((total_items + per_page - 1) // per_page, 1)
+    if total_exact and page > total_pages:
         raise HTTPException(status_code=404, detail="Page out of range.")
 
     # ---- sorting (apply to the ID query) ----
-    sort_columns = {
-        "price": MovieModel.price,
-        "budget": MovieModel.budget,
-        "duration": MovieModel.duration,
-    }
-
     order_clauses = []
-    sort_column = sort_columns.get(params.sort_by)
+    sort_column = SORT_COLUMNS.get(params.sort_by)
     if sort_column is not None:
         order_clauses.append(sort_column.asc() if params.sort_order == "asc" else sort_column.desc())
 
+    if rank is not None:
+        order_clauses.append(rank.desc())
+
     default_order = MovieModel.default_order_by()
     if default_order:
         order_clauses.extend(default_order)
 
-    # ---- page IDs (distinct!) ----
-    ids_stmt = base_from.distinct()
+    # ---- page IDs ----
+    ids_stmt = base_from
     if order_clauses:
         ids_stmt = ids_stmt.order_by(*order_clauses)
 
     ids_stmt = ids_stmt.offset(offset).limit(per_page)
     movie_ids = (await db.execute(ids_stmt)).scalars().all()
 
-    # Safety (shouldn’t happen, but keeps behavior stable)
+    # Reached with an estimated total (or a concurrent delete)
     if not movie_ids:
-        raise HTTPException(status_code=404, detail="No movies found.")
+        raise HTTPException(status_code=404, detail="Page out of range." if page > 1 else "No movies found.")
 
     # ---- fetch full movies by IDs ----
     # Keep the same order as movie_ids (important for stable pagination)
-    order_by_ids = case({mid: idx for idx, mid in enumerate(movie_ids)}, value=MovieModel.id)
-
-    movies_stmt = select(MovieModel).where(MovieModel.id.in_(movie_ids)).order_by(order_by_ids)
-    movies = (await db.execute(movies_stmt)).scalars().all()
-
-    movie_list = [MovieListItemSchema.model_validate(m) for m in movies]
+    movie_list = await _fetch_movies_in_order(db, movie_ids)
 
     return MovieListResponseSchema(
         movies=movie_list,
@@ -170,6 +383,7 @@ async def get_movie_list(
         next_page=f"/cinema/movies/?page={page + 1}&per_page={per_page}" if page < total_pages else None,
         total_pages=total_pages,
         total_items=total_items,
+        total_exact=total_exact,
     )
 
 
@@ -218,17 +432,24 @@ async def get_movie_list(
 async def create_movie(
         movie_data: MovieCreateSchema,
         db: AsyncSession = Depends(get_db),
-        _user: UserModel = Depends(user_is_staff),
+        _user: Principal = Depends(user_is_staff),
+        typeahead: TypeaheadIndex = Depends(get_typeahead_index),
+        cache: ResponseCache = Depends(get_response_cache),
 ) -> MovieDetailSchema:
     """
     Create a new movie and attach related entities (staff-only).
 
     Workflow:
     - Rejects duplicates by checking `(name, year)` before insert.
-    - Resolves relations by lookup-and-create:
+    - Resolves relations with one batched lookup-or-create per relation type
+      (see `get_or_create_bulk`), so the statement count does not grow with the
+      number of genres/actors/directors/languages:
       - Country by `code`
       - Genres/Actors/Directors/Languages by `name`
-    - Commits the transaction and refreshes the movie with relationships.
+    - Builds the movie's full-text search document in the same transaction.
+    - Commits the transaction and returns the movie detail.
+    - Adds the new names to the in-process typeahead index.
+    - Invalidates the cached movie lists.
 
     Returns:
     - 201 with the created movie (`MovieDetailSchema`).
@@ -254,61 +475,11 @@ async def create_movie(
         )
 
     try:
-        country_stmt = select(CountryModel).where(CountryModel.code == movie_data.country)
-        country_result = await db.execute(country_stmt)
-        country = country_result.scalars().first()
-        if not country:
-            country = CountryModel(code=movie_data.country)
-            db.add(country)
-            await db.flush()
-
-        genres = []
-        for genre_name in movie_data.genres:
-            genre_stmt = select(GenreModel).where(GenreModel.name == genre_name)
-            genre_result = await db.execute(genre_stmt)
-            genre = genre_result.scalars().first()
-
-            if not genre:
-                genre = GenreModel(name=genre_name)
-                db.add(genre)
-                await db.flush()
-            genres.append(genre)
-
-        actors = []
-        for actor_name in movie_data.actors:
-            actor_stmt = select(ActorModel).where(ActorModel.name == actor_name)
-            actor_result = await db.execute(actor_stmt)
-            actor = actor_result.scalars().first()
-
-            if not actor:
-                actor = ActorModel(name=actor_name)
-                db.add(actor)
-                await db.flush()
-            actors.append(actor)
-
-        directors = []
-        for director_name in movie_data.directors:
-            director_stmt = select(DirectorModel).where(DirectorModel.name == director_name)
-            director_result = await db.execute(director_stmt)
-            director = director_result.scalars().first()
-
-            if not director:
-                director = DirectorModel(name=director_name)
-                db.add(director)
-                await db.flush()
-            directors.append(director)
-
-        languages = []
-        for language_name in movie_data.languages:
-            lang_stmt = select(LanguageModel).where(LanguageModel.name == language_name)
-            lang_result = await db.execute(lang_stmt)
-            language = lang_result.scalars().first()
-
-            if not language:
-                language = LanguageModel(name=language_name)
-                db.add(language)
-                await db.flush()
-            languages.append(language)
+        countries = await get_or_create_bulk(db, CountryModel, [movie_data.country], "code")
+        genre_map = await get_or_create_bulk(db, GenreModel, movie_data.genres)
+        actor_map = await get_or_create_bulk(db, ActorModel, movie_data.actors)
+        director_map = await get_or_create_bulk(db, DirectorModel, movie_data.directors)
+        language_map = await get_or_create_bulk(db, LanguageModel, movie_data.languages)
 
         movie = MovieModel(
             name=movie_data.name,
@@ -322,31 +493,91 @@ async def create_movie(
             revenue=movie_data.revenue,
             certification=movie_data.certification,
             price=movie_data.price,
-            country=country,
-            genres=genres,
-            actors=actors,
-            directors=directors,
-            languages=languages,
+            country=countries[movie_data.country],
+            genres=list(genre_map.values()),
+            actors=list(actor_map.values()),
+            directors=list(director_map.values()),
+            languages=list(language_map.values()),
         )
         db.add(movie)
+        await db.flush()
+        await refresh_search_documents(db, [movie.id])
         await db.commit()
-        await db.refresh(movie, [
-            "country",
-            "genres",
-            "actors",
-            "directors",
-            "languages",
-            "comments",
-            "reactions",
-            "ratings",
-        ])
-        return MovieDetailSchema.model_validate(movie)
+        typeahead.add_movie(movie)
+        cache.invalidate_movie(movie.id)
+        return await _get_movie_detail(db, movie.id)
 
     except IntegrityError:
         await db.rollback()
         raise HTTPException(status_code=400, detail="Invalid input data.")
 
 
+async def _get_movie_detail(db: AsyncSession, movie_id: int) -> Optional[MovieDetailSchema]:
+    """
+    Load a movie with its relations without multiplying rows.
+
+    Each collection comes back in its own query (`selectinload`), so the rows fetched are
+    the sum of the collection sizes rather than their product. Comments are limited to the
+    most recent `MOVIE_DETAIL_COMMENTS_LIMIT`. Reaction counts and the rating count/average
+    come from the movie's denormalised aggregate columns; only the rating distribution
+    is grouped from the raw rows (at most one row per rating value).
+
+    Returns None if the movie does not exist.
+    """
+    stmt = (
+        select(MovieModel)
+        .options(
+            joinedload(MovieModel.country),
+            selectinload(MovieModel.genres),
+            selectinload(MovieModel.actors),
+            selectinload(MovieModel.languages),
+            selectinload(MovieModel.directors),
+        )
+        .where(MovieModel.id == movie_id)
+    )
+    result = await db.execute(stmt)
+    movie = result.scalars().first()
+
+    if not movie:
+        return None
+
+    comments_stmt = (
+        select(CommentModel)
+        .where(CommentModel.movie_id == movie_id)
+        .order_by(CommentModel.id.desc())
+        .limit(MOVIE_DETAIL_COMMENTS_LIMIT)
+    )
+    comments = (await db.execute(comments_stmt)).scalars().all()
+
+    comments_count_stmt = select(func.count()).select_from(CommentModel).where(CommentModel.movie_id == movie_id)
+    comments_count = (await db.execute(comments_count_stmt)).scalar_one()
+
+    ratings_stmt = (
+        select(RatingModel.rating, func.count())
+        .where(RatingModel.movie_id == movie_id)
+        .group_by(RatingModel.rating)
+    )
+    distribution = {int(rating.value): count for rating, count in (await db.execute(ratings_stmt)).all()}
+
+    return MovieDetailSchema(
+        **{field: getattr(movie, field) for field in MovieBaseSchema.model_fields},
+        id=movie.id,
+        country=movie.country,
+        genres=movie.genres,
+        actors=movie.actors,
+        directors=movie.directors,
+        languages=movie.languages,
+        comments=[CommentReadSchema.model_validate(comment) for comment in reversed(comments)],
+        comments_count=comments_count,
+        reactions=MovieReactionsSummarySchema(likes=movie.likes, dislikes=movie.dislikes),
+        ratings=MovieRatingsSummarySchema(
+            count=movie.ratings_count,
+            average=movie.average_rating,
+            distribution=dict(sorted(distribution.items())),
+        ),
+    )
+
+
 @router.get(
     "/movies/{movie_id}/",
     response_model=MovieDetailSchema,
@@ -360,13 +591,14 @@ async def create_movie(
             "<li>Actors</li>"
             "<li>Languages</li>"
             "<li>Directors</li>"
-            "<li>Comments</li>"
-            "<li>Reactions</li>"
-            "<li>Ratings</li>"
+            "<li>The latest comments and the total comment count</li>"
+            "<li>Reaction counts (likes/dislikes)</li>"
+            "<li>Rating count, average and distribution</li>"
             "</ul>"
             "<p>If the movie with the given ID is not found, a 404 error is returned.</p>"
     ),
     responses={
+        304: {"description": "The client's copy (`If-None-Match`) is current."},
         404: {
             "description": "Movie not found.",
             "content": {
@@ -379,38 +611,35 @@ async def create_movie(
 )
 async def get_movie_by_id(
         movie_id: int,
+        request: Request,
         db: AsyncSession = Depends(get_db),
-) -> MovieDetailSchema:
+        cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
     """
     Retrieve a single movie by ID, including related entities.
 
-    The query eagerly loads the following relationships:
+    Relations are loaded with one query per collection (see `_get_movie_detail`):
     - country, genres, actors, languages, directors
-    - comments, reactions, ratings
+    - the most recent comments plus the total comment count
+    - reaction and rating summaries instead of the individual rows
+
+    The response is cached and tagged with a strong `ETag` built from the movie's
+    version (see `ResponseCache`); a matching `If-None-Match` gets 304 without a query.
 
     Returns:
     - 200 with `MovieDetailSchema`.
+    - 304 if the client's copy (`If-None-Match`) is current.
 
     Errors:
     - 404 if the movie does not exist (`"Movie with the given ID was not found."`).
     """
-    stmt = (
-        select(MovieModel)
-        .options(
-            joinedload(MovieModel.country),
-            joinedload(MovieModel.genres),
-            joinedload(MovieModel.actors),
-            joinedload(MovieModel.languages),
-            joinedload(MovieModel.directors),
-            joinedload(MovieModel.comments),
-            joinedload(MovieModel.reactions),
-            joinedload(MovieModel.ratings),
-        )
-        .where(MovieModel.id == movie_id)
-    )
+    key = cache.key("movie", movie_id=movie_id)
+    etag = cache.movie_etag(movie_id)
+    cached = cache.respond(request, key, etag)
+    if cached is not None:
+        return cached
 
-    result = await db.execute(stmt)
-    movie = result.scalars().first()
+    movie = await _get_movie_detail(db, movie_id)
 
     if not movie:
         raise HTTPException(
@@ -418,7 +647,7 @@ async def get_movie_by_id(
             detail="Movie with the given ID was not found."
         )
 
-    return MovieDetailSchema.model_validate(movie)
+    return cache.store(key, etag, movie)
 
 
 @router.delete(
@@ -447,14 +676,18 @@ async def get_movie_by_id(
 async def delete_movie(
         movie_id: int,
         db: AsyncSession = Depends(get_db),
-        _requestor: UserModel = Depends(user_is_staff),
+        _requestor: Principal = Depends(user_is_staff),
+        typeahead: TypeaheadIndex = Depends(get_typeahead_index),
+        cache: ResponseCache = Depends(get_response_cache),
 ):
     """
     Delete a movie by ID (staff-only).
 
     Workflow:
     - Fetches the movie by `movie_id`.
-    - If found, deletes it and commits.
+    - If found, deletes it (and its full-text search document) and commits.
+    - Drops the title from the in-process typeahead index.
+    - Invalidates the cached responses of the movie and the movie lists.
 
     Returns:
     - 204 (as declared in the router decorator).
@@ -476,7 +709,10 @@ async def delete_movie(
         )
 
     await db.delete(movie)
+    await delete_search_documents(db, [movie_id])
     await db.commit()
+    typeahead.remove("movies", [movie_id])
+    cache.invalidate_movie(movie_id)
 
     return {"detail": "Movie deleted successfully."}
 
@@ -520,7 +756,9 @@ async def update_movie(
         movie_id: int,
         movie_data: MovieUpdateSchema,
         db: AsyncSession = Depends(get_db),
-        _user: UserModel = Depends(user_is_staff),
+        _user: Principal = Depends(user_is_staff),
+        typeahead: TypeaheadIndex = Depends(get_typeahead_index),
+        cache: ResponseCache = Depends(get_response_cache),
 ) -> dict[str, str]:
     """
     Partially update a movie by ID (staff-only).
@@ -528,7 +766,10 @@ async def update_movie(
     Behavior:
     - Fetches the movie by `movie_id`.
     - Applies only provided fields from `movie_data` (`exclude_unset=True`).
+    - Rebuilds the movie's full-text search document.
     - Commits changes and refreshes the instance.
+    - Re-indexes the title in the in-process typeahead index.
+    - Invalidates the cached responses of the movie and the movie lists.
 
     Returns:
     - 200 with a confirmation message.
@@ -551,10 +792,14 @@ async def update_movie(
         setattr(movie, field, value)
 
     try:
+        await db.flush()
+        await refresh_search_documents(db, [movie.id])
         await db.commit()
         await db.refresh(movie)
     except IntegrityError:
         await db.rollback()
         raise HTTPException(status_code=400, detail="Invalid input data.")
 
+    typeahead.add("movies", [(movie.id, movie.name)])
+    cache.invalidate_movie(movie.id)
     return {"detail": "Movie updated successfully."}
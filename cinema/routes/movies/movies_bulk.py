@@ -0,0 +1,252 @@
+import codecs
+import json
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import Receive, Scope, Send
+
+from cinema.cache import Principal, ResponseCache
+from cinema.config.dependencies import get_response_cache, get_typeahead_index, user_is_staff
+from cinema.database import get_db
+from cinema.database.ingest import BULK_CHUNK_SIZE, MovieBulkIngestor
+from cinema.database.typeahead import TypeaheadIndex
+from cinema.schemas.movies import MovieBulkErrorSchema, MovieBulkResultSchema, MovieCreateSchema
+
+
+router = APIRouter()
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+# Upper bound for a single item; a larger unparsable remainder means the body is malformed.
+MAX_ITEM_BYTES = 1024 * 1024
+
+# Reported for every item of a chunk that could not be inserted; nothing of that chunk is saved.
+CHUNK_FAILED_MESSAGE = "The chunk containing this item could not be saved; send the item again."
+
+
+class MalformedBodyError(ValueError):
+    """
+    The request body cannot be split into items; the rest of the stream is unusable.
+    """
+
+
+class RequestStreamingResponse(StreamingResponse):
+    """
+    A streaming response whose body is produced while the request body is still being read.
+
+    `StreamingResponse` watches for client disconnects by calling `receive()` alongside the
+    body iterator, which would steal the chunks `request.stream()` is waiting for. Here the
+    body iterator is the only reader; a disconnect surfaces as `ClientDisconnect` from
+    `request.stream()` instead.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+# A parsed item, or the error message explaining why the item could not be parsed.
+ParsedItem = Tuple[Any, Optional[str]]
+
+
+async def _iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedItem]:
+    """
+    Yield one JSON value per non-empty line; a line that is not valid JSON only invalidates itself.
+    """
+    def parse(line: bytes) -> ParsedItem:
+        try:
+            return json.loads(line), None
+        except ValueError as error:
+            return None, f"Invalid JSON: {error}"
+
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield parse(line)
+        if len(buffer) > MAX_ITEM_BYTES:
+            raise MalformedBodyError(f"Line exceeds {MAX_ITEM_BYTES} bytes.")
+    if buffer.strip():
+        yield parse(buffer)
+
+
+async def _iter_json_array(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedItem]:
+    """
+    Yield the elements of a top-level JSON array as they arrive, without buffering the whole array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    state = "start"  # start -> first -> (separator -> item)* -> end
+
+    async def feed() -> bool:
+        nonlocal buffer
+        async for chunk in chunks:
+            buffer += text_decoder.decode(chunk)
+            return True
+        buffer += text_decoder.decode(b"", final=True)
+        return False
+
+    more = True
+    while True:
+        buffer = buffer.lstrip()
+        if not buffer:
+            if not more:
+                break
+            more = await feed()
+            continue
+
+        if state == "start":
+            if buffer[0] != "[":
+                raise MalformedBodyError("Expected a JSON array.")
+            buffer = buffer[1:]
+            state = "first"
+        elif state in ("first", "item"):
+            if state == "first" and buffer[0] == "]":
+                state = "end"
+                buffer = buffer[1:]
+                continue
+            try:
+                value, end = decoder.raw_decode(buffer)
+            except ValueError as error:
+                if more and len(buffer) <= MAX_ITEM_BYTES:
+                    more = await feed()
+                    continue
+                raise MalformedBodyError(f"Invalid JSON: {error}")
+            buffer = buffer[end:]
+            state = "separator"
+            yield value, None
+        elif state == "separator":
+            if buffer[0] == ",":
+                state = "item"
+            elif buffer[0] == "]":
+                state = "end"
+            else:
+                raise MalformedBodyError("Expected ',' or ']' between array items.")
+            buffer = buffer[1:]
+        else:
+            raise MalformedBodyError("Unexpected data after the JSON array.")
+
+    if state != "end":
+        raise MalformedBodyError("Unexpected end of the JSON array.")
+
+
+def _invalid(index: int, errors: List[MovieBulkErrorSchema]) -> MovieBulkResultSchema:
+    return MovieBulkResultSchema(index=index, status="invalid", errors=errors)
+
+
+async def _ingest_stream(
+        items: AsyncIterator[ParsedItem],
+        ingestor: MovieBulkIngestor,
+) -> AsyncIterator[str]:
+    """
+    Validate items as they are parsed and ingest them `BULK_CHUNK_SIZE` at a time,
+    emitting one NDJSON result line per item in input order. A chunk that fails to insert
+    is rolled back and its items are reported as invalid; the following chunks still run.
+    """
+    pending: List[Tuple[int, Any]] = []
+
+    async def flush() -> AsyncIterator[str]:
+        valid = [(index, item) for index, item in pending if isinstance(item, MovieCreateSchema)]
+        results = [(index, item) for index, item in pending if isinstance(item, MovieBulkResultSchema)]
+        if valid:
+            try:
+                ingested = await ingestor.ingest(valid)
+            except SQLAlchemyError:
+                await ingestor.rollback()
+                ingested = [_invalid(index, [MovieBulkErrorSchema(msg=CHUNK_FAILED_MESSAGE)]) for index, _ in valid]
+            results.extend((result.index, result) for result in ingested)
+        pending.clear()
+        for _, result in sorted(results, key=lambda pair: pair[0]):
+            yield result.model_dump_json(exclude_none=True) + "\n"
+
+    index = 0
+    try:
+        async for value, parse_error in items:
+            if parse_error is not None:
+                pending.append((index, _invalid(index, [MovieBulkErrorSchema(msg=parse_error)])))
+            else:
+                try:
+                    pending.append((index, MovieCreateSchema.model_validate(value)))
+                except ValidationError as error:
+                    pending.append((index, _invalid(index, [
+                        MovieBulkErrorSchema(loc=list(detail["loc"]), msg=detail["msg"])
+                        for detail in error.errors()
+                    ])))
+
+            index += 1
+
+            if len(pending) >= BULK_CHUNK_SIZE:
+                async for line in flush():
+                    yield line
+    except MalformedBodyError as error:
+        pending.append((index, _invalid(index, [MovieBulkErrorSchema(msg=str(error))])))
+
+    async for line in flush():
+        yield line
+
+
+@router.post(
+    "/movies/bulk/",
+    response_class=RequestStreamingResponse,
+    summary="Create movies in bulk",
+    description=(
+        "<h3>Create many movies from one streamed request (staff only).</h3>"
+        "<p>The body is either a JSON array (<code>application/json</code>) or one movie per "
+        "line (<code>application/x-ndjson</code>); each item has the shape of the single "
+        "movie create payload.</p>"
+        "<p>The response is an NDJSON stream with one line per item, in input order: "
+        "<code>{\"index\", \"status\", \"id\"}</code> with status <code>created</code>, "
+        "<code>duplicate</code> (same name and year, or same UUID) or <code>invalid</code> "
+        "(with <code>errors</code>, also used for every item of a chunk that could not be saved).</p>"
+    ),
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "Per-item results."},
+        403: {"description": "Only staff can create movies."},
+        415: {"description": "Unsupported content type."},
+    },
+)
+async def create_movies_bulk(
+        request: Request,
+        db: AsyncSession = Depends(get_db),
+        _user: Principal = Depends(user_is_staff),
+        typeahead: TypeaheadIndex = Depends(get_typeahead_index),
+        cache: ResponseCache = Depends(get_response_cache),
+) -> RequestStreamingResponse:
+    """
+    Create movies from a streamed JSON array or NDJSON body (staff-only).
+
+    Items are parsed and validated incrementally, then inserted in chunks of
+    `BULK_CHUNK_SIZE` with relation lookups shared across chunks (see
+    `MovieBulkIngestor`). Each chunk is committed on its own, so results already
+    streamed stay valid if the client disconnects. Memory use is bounded by the
+    chunk size, not by the size of the batch.
+
+    Returns:
+    - 200 with an `application/x-ndjson` stream of `MovieBulkResultSchema` lines.
+
+    Errors:
+    - 415 if the body is neither JSON nor NDJSON.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_MEDIA_TYPES:
+        items = _iter_ndjson(request.stream())
+    elif content_type == "application/json":
+        items = _iter_json_array(request.stream())
+    else:
+        raise HTTPException(
+            status_code=415,
+            detail="Send a JSON array (application/json) or NDJSON (application/x-ndjson).",
+        )
+
+    return RequestStreamingResponse(
+        _ingest_stream(items, MovieBulkIngestor(db, typeahead, cache)),
+        media_type="application/x-ndjson",
+    )
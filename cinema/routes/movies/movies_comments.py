@@ -1,12 +1,12 @@
 from sqlalchemy.exc import IntegrityError
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.params import Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cinema.config.dependencies import get_user, get_movie
-from cinema.database.models.accounts import UserModel
+from cinema.cache import Principal, ResponseCache
+from cinema.config.dependencies import get_response_cache, get_principal, get_movie
 from cinema.database.models.movies import MovieModel, CommentModel
 from cinema.schemas.movies import (
     CommentCreateSchema,
@@ -44,7 +44,8 @@ async def post_comment(
         data: CommentCreateSchema,
         db: AsyncSession = Depends(get_db),
         movie: MovieModel = Depends(get_movie),
-        user: UserModel = Depends(get_user)
+        user: Principal = Depends(get_principal),
+        cache: ResponseCache = Depends(get_response_cache),
 ) -> CommentCreateResponseSchema:
     """
     Add a comment for a specific movie to the database.
@@ -60,6 +61,9 @@ async def post_comment(
     :param user: User session via decoded token, 404 if user not found or 403 if user is not active
     (provided via dependency injection).
     :type db: AsyncSession
+    :param cache: Response cache of the movie read endpoints; the movie's cached detail is
+    invalidated after the commit (provided via dependency injection).
+    :type cache: ResponseCache
 
     :return: The created comment.
     :rtype: CommentCreateResponseSchema
@@ -70,12 +74,13 @@ async def post_comment(
 
     try:
         comment = CommentModel(
-            user=user,
+            user_id=user.id,
             movie=movie,
             comment=data.comment,
         )
         db.add(comment)
         await db.commit()
+        cache.invalidate_movie(movie.id, catalogue=False)
         await db.refresh(comment)
 
         return CommentCreateResponseSchema.model_validate(comment)
@@ -90,18 +95,25 @@ async def post_comment(
             response_model=list[CommentReadSchema],
             description=(
                     "This endpoint retrieves a  list of comments for a movie from the database. "
+                    "Comments are returned oldest first, <code>per_page</code> at a time."
             ),
             )
 async def read_comments(
+        page: int = Query(1, ge=1, description="Page number (1-based index)"),
+        per_page: int = Query(50, ge=1, le=100, description="Number of comments per page"),
         db: AsyncSession = Depends(get_db),
         movie: MovieModel = Depends(get_movie),
-        _user: UserModel = Depends(get_user),
+        _user: Principal = Depends(get_principal),
 ) -> list[CommentReadSchema]:
     """
     Fetch a list of comments for a movie from the database (asynchronously).
 
-    This function retrieves a list of comments for a specific movie.
+    This function retrieves one page of comments for a specific movie.
 
+    :param page: The page number to retrieve (1-based).
+    :type page: int
+    :param per_page: The number of comments per page.
+    :type per_page: int
     :param db: The async SQLAlchemy database session (provided via dependency injection).
     :type db: AsyncSession
     :param movie: Movie fetched from database or 404 if movie not found  (provided via dependency injection).
@@ -116,7 +128,13 @@ async def read_comments(
 .
     """
 
-    stmt = select(CommentModel).where(CommentModel.movie_id == movie.id)
+    stmt = (
+        select(CommentModel)
+        .where(CommentModel.movie_id == movie.id)
+        .order_by(CommentModel.id)
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+    )
     result = await db.execute(stmt)
     comments = result.scalars().all()
 
@@ -157,7 +175,8 @@ async def delete_comment(
         comment_id: int,
         db: AsyncSession = Depends(get_db),
         movie: MovieModel = Depends(get_movie),
-        user: UserModel = Depends(get_user)
+        user: Principal = Depends(get_principal),
+        cache: ResponseCache = Depends(get_response_cache),
 ):
     """
     Delete a specific comment by its ID.
@@ -175,6 +194,9 @@ async def delete_comment(
     :param user: User session via decoded token, 404 if user not found or 403 if user is not active
     (provided via dependency injection).
     :type db: AsyncSession
+    :param cache: Response cache of the movie read endpoints; the movie's cached detail is
+    invalidated after the commit (provided via dependency injection).
+    :type cache: ResponseCache
 
     :raises HTTPException: Raises a 404 error if comment with the given ID is not found.
     :raises HTTPException: Raises a 403 error if user tries to delete other users comments.
@@ -193,13 +215,14 @@ async def delete_comment(
         raise HTTPException(status_code=404, detail="Comment not found.")
 
     is_owner = comment.user_id == user.id
-    is_moderator_or_admin = user.group.name in ("moderator", "admin")
+    is_moderator_or_admin = user.is_staff
 
     if not (is_owner or is_moderator_or_admin):
         raise HTTPException(status_code=403, detail="You can't delete this comment.")
 
     await db.delete(comment)
     await db.commit()
+    cache.invalidate_movie(movie.id, catalogue=False)
 
     return {"detail": "Comment deleted successfully."}
 
@@ -236,7 +259,8 @@ async def update_comment(
         data: CommentUpdateSchema,
         db: AsyncSession = Depends(get_db),
         movie: MovieModel = Depends(get_movie),
-        user: UserModel = Depends(get_user)
+        user: Principal = Depends(get_principal),
+        cache: ResponseCache = Depends(get_response_cache),
 ) -> CommentUpdateResponseSchema:
     """
     Update a specific comment by its ID.
@@ -256,6 +280,9 @@ async def update_comment(
     :param user: User session via decoded token, 404 if user not found or 403 if user is not active
     (provided via dependency injection).
     :type db: AsyncSession
+    :param cache: Response cache of the movie read endpoints; the movie's cached detail is
+    invalidated after the commit (provided via dependency injection).
+    :type cache: ResponseCache
 
     :raises HTTPException: Raises 404 error if comment with the given ID is not found.
     :raises HTTPException: Raises 403 error if user tries to update other users comments.
@@ -275,7 +302,7 @@ async def update_comment(
         raise HTTPException(status_code=404, detail="Comment not found.")
 
     is_owner = comment.user_id == user.id
-    is_moderator_or_admin = user.group.name in ("moderator", "admin")
+    is_moderator_or_admin = user.is_staff
 
     if not (is_owner or is_moderator_or_admin):
         raise HTTPException(status_code=403, detail="You can't update this comment.")
@@ -284,6 +311,7 @@ async def update_comment(
 
     try:
         await db.commit()
+        cache.invalidate_movie(movie.id, catalogue=False)
         await db.refresh(comment)
         return CommentUpdateResponseSchema.model_validate(comment)
     except IntegrityError:
@@ -4,8 +4,8 @@ from sqlalchemy import select, exists, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from cinema.config.dependencies import get_user, get_movie
-from cinema.database.models.accounts import UserModel
+from cinema.config.dependencies import get_principal, get_movie
+from cinema.cache import Principal
 from cinema.database.models.movies import MovieModel, FavouriteModel, FavouritesMoviesModel
 from cinema.schemas import MovieListItemSchema
 from cinema.schemas.accounts import MessageResponseSchema
@@ -38,7 +38,7 @@ router = APIRouter()
 )
 async def add_to_favourites(
     db: AsyncSession = Depends(get_db),
-    user: UserModel = Depends(get_user),
+    user: Principal = Depends(get_principal),
     movie: MovieModel = Depends(get_movie),
 ) -> MessageResponseSchema:
     """
@@ -49,7 +49,7 @@ async def add_to_favourites(
 
     Args:
         db (AsyncSession): Async SQLAlchemy DB session.
-        user (UserModel): Authenticated user from token (dependency).
+        user (Principal): Authenticated principal from token (dependency).
         movie (MovieModel): Movie instance from DB or 404 (dependency).
 
     Returns:
@@ -109,14 +109,14 @@ async def add_to_favourites(
 )
 async def get_favourites(
     db: AsyncSession = Depends(get_db),
-    user: UserModel = Depends(get_user),
+    user: Principal = Depends(get_principal),
 ) -> list[MovieListItemSchema]:
     """
     Retrieve the authenticated user's favourite movies.
 
     Args:
         db (AsyncSession): Async SQLAlchemy DB session.
-        user (UserModel): Authenticated user from token (dependency).
+        user (Principal): Authenticated principal from token (dependency).
 
     Returns:
         list[MovieModel]: A list of favourite movies (empty if none exist).
@@ -157,7 +157,7 @@ async def get_favourites(
 )
 async def remove_from_favourites(
     db: AsyncSession = Depends(get_db),
-    user: UserModel = Depends(get_user),
+    user: Principal = Depends(get_principal),
     movie: MovieModel = Depends(get_movie),
 ):
     """
@@ -165,7 +165,7 @@ async def remove_from_favourites(
 
     Args:
         db (AsyncSession): Async SQLAlchemy DB session.
-        user (UserModel): Authenticated user from token (dependency).
+        user (Principal): Authenticated principal from token (dependency).
         movie (MovieModel): Movie instance from DB or 404 (dependency).
 
     Returns:
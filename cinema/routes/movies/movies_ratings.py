@@ -1,13 +1,13 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.params import Depends
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cinema.config.dependencies import get_user, get_movie
-from cinema.database.models.accounts import UserModel
+from cinema.cache import Principal, ResponseCache
+from cinema.config.dependencies import get_response_cache, get_principal, get_movie
 from cinema.database.models.movies import MovieModel, RatingModel, RatingTypeEnum
 from cinema.schemas.movies import RatingRequestSchema, RatingResponseSchema
 from cinema.database import get_db
+from cinema.database.toggles import toggle_user_movie_value
 
 
 router = APIRouter()
@@ -39,8 +39,9 @@ router = APIRouter()
 async def toggle_rating(
     data: RatingRequestSchema,
     db: AsyncSession = Depends(get_db),
-    user: UserModel = Depends(get_user),
+    user: Principal = Depends(get_principal),
     movie: MovieModel = Depends(get_movie),
+    cache: ResponseCache = Depends(get_response_cache),
 ) -> RatingResponseSchema:
     """
     Create/update/remove a rating for a movie (toggle behavior).
@@ -50,11 +51,17 @@ async def toggle_rating(
     - If the user sends the same rating again -> delete it.
     - If the user sends a different rating -> update existing rating.
 
+    The toggle is a single upsert statement (see `toggle_user_movie_value`), so repeated or
+    concurrent requests cannot race on the unique constraint. The movie's `ratings_count`/`ratings_sum`
+    aggregates are updated by database triggers in the same transaction; the cached movie
+    detail and lists are invalidated after the commit.
+
     Args:
         data (RatingRequestSchema): Rating payload.
         db (AsyncSession): Async SQLAlchemy DB session.
-        user (UserModel): Authenticated user from token (dependency).
+        user (Principal): Authenticated principal from token (dependency).
         movie (MovieModel): Movie instance from DB or 404 (dependency).
+        cache (ResponseCache): Response cache of the movie read endpoints (dependency).
 
     Returns:
         RatingResponseSchema: Current rating (or null if removed) + message.
@@ -69,29 +76,11 @@ async def toggle_rating(
     if data.rating not in RatingTypeEnum:
         raise HTTPException(status_code=400, detail="Invalid input data.")
 
-    stmt = select(RatingModel).filter_by(movie_id=movie.id, user_id=user.id)
-    result = await db.execute(stmt)
-    rating = result.scalar_one_or_none()
-
-    if rating is None:
-        rating = RatingModel(
-            movie_id=movie.id,
-            user_id=user.id,
-            rating=data.rating,
-        )
-        db.add(rating)
-        message = f"You gave this movie {data.rating}"
-
-    elif rating.rating == data.rating:
-        await db.delete(rating)
-        rating = None
-        message = "Your rating was removed"
-
-    else:
-        rating.rating = data.rating
-        message = f"You gave this movie {data.rating}"
-
+    rating = await toggle_user_movie_value(db, RatingModel, "rating", user.id, movie.id, data.rating)
     await db.commit()
+    cache.invalidate_movie(movie.id)
+
+    message = f"You gave this movie {data.rating}" if rating else "Your rating was removed"
 
     return RatingResponseSchema(
         movie_id=movie.id,
@@ -1,13 +1,13 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.params import Depends
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cinema.config.dependencies import get_user, get_movie
-from cinema.database.models.accounts import UserModel
+from cinema.cache import Principal, ResponseCache
+from cinema.config.dependencies import get_response_cache, get_principal, get_movie
 from cinema.database.models.movies import MovieModel, MovieReactionModel, ReactionTypeEnum
 from cinema.schemas.movies import MovieReactionRequestSchema, MovieReactionResponseSchema
 from cinema.database import get_db
+from cinema.database.toggles import toggle_user_movie_value
 
 
 router = APIRouter()
@@ -39,8 +39,9 @@ router = APIRouter()
 async def toggle_reaction(
     data: MovieReactionRequestSchema,
     db: AsyncSession = Depends(get_db),
-    user: UserModel = Depends(get_user),
+    user: Principal = Depends(get_principal),
     movie: MovieModel = Depends(get_movie),
+    cache: ResponseCache = Depends(get_response_cache),
 ) -> MovieReactionResponseSchema:
     """
     Create/update/remove a reaction for a movie (toggle behavior).
@@ -50,11 +51,17 @@ async def toggle_reaction(
     - If the user sends the same reaction again -> delete it.
     - If the user sends a different reaction -> update existing reaction.
 
+    The toggle is a single upsert statement (see `toggle_user_movie_value`), so repeated or
+    concurrent requests cannot race on the unique constraint. The movie's `likes`/`dislikes`
+    aggregates are updated by database triggers in the same transaction; the cached movie
+    detail and lists are invalidated after the commit.
+
     Args:
         data (MovieReactionRequestSchema): Reaction payload.
         db (AsyncSession): Async SQLAlchemy DB session.
-        user (UserModel): Authenticated user from token (dependency).
+        user (Principal): Authenticated principal from token (dependency).
         movie (MovieModel): Movie instance from DB or 404 (dependency).
+        cache (ResponseCache): Response cache of the movie read endpoints (dependency).
 
     Returns:
         MovieReactionResponseSchema: Current reaction (or null if removed) + message.
@@ -69,29 +76,11 @@ async def toggle_reaction(
     if data.reaction not in ReactionTypeEnum:
         raise HTTPException(status_code=400, detail="Invalid input data.")
 
-    stmt = select(MovieReactionModel).filter_by(movie_id=movie.id, user_id=user.id)
-    result = await db.execute(stmt)
-    reaction = result.scalar_one_or_none()
-
-    if reaction is None:
-        reaction = MovieReactionModel(
-            movie_id=movie.id,
-            user_id=user.id,
-            reaction=data.reaction,
-        )
-        db.add(reaction)
-        message = f"You {data.reaction}d this movie"
-
-    elif reaction.reaction == data.reaction:
-        await db.delete(reaction)
-        reaction = None
-        message = "Your reaction was removed"
-
-    else:
-        reaction.reaction = data.reaction
-        message = f"You {data.reaction}d this movie"
-
+    reaction = await toggle_user_movie_value(db, MovieReactionModel, "reaction", user.id, movie.id, data.reaction)
     await db.commit()
+    cache.invalidate_movie(movie.id)
+
+    message = f"You {data.reaction}d this movie" if reaction else "Your reaction was removed"
 
     return MovieReactionResponseSchema(
         movie_id=movie.id,
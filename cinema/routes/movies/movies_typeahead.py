@@ -0,0 +1,52 @@
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cinema.config.dependencies import get_typeahead_index
+from cinema.database import get_db
+from cinema.database.typeahead import TypeaheadIndex, typeahead_search
+from cinema.schemas.movies import TypeaheadItemSchema, TypeaheadResponseSchema
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/typeahead/",
+    response_model=TypeaheadResponseSchema,
+    summary="Autocomplete movie titles, actors, directors and genres",
+    description=(
+        "<h3>Return the best matching names for a partially typed query.</h3>"
+        "<p>Up to <code>limit</code> matches are returned per kind "
+        "(<code>movies</code>, <code>actors</code>, <code>directors</code>, <code>genres</code>); "
+        "use <code>kinds</code> to restrict the lookup.</p>"
+        "<p>On PostgreSQL any substring matches (trigram indexes); on SQLite the query "
+        "must be a prefix of the name or of one of its words. Names starting with the "
+        "query are listed first.</p>"
+    ),
+)
+async def get_typeahead(
+        q: str = Query(..., min_length=1, max_length=100, description="Prefix or substring to complete."),
+        limit: int = Query(10, ge=1, le=50, description="Maximum number of matches per kind."),
+        kinds: Optional[List[Literal["movies", "actors", "directors", "genres"]]] = Query(
+            None, description="Kinds to search (all by default)."
+        ),
+        db: AsyncSession = Depends(get_db),
+        index: TypeaheadIndex = Depends(get_typeahead_index),
+) -> TypeaheadResponseSchema:
+    """
+    Autocomplete names for the given query.
+
+    Unlike the movie list `search`, this endpoint only looks at names and never
+    builds movie rows, so it stays cheap enough to call on every keystroke.
+
+    Returns:
+    - 200 with `TypeaheadResponseSchema` (kinds that were not requested are empty).
+    """
+    matches = await typeahead_search(db, index, q, limit, kinds)
+
+    return TypeaheadResponseSchema(**{
+        kind: [TypeaheadItemSchema(id=item_id, name=name) for item_id, name in items]
+        for kind, items in matches.items()
+    })
@@ -5,9 +5,10 @@ from pydantic import HttpUrl
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cinema.config.dependencies import get_s3_storage_client, get_jwt_auth_manager
+from cinema.cache import PrincipalCache
+from cinema.config.dependencies import get_s3_storage_client, get_jwt_auth_manager, get_principal_cache, load_principal
 from cinema.database import get_db
-from cinema.database.models.accounts import UserModel, UserProfileModel, GenderEnum, UserGroupModel, UserGroupEnum
+from cinema.database.models.accounts import UserModel, UserProfileModel, GenderEnum
 from cinema.exceptions import BaseSecurityError, S3FileUploadError
 from cinema.schemas.profiles import ProfileCreateSchema, ProfileResponseSchema
 from cinema.security.interfaces import JWTAuthManagerInterface
@@ -30,6 +31,7 @@ async def create_profile(
         jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
         db: AsyncSession = Depends(get_db),
         s3_client: S3StorageInterface = Depends(get_s3_storage_client),
+        principals: PrincipalCache = Depends(get_principal_cache),
         profile_data: ProfileCreateSchema = Depends(ProfileCreateSchema.from_form)
 ) -> ProfileResponseSchema:
     """
@@ -47,6 +49,7 @@ async def create_profile(
         jwt_manager (JWTAuthManagerInterface): JWT manager for decoding tokens.
         db (AsyncSession): The asynchronous database session.
         s3_client (S3StorageInterface): The asynchronous S3 storage client.
+        principals (PrincipalCache): The principal cache, used to authorize staff from the token claims.
         profile_data (ProfileCreateSchema): The profile data from the form.
 
     Returns:
@@ -59,25 +62,18 @@ async def create_profile(
     try:
         payload = jwt_manager.decode_access_token(token)
         token_user_id = payload.get("user_id")
+        requestor = await load_principal(payload, db, principals) if user_id != token_user_id else None
     except BaseSecurityError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e)
         )
 
-    if user_id != token_user_id:
-        stmt = (
-            select(UserGroupModel)
-            .join(UserModel)
-            .where(UserModel.id == token_user_id)
+    if user_id != token_user_id and (requestor is None or not requestor.is_staff):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to edit this profile."
         )
-        result = await db.execute(stmt)
-        user_group = result.scalars().first()
-        if not user_group or user_group.name == UserGroupEnum.USER:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to edit this profile."
-            )
 
     stmt = select(UserModel).where(UserModel.id == user_id)
     result = await db.execute(stmt)
@@ -97,11 +93,11 @@ async def create_profile(
             detail="User already has a profile."
         )
 
-    avatar_bytes = await profile_data.avatar.read()
-    avatar_key = f"avatars/{user.id}_{profile_data.avatar.filename}"
+    avatar = profile_data.avatar_image
+    avatar_key = f"avatars/{user.id}_{avatar.filename}"
 
     try:
-        await s3_client.upload_file(file_name=avatar_key, file_data=avatar_bytes)
+        await s3_client.upload_file(file_name=avatar_key, file_data=avatar.data, content_type=avatar.content_type)
     except S3FileUploadError as e:
         print(f"Error uploading avatar to S3: {e}")
         raise HTTPException(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, List, Literal
+from typing import Dict, Optional, List, Literal
 
 from pydantic import BaseModel, Field, field_validator
 from cinema.database.models.movies import CertificationEnum, ReactionTypeEnum, RatingTypeEnum
@@ -164,6 +164,17 @@ class MovieBaseSchema(BaseModel):
         return value
 
 
+class MovieReactionsSummarySchema(BaseModel):
+    likes: int = 0
+    dislikes: int = 0
+
+
+class MovieRatingsSummarySchema(BaseModel):
+    count: int = 0
+    average: Optional[Decimal] = None
+    distribution: Dict[int, int] = Field(default_factory=dict)
+
+
 class MovieDetailSchema(MovieBaseSchema):
     id: int
     country: CountrySchema
@@ -171,9 +182,10 @@ class MovieDetailSchema(MovieBaseSchema):
     actors: List[ActorSchema]
     directors: List[DirectorSchema]
     languages: List[LanguageSchema]
-    comments: List[CommentCreateResponseSchema] = Field(default_factory=list)
-    reactions: List[MovieReactionResponseSchema] = Field(default_factory=list)
-    ratings: List[RatingResponseSchema] = Field(default_factory=list)
+    comments: List[CommentReadSchema] = Field(default_factory=list)
+    comments_count: int = 0
+    reactions: MovieReactionsSummarySchema = Field(default_factory=MovieReactionsSummarySchema)
+    ratings: MovieRatingsSummarySchema = Field(default_factory=MovieRatingsSummarySchema)
 
     model_config = {"from_attributes": True}
 
@@ -184,6 +196,10 @@ class MovieListItemSchema(BaseModel):
     year: int
     imdb: Decimal
     description: str
+    ratings_count: int = 0
+    average_rating: Optional[Decimal] = None
+    likes: int = 0
+    dislikes: int = 0
 
     model_config = {"from_attributes": True}
 
@@ -192,8 +208,10 @@ class MovieListResponseSchema(BaseModel):
     movies: List[MovieListItemSchema]
     prev_page: Optional[str] = None
     next_page: Optional[str] = None
-    total_pages: int
-    total_items: int
+    next_cursor: Optional[str] = None
+    total_pages: Optional[int] = None
+    total_items: Optional[int] = None
+    total_exact: Optional[bool] = None
 
     model_config = {"from_attributes": True}
 
@@ -222,6 +240,18 @@ class MovieCreateSchema(MovieBaseSchema):
         return [str(item).strip().title() for item in value]
 
 
+class MovieBulkErrorSchema(BaseModel):
+    loc: List[str | int] = Field(default_factory=list)
+    msg: str
+
+
+class MovieBulkResultSchema(BaseModel):
+    index: int
+    status: Literal["created", "duplicate", "invalid"]
+    id: Optional[int] = None
+    errors: List[MovieBulkErrorSchema] = Field(default_factory=list)
+
+
 class MovieUpdateSchema(BaseModel):
     name: Optional[str] = Field(None, max_length=255)
     year: Optional[int] = None
@@ -262,6 +292,22 @@ class GenreListResponseSchema(BaseModel):
     model_config = {"from_attributes": True}
 
 
+# -------------------------
+# Typeahead
+# -------------------------
+
+class TypeaheadItemSchema(BaseModel):
+    id: int
+    name: str
+
+
+class TypeaheadResponseSchema(BaseModel):
+    movies: List[TypeaheadItemSchema] = Field(default_factory=list)
+    actors: List[TypeaheadItemSchema] = Field(default_factory=list)
+    directors: List[TypeaheadItemSchema] = Field(default_factory=list)
+    genres: List[TypeaheadItemSchema] = Field(default_factory=list)
+
+
 # -------------------------
 # Favourites
 # -------------------------
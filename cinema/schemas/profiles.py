@@ -1,9 +1,10 @@
 from datetime import date
 
 from fastapi import UploadFile, Form, File, HTTPException
-from pydantic import BaseModel, field_validator, HttpUrl
+from pydantic import BaseModel, PrivateAttr, field_validator, model_validator, HttpUrl
 
 from cinema.validation.profile import (
+    AvatarImage,
     validate_name,
     validate_image,
     validate_gender,
@@ -19,6 +20,8 @@ class ProfileCreateSchema(BaseModel):
     info: str
     avatar: UploadFile
 
+    _avatar_image: AvatarImage = PrivateAttr()
+
     @classmethod
     def from_form(
             cls,
@@ -55,12 +58,14 @@ class ProfileCreateSchema(BaseModel):
                 }]
             )
 
-    @field_validator("avatar")
-    @classmethod
-    def validate_avatar(cls, avatar: UploadFile) -> UploadFile:
+    @model_validator(mode="after")
+    def validate_avatar(self) -> "ProfileCreateSchema":
+        """
+        Validate the avatar after the other fields, reading it once; the contents are kept in `avatar_image`.
+        """
         try:
-            validate_image(avatar)
-            return avatar
+            self._avatar_image = validate_image(self.avatar)
+            return self
         except ValueError as e:
             raise HTTPException(
                 status_code=422,
@@ -68,10 +73,14 @@ class ProfileCreateSchema(BaseModel):
                     "type": "value_error",
                     "loc": ["avatar"],
                     "msg": str(e),
-                    "input": avatar.filename
+                    "input": self.avatar.filename
                 }]
             )
 
+    @property
+    def avatar_image(self) -> AvatarImage:
+        return self._avatar_image
+
     @field_validator("gender")
     @classmethod
     def validate_gender(cls, gender: str) -> str:
@@ -1,10 +1,50 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    bcrypt__rounds=14,
-    deprecated="auto"
-)
+from cinema.config.settings import get_settings
+from cinema.exceptions.security import PasswordHasherBusyError
+
+T = TypeVar("T")
+
+# Threads hashing at the same time; bcrypt releases the GIL, so each one can use a core.
+PASSWORD_HASHER_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# Jobs allowed to wait for a free thread; beyond that, callers get `PasswordHasherBusyError`.
+# At cost 14 (~1 s per hash) this caps the queueing delay at roughly 4 s.
+PASSWORD_HASHER_MAX_PENDING = PASSWORD_HASHER_MAX_WORKERS * 4
+
+
+def create_password_context(rounds: int) -> CryptContext:
+    """
+    Build the bcrypt password context for a cost factor.
+
+    The minimum and maximum rounds are pinned to the same cost, so `needs_update` flags every
+    hash made with a different cost, cheaper or more expensive.
+
+    Args:
+        rounds (int): The bcrypt cost factor (4-31).
+
+    Returns:
+        CryptContext: The configured password context.
+    """
+    return CryptContext(
+        schemes=["bcrypt"],
+        bcrypt__rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+        deprecated="auto"
+    )
+
+
+pwd_context = create_password_context(get_settings().BCRYPT_ROUNDS)
 
 
 def hash_password(password: str) -> str:
@@ -38,3 +78,148 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         bool: True if the password is correct, False otherwise.
     """
     return pwd_context.verify(plain_password, hashed_password)
+
+
+@dataclass(frozen=True)
+class PasswordHasherMetrics:
+    """
+    Snapshot of a `PasswordHasher`'s counters; times are cumulative seconds.
+    """
+    submitted: int
+    completed: int
+    rejected: int
+    in_flight: int
+    peak_in_flight: int
+    queue_wait_seconds: float
+    run_seconds: float
+
+
+class PasswordHasher:
+    """
+    Run password hashing and verification in a bounded thread pool.
+
+    A bcrypt hash at cost 14 takes about a second of CPU; called directly from an async
+    handler it stalls the event loop, and every other request on the worker, for that long.
+    Here the work runs on at most `max_workers` threads, and at most `max_pending` jobs wait
+    for one. When both are taken, calls fail fast with `PasswordHasherBusyError` (served as
+    503) instead of growing an unbounded queue that would time out anyway.
+    """
+
+    def __init__(
+            self,
+            context: CryptContext = pwd_context,
+            max_workers: int = PASSWORD_HASHER_MAX_WORKERS,
+            max_pending: int = PASSWORD_HASHER_MAX_PENDING,
+    ) -> None:
+        self._context = context
+        self._max_workers = max_workers
+        self._capacity = max_workers + max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+        self._queue_wait = 0.0
+        self._run_time = 0.0
+
+    @property
+    def context(self) -> CryptContext:
+        return self._context
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a plain-text password off the event loop.
+
+        :raises PasswordHasherBusyError: If the pool and its queue are full.
+        """
+        return await self._run(self._context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a plain-text password against its hash off the event loop.
+
+        :raises PasswordHasherBusyError: If the pool and its queue are full.
+        """
+        return await self._run(self._context.verify, plain_password, hashed_password)
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """
+        Whether a hash was made with another scheme or cost than the configured one.
+        Only parses the hash, so it is cheap enough to call on the event loop.
+        """
+        return self._context.needs_update(hashed_password)
+
+    def metrics(self) -> PasswordHasherMetrics:
+        with self._lock:
+            return PasswordHasherMetrics(
+                submitted=self._submitted,
+                completed=self._completed,
+                rejected=self._rejected,
+                in_flight=self._in_flight,
+                peak_in_flight=self._peak_in_flight,
+                queue_wait_seconds=self._queue_wait,
+                run_seconds=self._run_time,
+            )
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker threads after the jobs already submitted; the pool is recreated on next use.
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            if self._in_flight >= self._capacity:
+                self._rejected += 1
+                raise PasswordHasherBusyError()
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            self._submitted += 1
+
+        # The slot is released when the job itself finishes (or is cancelled before it starts),
+        # not when the caller stops waiting, so abandoned requests cannot overfill the pool.
+        try:
+            future = self._get_executor().submit(self._timed, func, time.perf_counter(), *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _timed(self, func: Callable[..., T], queued_at: float, *args: Any) -> T:
+        started_at = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            finished_at = time.perf_counter()
+            with self._lock:
+                self._completed += 1
+                self._queue_wait += started_at - queued_at
+                self._run_time += finished_at - started_at
+
+    def _release(self, future: Optional[Future] = None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="password-hasher"
+            )
+        return self._executor
+
+
+async def log_password_hasher_metrics(hasher: PasswordHasher, interval: float) -> None:
+    """
+    Log a `PasswordHasherMetrics` snapshot of the hasher every `interval` seconds until cancelled.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        logging.info(f"Password hasher: {hasher.metrics()}")
+
+
+password_hasher = PasswordHasher()
@@ -1,16 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import Union
+
+from cinema.storages.streams import FileData
 
 
 class S3StorageInterface(ABC):
 
     @abstractmethod
-    async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray]) -> None:
+    async def upload_file(self, file_name: str, file_data: FileData, content_type: str = "image/jpeg") -> None:
         """
         Uploads a file to the storage.
 
         :param file_name: The name of the file to be stored.
-        :param file_data: The file data in bytes.
+        :param file_data: The file data in bytes, a view of them, or an async iterator of byte chunks.
+        :param content_type: The media type stored with the file.
         :return: URL of the uploaded file.
         """
         pass
@@ -24,3 +26,16 @@ class S3StorageInterface(ABC):
         :return: The full URL to access the file.
         """
         pass
+
+    async def open(self) -> None:
+        """
+        Acquire the storage's resources, such as its connection pool, ahead of the first upload;
+        a no-op by default.
+        """
+        return None
+
+    async def aclose(self) -> None:
+        """
+        Release the storage's resources, such as its pooled connections; a no-op by default.
+        """
+        return None
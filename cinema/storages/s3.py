@@ -1,8 +1,12 @@
-from typing import Union
+import asyncio
+from contextlib import AsyncExitStack, suppress
+from typing import Any, Optional, Union
 
 import aioboto3
+from aiobotocore.config import AioConfig
 from botocore.exceptions import (
     BotoCoreError,
+    ClientError,
     NoCredentialsError,
     HTTPClientError,
     ConnectionError
@@ -10,6 +14,17 @@ from botocore.exceptions import (
 
 from cinema.exceptions import S3ConnectionError, S3FileUploadError
 from cinema.storages.interfaces import S3StorageInterface
+from cinema.storages.streams import ChunkReader, FileData
+
+# Maximum number of HTTP connections kept open to the storage by one worker.
+S3_MAX_POOL_CONNECTIONS = 10
+
+# Uploads larger than this are sent as a multipart upload, in parts of S3_MULTIPART_CHUNK_SIZE.
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+S3_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+
+# S3 rejects multipart uploads with a part (other than the last one) smaller than this.
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
 
 
 class S3StorageClient(S3StorageInterface):
@@ -19,52 +34,96 @@ class S3StorageClient(S3StorageInterface):
         endpoint_url: str,
         access_key: str,
         secret_key: str,
-        bucket_name: str
+        bucket_name: str,
+        max_pool_connections: int = S3_MAX_POOL_CONNECTIONS,
+        multipart_threshold: int = S3_MULTIPART_THRESHOLD,
+        multipart_chunk_size: int = S3_MULTIPART_CHUNK_SIZE,
     ):
         """
         Initialize the asynchronous S3 Storage Client using an aioboto3 Session.
 
+        The S3 client itself, with its connection pool, is created on `open` (or the first
+        upload) and then reused by every upload until `aclose`.
+
         Args:
             endpoint_url (str): S3-compatible storage endpoint.
             access_key (str): Access key for authentication.
             secret_key (str): Secret key for authentication.
             bucket_name (str): Name of the bucket where files will be stored.
+            max_pool_connections (int): Maximum number of pooled HTTP connections.
+            multipart_threshold (int): Size above which files are uploaded in parts.
+            multipart_chunk_size (int): Size of the parts of a multipart upload.
         """
+        if multipart_chunk_size < S3_MIN_PART_SIZE:
+            raise ValueError(f"multipart_chunk_size must be at least {S3_MIN_PART_SIZE} bytes")
         self._endpoint_url = endpoint_url
         self._access_key = access_key
         self._secret_key = secret_key
         self._bucket_name = bucket_name
+        self._multipart_threshold = multipart_threshold
+        self._multipart_chunk_size = multipart_chunk_size
+        self._config = AioConfig(max_pool_connections=max_pool_connections)
 
         self._session = aioboto3.Session(
             aws_access_key_id=self._access_key,
             aws_secret_access_key=self._secret_key,
         )
+        self._client: Any = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._lock = asyncio.Lock()
 
-    async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray]) -> None:
+    async def open(self) -> None:
+        """
+        Create the S3 client and its connection pool; called when the application starts.
+        """
+        await self._get_client()
+
+    async def aclose(self) -> None:
+        """
+        Close the S3 client and its pooled connections; called when the application shuts down.
+        """
+        if self._exit_stack is not None:
+            exit_stack, self._exit_stack, self._client = self._exit_stack, None, None
+            await exit_stack.aclose()
+
+    async def upload_file(
+            self,
+            file_name: str,
+            file_data: FileData,
+            content_type: str = "image/jpeg",
+    ) -> None:
         """
         Asynchronously upload a file to the S3-compatible storage.
 
+        Files up to the multipart threshold are sent with a single request; larger ones,
+        and streams that turn out to be larger, are sent as a multipart upload, reading
+        one part of the stream at a time.
+
         Args:
             file_name (str): The name of the file to be stored.
-            file_data (Union[bytes, bytearray]): The file data in bytes.
+            file_data (FileData): The file data in bytes, a view of them, or an async iterator of byte chunks.
+            content_type (str): The media type stored with the file.
 
         Raises:
             S3ConnectionError: If there is a connection error with S3.
             S3FileUploadError: If the file upload fails due to a BotoCore error.
         """
+        reader = ChunkReader(file_data)
         try:
-            async with self._session.client(
-                "s3", endpoint_url=self._endpoint_url
-            ) as client:
+            client = await self._get_client()
+            if await reader.fill(self._multipart_threshold + 1) <= self._multipart_threshold:
                 await client.put_object(
                     Bucket=self._bucket_name,
                     Key=file_name,
-                    Body=file_data,
-                    ContentType="image/jpeg"
+                    Body=_request_body(await reader.read(self._multipart_threshold)),
+                    ContentType=content_type
                 )
+            else:
+                await self._upload_parts(client, file_name, reader, content_type)
         except (ConnectionError, HTTPClientError, NoCredentialsError) as e:
             raise S3ConnectionError(f"Failed to connect to S3 storage: {str(e)}") from e
-        except BotoCoreError as e:
+        except (BotoCoreError, ClientError) as e:
             raise S3FileUploadError(f"Failed to upload to S3 storage: {str(e)}") from e
 
     async def get_file_url(self, file_name: str) -> str:
@@ -78,3 +137,60 @@ class S3StorageClient(S3StorageInterface):
             str: The full URL to access the file.
         """
         return f"{self._endpoint_url}/{self._bucket_name}/{file_name}"
+
+    async def _get_client(self) -> Any:
+        # The client's connections belong to the event loop it was created on; on another
+        # loop (e.g. successive `asyncio.run` calls) the old client is closed and a new one
+        # is created.
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is loop:
+            return self._client
+        async with self._lock:
+            if self._client is None or self._client_loop is not loop:
+                await self.aclose()
+                exit_stack = AsyncExitStack()
+                self._client = await exit_stack.enter_async_context(
+                    self._session.client("s3", endpoint_url=self._endpoint_url, config=self._config)
+                )
+                self._client_loop, self._exit_stack = loop, exit_stack
+            return self._client
+
+    async def _upload_parts(self, client: Any, file_name: str, reader: ChunkReader, content_type: str) -> None:
+        upload = await client.create_multipart_upload(
+            Bucket=self._bucket_name, Key=file_name, ContentType=content_type
+        )
+        upload_id = upload["UploadId"]
+        parts = []
+        try:
+            while part := await reader.read(self._multipart_chunk_size):
+                part_number = len(parts) + 1
+                response = await client.upload_part(
+                    Bucket=self._bucket_name,
+                    Key=file_name,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=_request_body(part)
+                )
+                parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+            await client.complete_multipart_upload(
+                Bucket=self._bucket_name,
+                Key=file_name,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts}
+            )
+        except BaseException:
+            with suppress(BotoCoreError, ClientError):
+                await client.abort_multipart_upload(Bucket=self._bucket_name, Key=file_name, UploadId=upload_id)
+            raise
+
+
+def _request_body(file_data: Union[bytes, bytearray, memoryview]) -> Union[bytes, bytearray]:
+    """
+    botocore only takes bytes, bytearrays and file objects: pass a view spanning a whole buffer
+    as that buffer, so it is not copied.
+    """
+    if not isinstance(file_data, memoryview):
+        return file_data
+    if isinstance(file_data.obj, (bytes, bytearray)) and file_data.nbytes == len(file_data.obj):
+        return file_data.obj
+    return file_data.tobytes()
@@ -0,0 +1,54 @@
+from typing import AsyncIterable, AsyncIterator, Optional, Union
+
+FileData = Union[bytes, bytearray, memoryview, AsyncIterable[bytes]]
+
+
+class ChunkReader:
+    """
+    Reads the body of an upload, either a buffer or an async iterator of byte chunks of any
+    size, in parts of the size the caller asks for.
+
+    Parts of a buffer are views of it, so they are not copied; parts of a stream are copied
+    out of an internal buffer holding at most the part being read.
+    """
+
+    def __init__(self, file_data: FileData) -> None:
+        self._view: Optional[memoryview] = None
+        self._chunks: Optional[AsyncIterator[bytes]] = None
+        self._buffer = bytearray()
+        self._offset = 0
+        if isinstance(file_data, (bytes, bytearray, memoryview)):
+            self._view = memoryview(file_data).cast("B")
+        else:
+            self._chunks = aiter(file_data)
+
+    async def fill(self, size: int) -> int:
+        """
+        Make at least `size` bytes available to `read` if the body has them.
+
+        Returns:
+            int: The number of bytes available, which is less than `size` only at the end of the body.
+        """
+        if self._view is not None:
+            return min(size, len(self._view) - self._offset)
+        while len(self._buffer) < size and self._chunks is not None:
+            chunk = await anext(self._chunks, None)
+            if chunk is None:
+                self._chunks = None
+            else:
+                self._buffer += chunk
+        return min(size, len(self._buffer))
+
+    async def read(self, size: int) -> Union[memoryview, bytes]:
+        """
+        Read the next part of the body, `size` bytes long unless the body ends first;
+        an empty result means the body is exhausted.
+        """
+        size = await self.fill(size)
+        if self._view is not None:
+            part = self._view[self._offset: self._offset + size]
+            self._offset += size
+            return part
+        part = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return part
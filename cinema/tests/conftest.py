@@ -3,14 +3,27 @@ import pytest_asyncio
 from botocore.exceptions import ClientError
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy import insert, select
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from cinema.config.dependencies import get_accounts_email_notificator, get_s3_storage_client
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from cinema.config.dependencies import (
+    get_accounts_email_notificator,
+    get_s3_storage_client,
+    get_typeahead_index,
+    get_response_cache,
+    get_count_cache,
+    get_principal_cache,
+)
 from cinema.config.settings import get_settings
 from cinema.database.models.accounts import UserGroupModel, UserGroupEnum, UserModel
 
-from cinema.database import reset_database, get_db_contextmanager
+from cinema.database import reset_database, get_db_contextmanager, get_db
+from cinema.database.models.base import Base
 from cinema.database.populate import CSVDatabaseSeeder
+from cinema.database.typeahead import TypeaheadIndex
+from cinema.cache import PrincipalCache, ResponseCache, TTLCache
+from cinema.cache.counts import COUNT_CACHE_MAX_ENTRIES, COUNT_CACHE_TTL_SECONDS
 from cinema.main import app
 from cinema.security.interfaces import JWTAuthManagerInterface
 from cinema.security.token_manager import JWTAuthManager
@@ -106,15 +119,27 @@ async def s3_client(settings):
 @pytest_asyncio.fixture(scope="function")
 async def client(email_sender_stub, s3_storage_fake):
     """
-    Provide an asynchronous HTTP client for testing.
+    Provide an asynchronous HTTP client for testing, running the application lifespan around it
+    (ASGITransport does not send lifespan events).
 
-    Overrides the dependencies for email sender and S3 storage with test doubles.
+    Overrides the dependencies for email sender and S3 storage with test doubles,
+    and gives each test its own typeahead index, response, count and principal caches since
+    the database is reset per test.
     """
+    typeahead_index = TypeaheadIndex()
+    response_cache = ResponseCache()
+    count_cache = TTLCache(COUNT_CACHE_TTL_SECONDS, COUNT_CACHE_MAX_ENTRIES)
+    principal_cache = PrincipalCache()
     app.dependency_overrides[get_accounts_email_notificator] = lambda: email_sender_stub
     app.dependency_overrides[get_s3_storage_client] = lambda: s3_storage_fake
+    app.dependency_overrides[get_typeahead_index] = lambda: typeahead_index
+    app.dependency_overrides[get_response_cache] = lambda: response_cache
+    app.dependency_overrides[get_count_cache] = lambda: count_cache
+    app.dependency_overrides[get_principal_cache] = lambda: principal_cache
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as async_client:
-        yield async_client
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as async_client:
+            yield async_client
 
     app.dependency_overrides.clear()
 
@@ -126,8 +151,9 @@ async def e2e_client():
 
     This client is available at the session scope.
     """
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as async_client:
-        yield async_client
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as async_client:
+            yield async_client
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -211,6 +237,72 @@ async def seed_database(db_session):
     yield db_session
 
 
+@pytest_asyncio.fixture(scope="function")
+async def concurrent_db(client, tmp_path):
+    """
+    Serve the app from a seeded, file-backed SQLite database with one connection per session.
+
+    The in-memory test database shares a single connection between all sessions, so
+    concurrent requests would interleave their transactions on it. Tests that fire
+    parallel requests use this fixture instead; SQLite then serialises the writers
+    with its own locking. Yields the session factory bound to that database.
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'cinema.db'}",
+        poolclass=NullPool,
+        connect_args={"timeout": 60},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = sessionmaker(  # type: ignore
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
+    async with session_factory() as session:
+        await CSVDatabaseSeeder(csv_file_path=get_settings().PATH_TO_MOVIES_CSV, db_session=session).seed()
+
+    async def get_concurrent_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = get_concurrent_db
+    yield session_factory
+
+    app.dependency_overrides.pop(get_db, None)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def concurrent_user_token(concurrent_db, jwt_manager):
+    """
+    Create an active regular user in the `concurrent_db` database and issue an access token for it.
+
+    Returns:
+        dict: A dictionary containing:
+            - "user_id": ID of the created user
+            - "token": JWT access token
+    """
+    async with concurrent_db() as session:
+        stmt = select(UserGroupModel).where(UserGroupModel.name == UserGroupEnum.USER)
+        user_group = (await session.execute(stmt)).scalar_one()
+
+        user = UserModel.create(
+            email="concurrent@email.com",
+            raw_password="UserPassword123@@",
+            group_id=user_group.id
+        )
+        user.is_active = True
+        session.add(user)
+        await session.commit()
+
+    return {
+        "user_id": user.id,
+        "token": jwt_manager.create_access_token({"user_id": user.id}),
+    }
+
+
 @pytest_asyncio.fixture(scope="session", autouse=True)
 async def ensure_minio_bucket(settings):
     """
@@ -0,0 +1,86 @@
+import asyncio
+from typing import List, Optional, Set
+
+
+class FakeSMTPServer:
+    """
+    Minimal SMTP relay for unit testing, served on a local port.
+
+    It understands just enough of the protocol for `aiosmtplib` to send mail, accepts
+    every message and records it, and counts the connections it receives. Use it as an
+    async context manager, inside the test, so it is served by the test's event loop.
+    """
+
+    def __init__(self):
+        """
+        Initialize the server with no connections and no messages.
+        """
+        self.connections = 0
+        self.messages: List[bytes] = []
+        # When set, every connection is dropped as soon as a message is started (MAIL FROM).
+        self.drop_on_mail = False
+        self.port: Optional[int] = None
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        """
+        Start listening on a free local port, stored in `port`.
+        """
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """
+        Drop every connection and stop listening.
+        """
+        self.drop_connections()
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def __aenter__(self) -> "FakeSMTPServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def drop_connections(self) -> None:
+        """
+        Close the open client connections, as a relay does with clients idle for too long.
+        """
+        for writer in list(self._writers):
+            writer.close()
+        self._writers.clear()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+        writer.write(b"220 fake ESMTP\r\n")
+        try:
+            while line := await reader.readline():
+                command = line.decode().strip().upper()
+                if command.startswith("MAIL") and self.drop_on_mail:
+                    break
+                if command.startswith("EHLO"):
+                    writer.write(b"250-fake\r\n250 OK\r\n")
+                elif command == "DATA":
+                    writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                    await writer.drain()
+                    data = b""
+                    while (line := await reader.readline()) not in (b".\r\n", b""):
+                        data += line
+                    self.messages.append(data)
+                    writer.write(b"250 OK\r\n")
+                elif command == "QUIT":
+                    writer.write(b"221 Bye\r\n")
+                    await writer.drain()
+                    break
+                else:
+                    writer.write(b"250 OK\r\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
@@ -1,6 +1,8 @@
-from typing import Dict, Union
+from typing import Dict, List
 
 from cinema.storages.interfaces import S3StorageInterface
+from cinema.storages.s3 import S3_MULTIPART_CHUNK_SIZE, S3_MULTIPART_THRESHOLD
+from cinema.storages.streams import ChunkReader, FileData
 
 
 class FakeS3Storage(S3StorageInterface):
@@ -8,23 +10,42 @@ class FakeS3Storage(S3StorageInterface):
     Fake S3 Storage class for unit testing.
 
     This class simulates an S3 storage by storing files in an internal dictionary
-    instead of actually uploading them to a remote server.
+    instead of actually uploading them to a remote server. Like `S3StorageClient`, it reads
+    files larger than the multipart threshold one part at a time, and records the part sizes.
     """
 
-    def __init__(self):
+    def __init__(
+            self,
+            multipart_threshold: int = S3_MULTIPART_THRESHOLD,
+            multipart_chunk_size: int = S3_MULTIPART_CHUNK_SIZE,
+    ):
         """
         Initialize the fake storage with an empty dictionary.
         """
         self.storage: Dict[str, bytes] = {}
+        self.content_types: Dict[str, str] = {}
+        self.parts: Dict[str, List[int]] = {}
+        self._multipart_threshold = multipart_threshold
+        self._multipart_chunk_size = multipart_chunk_size
 
-    async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray]) -> None:
+    async def upload_file(self, file_name: str, file_data: FileData, content_type: str = "image/jpeg") -> None:
         """
-        Simulates file upload to S3 by storing the file data in a dictionary.
+        Simulates file upload to S3 by storing a copy of the file data in a dictionary.
 
         :param file_name: The name of the file to be stored.
-        :param file_data: The file data in bytes.
+        :param file_data: The file data in bytes, a view of them, or an async iterator of byte chunks.
+        :param content_type: The media type stored with the file.
         """
-        self.storage[file_name] = file_data
+        reader = ChunkReader(file_data)
+        if await reader.fill(self._multipart_threshold + 1) <= self._multipart_threshold:
+            parts = [bytes(await reader.read(self._multipart_threshold))]
+        else:
+            parts = []
+            while part := await reader.read(self._multipart_chunk_size):
+                parts.append(bytes(part))
+        self.storage[file_name] = b"".join(parts)
+        self.content_types[file_name] = content_type
+        self.parts[file_name] = [len(part) for part in parts]
 
     async def get_file_url(self, file_name: str) -> str:
         """
@@ -5,6 +5,7 @@ from PIL import Image
 from sqlalchemy import select
 
 from cinema.database.models.accounts import UserModel, UserProfileModel
+from cinema.storages.s3 import S3_MIN_PART_SIZE, S3StorageClient
 
 
 @pytest.mark.e2e
@@ -89,3 +90,55 @@ async def test_create_user_profile(e2e_client, e2e_db_session, settings, s3_clie
         )
 
     assert "Contents" in response, f"Avatar {avatar_key} was not found in MinIO!"
+
+
+@pytest.mark.e2e
+@pytest.mark.order(8)
+@pytest.mark.asyncio
+async def test_streamed_multipart_upload(settings):
+    """
+    End-to-end test for streamed uploads through a long-lived `S3StorageClient`.
+
+    Steps:
+    1. Upload a small buffer, then a stream larger than the multipart threshold, with the same client.
+    2. Read both objects back from MinIO.
+
+    Expected result:
+    - The small file is stored with a single request and its content type
+    - The stream is stored as a multipart upload of three parts, byte for byte
+    """
+    storage = S3StorageClient(
+        endpoint_url=settings.S3_STORAGE_ENDPOINT,
+        access_key=settings.S3_STORAGE_ACCESS_KEY,
+        secret_key=settings.S3_STORAGE_SECRET_KEY,
+        bucket_name=settings.S3_BUCKET_NAME,
+        multipart_threshold=S3_MIN_PART_SIZE,
+        multipart_chunk_size=S3_MIN_PART_SIZE,
+    )
+    payload = bytes(range(256)) * (S3_MIN_PART_SIZE // 256 * 2 + 4096)
+
+    async def stream():
+        for offset in range(0, len(payload), 1024 * 1024):
+            yield payload[offset: offset + 1024 * 1024]
+
+    try:
+        await storage.open()
+        await storage.upload_file("streams/small.png", memoryview(b"small file"), content_type="image/png")
+        await storage.upload_file("streams/large.bin", stream(), content_type="application/octet-stream")
+    finally:
+        await storage.aclose()
+
+    session = aioboto3.Session()
+    async with session.client(
+        "s3",
+        endpoint_url=settings.S3_STORAGE_ENDPOINT,
+        aws_access_key_id=settings.S3_STORAGE_ACCESS_KEY,
+        aws_secret_access_key=settings.S3_STORAGE_SECRET_KEY
+    ) as s3:
+        small = await s3.get_object(Bucket=settings.S3_BUCKET_NAME, Key="streams/small.png")
+        assert small["ContentType"] == "image/png"
+        assert await small["Body"].read() == b"small file"
+
+        large = await s3.get_object(Bucket=settings.S3_BUCKET_NAME, Key="streams/large.bin")
+        assert large["ETag"].strip('"').endswith("-3"), f"Expected a 3-part upload, got ETag {large['ETag']}"
+        assert await large["Body"].read() == payload
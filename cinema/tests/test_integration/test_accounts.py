@@ -1,19 +1,29 @@
+import asyncio
 from datetime import datetime, timezone, timedelta
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
-from sqlalchemy import select, delete, func
+from sqlalchemy import select, delete, func, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
 
+from cinema.config.dependencies import get_password_hasher
 from cinema.database.models.accounts import (
     UserModel,
     ActivationTokenModel,
     PasswordResetTokenModel,
     UserGroupModel,
     UserGroupEnum,
-    RefreshTokenModel
+    RefreshTokenModel,
+    EmailKindEnum,
+    EmailOutboxModel
 )
+from cinema.database import get_db_contextmanager
+from cinema.exceptions import BaseEmailError
+from cinema.main import app
+from cinema.notifications.outbox import EmailOutboxDispatcher
+from cinema.security.passwords import PasswordHasher, create_password_context
+from cinema.tests.test_integration.test_movies_cache import StatementCounter
 
 
 @pytest.mark.asyncio
@@ -740,6 +750,87 @@ async def test_login_user_success(client, db_session, jwt_manager, seed_user_gro
     assert expires_at > datetime.now(timezone.utc), "Refresh token is already expired."
 
 
+@pytest.mark.asyncio
+async def test_login_user_password_hasher_saturated(client, db_session, seed_user_groups):
+    """
+    Test login sheds load with 503 while the password hasher is saturated.
+
+    Steps:
+    - Serve requests with a hasher of one thread and no queue, and keep it busy with a hash.
+    - Log in, then log in again once the hash has finished.
+
+    Expected result:
+    - The first login gets 503 with `Retry-After` and counts as rejected
+    - The second login succeeds and both jobs show up in the metrics
+    """
+    user_group = (await db_session.execute(
+        select(UserGroupModel).where(UserGroupModel.name == UserGroupEnum.USER)
+    )).scalars().first()
+    user = UserModel.create(email="busy@example.com", raw_password="StrongPassword123!", group_id=user_group.id)
+    user.is_active = True
+    db_session.add(user)
+    await db_session.commit()
+
+    hasher = PasswordHasher(max_workers=1, max_pending=0)
+    app.dependency_overrides[get_password_hasher] = lambda: hasher
+    login_payload = {"email": "busy@example.com", "password": "StrongPassword123!"}
+    try:
+        occupied = asyncio.ensure_future(hasher.hash("Occupied123!"))
+        await asyncio.sleep(0)
+
+        response = await client.post("/api/v1/accounts/login/", json=login_payload)
+        assert response.status_code == 503, f"Expected status code 503, but got {response.status_code}"
+        assert response.headers["retry-after"] == "1"
+        assert hasher.metrics().rejected == 1
+
+        await occupied
+        response = await client.post("/api/v1/accounts/login/", json=login_payload)
+        assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+
+        metrics = hasher.metrics()
+        assert (metrics.submitted, metrics.completed, metrics.in_flight) == (2, 2, 0)
+        assert metrics.peak_in_flight == 1
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_login_user_rehashes_password_at_configured_cost(client, db_session, seed_user_groups):
+    """
+    Test login re-hashes a password whose bcrypt cost differs from the configured one.
+
+    Steps:
+    - Create a user with a hash at the default cost, and serve requests with a hasher at cost 5.
+    - Log in.
+
+    Expected result:
+    - The login succeeds
+    - Afterwards the stored hash uses cost 5, still matches the password and needs no further update
+    """
+    user_group = (await db_session.execute(
+        select(UserGroupModel).where(UserGroupModel.name == UserGroupEnum.USER)
+    )).scalars().first()
+    user = UserModel.create(email="rehash@example.com", raw_password="StrongPassword123!", group_id=user_group.id)
+    user.is_active = True
+    db_session.add(user)
+    await db_session.commit()
+    assert not user.hashed_password.startswith("$2b$05$")
+
+    hasher = PasswordHasher(create_password_context(5))
+    app.dependency_overrides[get_password_hasher] = lambda: hasher
+    login_payload = {"email": "rehash@example.com", "password": "StrongPassword123!"}
+    try:
+        response = await client.post("/api/v1/accounts/login/", json=login_payload)
+        assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+
+        await db_session.refresh(user)
+        assert user.hashed_password.startswith("$2b$05$"), "Password was not re-hashed at the configured cost."
+        assert await user.verify_password_async(login_payload["password"], hasher)
+        assert not hasher.needs_update(user.hashed_password)
+    finally:
+        hasher.shutdown()
+
+
 @pytest.mark.asyncio
 async def test_login_user_invalid_cases(client, db_session, seed_user_groups):
     """
@@ -1035,3 +1126,148 @@ async def test_logout_success(client, user_token, db_session, jwt_manager, seed_
     refresh_token_record = result.scalars().first()
 
     assert refresh_token_record is None, "Refresh token should not exist in database."
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_and_group_change(client, user_token, admin_token):
+    """
+    Test authorization reads the cached principal and a group change invalidates it.
+
+    Steps:
+    - As a regular user, call a staff-only endpoint twice with an unsupported content type.
+    - As an admin, move the user to the moderator group; call the endpoint again as the user,
+      first with the old access token and then with a refreshed one.
+
+    Expected result:
+    - The user gets 403 both times; the repeated check runs no database statement
+    - The group change applies immediately: the old token (which claims the old group) is revoked,
+      and with a refreshed token the user passes the staff check (415 from the endpoint itself)
+    """
+    url = "/api/v1/cinema/movies/bulk/"
+    user_headers = {"Authorization": f"Bearer {user_token['token']}", "Content-Type": "text/csv"}
+
+    response = await client.post(url, content=b"", headers=user_headers)
+    assert response.status_code == 403, f"Expected status code 403, but got {response.status_code}"
+
+    with StatementCounter() as counter:
+        response = await client.post(url, content=b"", headers=user_headers)
+    assert response.status_code == 403, f"Expected status code 403, but got {response.status_code}"
+    assert counter.count == 0, f"Expected no database statements, got {counter.count}"
+
+    response = await client.post(
+        f"/api/v1/accounts/users/{user_token['user_id']}/change-user-group/",
+        json={"user_id": user_token["user_id"], "new_group": UserGroupEnum.MODERATOR},
+        headers={"Authorization": f"Bearer {admin_token['token']}"},
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.json()["message"] == "User group changed successfully."
+
+    response = await client.post(url, content=b"", headers=user_headers)
+    assert response.status_code == 400, f"Expected status code 400, but got {response.status_code}"
+
+    response = await client.post("/api/v1/accounts/refresh/", json={"refresh_token": user_token["refresh_token"]})
+    user_headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+    response = await client.post(url, content=b"", headers=user_headers)
+    assert response.status_code == 415, f"Expected status code 415, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_access_token_claims_and_revocation(client, user_token, jwt_manager):
+    """
+    Test access tokens carry `group` and `token_version` claims, and a password change revokes them.
+
+    Steps:
+    - Decode the access token from login and call a staff-only endpoint with it.
+    - Change the password, then call the endpoint with the old token.
+    - Refresh the access token and call the endpoint with the new one.
+
+    Expected result:
+    - The claims hold the user's group and version 0; authorization reads only the user row
+      (no `user_groups` lookup)
+    - After the password change the old token is rejected as revoked
+    - The refreshed token carries version 1 and is accepted again
+    """
+    url = "/api/v1/cinema/movies/bulk/"
+    claims = jwt_manager.decode_access_token(user_token["token"])
+    assert (claims["group"], claims["token_version"]) == (UserGroupEnum.USER.value, 0)
+
+    with StatementCounter() as counter:
+        response = await client.post(
+            url, content=b"", headers={"Authorization": f"Bearer {user_token['token']}", "Content-Type": "text/csv"}
+        )
+    assert response.status_code == 403, f"Expected status code 403, but got {response.status_code}"
+    assert counter.count == 1, f"Expected a single database statement, got {counter.count}"
+    assert "user_groups" not in counter.statements[0]
+
+    response = await client.post(
+        "/api/v1/accounts/change-password/",
+        json={"email": user_token["email"], "password": user_token["raw_password"], "new_password": "Changed123!!"},
+        headers={"Authorization": f"Bearer {user_token['token']}"},
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    response = await client.post(
+        url, content=b"", headers={"Authorization": f"Bearer {user_token['token']}", "Content-Type": "text/csv"}
+    )
+    assert response.status_code == 400, f"Expected status code 400, but got {response.status_code}"
+    assert response.json()["detail"] == "Token has been revoked."
+
+    response = await client.post("/api/v1/accounts/refresh/", json={"refresh_token": user_token["refresh_token"]})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    access_token = response.json()["access_token"]
+    assert jwt_manager.decode_access_token(access_token)["token_version"] == 1
+
+    response = await client.post(
+        url, content=b"", headers={"Authorization": f"Bearer {access_token}", "Content-Type": "text/csv"}
+    )
+    assert response.status_code == 403, f"Expected status code 403, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_account_emails_go_through_outbox(client, db_session, seed_user_groups, email_sender_stub, monkeypatch):
+    """
+    Test account emails are queued in the email outbox and retried when sending fails.
+
+    Steps:
+    - Register a user while the email sender fails.
+    - Make the queued email due again and drain the outbox with a working sender.
+    - Activate the account.
+
+    Expected result:
+    - Registration succeeds; the activation email stays in the outbox with one failed attempt,
+      its error and a later retry time
+    - The retry sends the activation email with the user's token and empties the outbox
+    - The activation-complete email is sent right after the request and leaves nothing behind
+    """
+    send_activation_email = AsyncMock(side_effect=BaseEmailError("Relay unavailable"))
+    monkeypatch.setattr(email_sender_stub, "send_activation_email", send_activation_email)
+    send_activation_complete_email = AsyncMock()
+    monkeypatch.setattr(email_sender_stub, "send_activation_complete_email", send_activation_complete_email)
+
+    payload = {"email": "outbox@example.com", "password": "StrongPassword123!"}
+    response = await client.post("/api/v1/accounts/register/", json=payload)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    send_activation_email.assert_awaited_once()
+
+    email = (await db_session.execute(select(EmailOutboxModel))).scalar_one()
+    assert (email.kind, email.recipient, email.attempts) == (EmailKindEnum.ACTIVATION, payload["email"], 1)
+    assert email.last_error == "Relay unavailable"
+    assert email.next_attempt_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+
+    await db_session.execute(
+        update(EmailOutboxModel).values(next_attempt_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+    )
+    await db_session.commit()
+    send_activation_email.side_effect = None
+    assert await EmailOutboxDispatcher(get_db_contextmanager).dispatch_pending(email_sender_stub) == 1
+
+    token = (await db_session.execute(select(ActivationTokenModel))).scalar_one().token
+    recipient, activation_link = send_activation_email.await_args.args
+    assert recipient == payload["email"]
+    assert f"token={token}" in activation_link
+    assert await db_session.scalar(select(func.count(EmailOutboxModel.id))) == 0
+
+    response = await client.post("/api/v1/accounts/activate/", json={"email": payload["email"], "token": token})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    send_activation_complete_email.assert_awaited_once_with(payload["email"], "http://127.0.0.1/accounts/login/")
+    assert await db_session.scalar(select(func.count(EmailOutboxModel.id))) == 0
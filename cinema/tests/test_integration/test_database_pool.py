@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from cinema.database.pool import InstrumentedAsyncQueuePool
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_count_checkouts_waits_and_timeouts(tmp_path):
+    """
+    Test the metrics of an `InstrumentedAsyncQueuePool` holding a single connection.
+
+    Steps:
+    - Check out the only connection and run a query on it.
+    - Try to check out a second connection, which waits and times out.
+    - Return the first connection.
+
+    Expected result:
+    - While held, the connection is reported in use
+    - Both checkouts are counted, the second as a wait and a timeout
+    - Once returned, the connection is reported idle
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    try:
+        async with engine.connect() as conn:
+            assert await conn.scalar(text("SELECT 1")) == 1
+            assert engine.pool.metrics().in_use == 1
+
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+
+        metrics = engine.pool.metrics()
+        assert (metrics.checkouts, metrics.waits, metrics.timeouts) == (2, 1, 1)
+        assert (metrics.size, metrics.in_use, metrics.idle, metrics.overflow) == (1, 0, 1, 0)
+        assert metrics.max_checkout_seconds >= 0.1
+        assert metrics.checkout_seconds >= metrics.max_checkout_seconds
+    finally:
+        await engine.dispose()
@@ -3,7 +3,7 @@ from decimal import Decimal
 
 import pytest
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy import select, func
+from sqlalchemy import event, insert, select, func
 from sqlalchemy.orm import joinedload
 
 from cinema.database.models.movies import (
@@ -11,10 +11,19 @@ from cinema.database.models.movies import (
     GenreModel,
     ActorModel,
     LanguageModel,
-    CountryModel
+    CountryModel,
+    CommentModel,
+    MovieReactionModel,
+    RatingModel,
+    RatingTypeEnum,
+    ReactionTypeEnum,
 )
 
+from cinema.database.aggregates import rebuild_movie_aggregates
+from cinema.database.models.accounts import UserGroupEnum, UserGroupModel, UserModel
 from cinema.database.models.movies import DirectorModel
+from cinema.database.session_sqlite import sqlite_engine
+from cinema.routes.movies.movies import MOVIE_DETAIL_COMMENTS_LIMIT
 
 movie_data = {
     "uuid": "8f4b2c9e-3a4f-4c1a-9c72-1d9b5e8c1f21",
@@ -318,6 +327,108 @@ async def test_movie_list_with_pagination(client, db_session, seed_database):
     assert response_data["next_page"] == expected_next_page, "Next page link mismatch."
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort_by, sort_order, sort_column", [
+    ("price", "asc", MovieModel.price),
+    ("duration", "desc", MovieModel.duration),
+    ("name", "asc", MovieModel.name),
+])
+async def test_movie_list_cursor_pagination(client, db_session, seed_database, sort_by, sort_order, sort_column):
+    """
+    Test GET `/api/v1/cinema/movies/?pagination=cursor` walks the whole catalogue by keyset.
+
+    Steps:
+    - Seed the database with movies.
+    - Request the first cursor page, then follow `next_cursor` until it is absent.
+    - Fetch all movie IDs from DB ordered by `(sort column, id)` in the requested direction.
+
+    Expected result:
+    - 200 OK for every page
+    - No totals are returned in cursor mode
+    - The concatenated pages match the DB ordering exactly, without gaps or duplicates
+    """
+    per_page = 3
+    response = await client.get(
+        f"/api/v1/cinema/movies/?pagination=cursor&per_page={per_page}"
+        f"&sort_by={sort_by}&sort_order={sort_order}"
+    )
+
+    returned_movie_ids = []
+    while True:
+        assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+        response_data = response.json()
+        assert response_data["total_items"] is None, "Cursor mode must not compute totals."
+        assert response_data["total_pages"] is None, "Cursor mode must not compute totals."
+        returned_movie_ids.extend(movie["id"] for movie in response_data["movies"])
+
+        next_cursor = response_data["next_cursor"]
+        if next_cursor is None:
+            break
+        response = await client.get(f"/api/v1/cinema/movies/?cursor={next_cursor}&per_page={per_page}")
+
+    if sort_order == "asc":
+        order_clauses = (sort_column.asc(), MovieModel.id.asc())
+    else:
+        order_clauses = (sort_column.desc(), MovieModel.id.desc())
+    result = await db_session.execute(select(MovieModel.id).order_by(*order_clauses))
+    expected_movie_ids = list(result.scalars().all())
+
+    assert returned_movie_ids == expected_movie_ids, "Cursor pages do not match the keyset ordering."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_cursor_next_page_keeps_filters(client, db_session, seed_database):
+    """
+    Test the cursor-mode `next_page` link of a filtered GET `/api/v1/cinema/movies/`.
+
+    Steps:
+    - Pick the most common release year and an IMDB floor below every movie of that year.
+    - Request the first filtered cursor page, then follow `next_page` until it is absent.
+
+    Expected result:
+    - Every `next_page` link carries the `year` and `imdb` filters
+    - The concatenated pages hold exactly the movies of that year, ordered by `(name, id)`
+    """
+    year = (await db_session.execute(
+        select(MovieModel.year).group_by(MovieModel.year).order_by(func.count().desc()).limit(1)
+    )).scalar_one()
+    imdb = (await db_session.execute(select(func.min(MovieModel.imdb)).where(MovieModel.year == year))).scalar_one()
+    expected_movie_ids = (await db_session.execute(
+        select(MovieModel.id)
+        .where(MovieModel.year == year, MovieModel.imdb >= imdb)
+        .order_by(MovieModel.name.asc(), MovieModel.id.asc())
+    )).scalars().all()
+
+    response = await client.get(f"/api/v1/cinema/movies/?pagination=cursor&per_page=1&year={year}&imdb={imdb}")
+    returned_movie_ids = []
+    while True:
+        assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+        response_data = response.json()
+        returned_movie_ids.extend(movie["id"] for movie in response_data["movies"])
+
+        next_page = response_data["next_page"]
+        if next_page is None:
+            break
+        assert f"year={year}" in next_page and f"imdb={imdb}" in next_page, f"Filters missing from {next_page}"
+        response = await client.get(f"/api/v1{next_page}")
+
+    assert returned_movie_ids == list(expected_movie_ids), "Filtered cursor pages do not match the filtered ordering."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_invalid_cursor(client, seed_database):
+    """
+    Test GET `/api/v1/cinema/movies/` rejects a malformed cursor.
+
+    Expected result:
+    - 400 Bad Request
+    - Response body is exactly: {"detail": "Invalid cursor."}
+    """
+    response = await client.get("/api/v1/cinema/movies/?cursor=not-a-cursor")
+    assert response.status_code == 400, f"Expected status code 400, but got {response.status_code}"
+    assert response.json() == {"detail": "Invalid cursor."}
+
+
 @pytest.mark.asyncio
 async def test_movies_fields_match_schema(client, db_session, seed_database):
     """
@@ -330,7 +441,8 @@ async def test_movies_fields_match_schema(client, db_session, seed_database):
 
     Expected result:
     - 200 OK
-    - Every movie item contains exactly: {"id", "name", "year", "imdb", "description"}
+    - Every movie item contains exactly: {"id", "name", "year", "imdb", "description",
+      "ratings_count", "average_rating", "likes", "dislikes"}
     """
     response = await client.get("/api/v1/cinema/movies/?page=1&per_page=10")
 
@@ -340,7 +452,9 @@ async def test_movies_fields_match_schema(client, db_session, seed_database):
 
     assert "movies" in response_data, "Response missing 'movies' field."
 
-    expected_fields = {"id", "name", "year", "imdb", "description"}
+    expected_fields = {
+        "id", "name", "year", "imdb", "description", "ratings_count", "average_rating", "likes", "dislikes"
+    }
 
     for movie in response_data["movies"]:
         assert set(movie.keys()) == expected_fields, (
@@ -423,7 +537,8 @@ async def test_get_movie_by_id_fields_match_database(client, db_session, seed_da
     - Select one movie from DB with all relationships eagerly loaded.
     - Request the same movie by ID via the API.
     - Compare scalar fields to DB values.
-    - Compare nested relations (country, genres, actors, directors, languages, comments, reactions, ratings).
+    - Compare nested relations (country, genres, actors, directors, languages, comments).
+    - Compare the reaction and rating summaries with the DB rows.
 
     Expected result:
     - 200 OK
@@ -517,43 +632,15 @@ async def test_get_movie_by_id_fields_match_database(client, db_session, seed_da
 
     assert actual_comments == expected_comments, "Comments do not match."
 
-    actual_reactions = sorted(
-        response_data["reactions"],
-        key=lambda x: x["id"]
-    )
-
-    expected_reactions = sorted(
-        [
-            {
-                "id": reaction.id,
-                "type": reaction.type,
-                "user_id": reaction.user_id,
-            }
-            for reaction in random_movie.reactions
-        ],
-        key=lambda x: x["id"]
-    )
-
-    assert actual_reactions == expected_reactions, "Reactions do not match."
-
-    actual_ratings = sorted(
-        response_data["ratings"],
-        key=lambda x: x["id"]
-    )
+    assert response_data["comments_count"] == len(random_movie.comments), "Comments count does not match."
 
-    expected_ratings = sorted(
-        [
-            {
-                "id": rating.id,
-                "rating": rating.rating,
-                "user_id": rating.user_id,
-            }
-            for rating in random_movie.ratings
-        ],
-        key=lambda x: x["id"]
-    )
+    expected_reactions = {
+        "likes": sum(reaction.reaction == ReactionTypeEnum.LIKE for reaction in random_movie.reactions),
+        "dislikes": sum(reaction.reaction == ReactionTypeEnum.DISLIKE for reaction in random_movie.reactions),
+    }
+    assert response_data["reactions"] == expected_reactions, "Reactions do not match."
 
-    assert actual_ratings == expected_ratings, "Ratings do not match."
+    assert response_data["ratings"]["count"] == len(random_movie.ratings), "Ratings do not match."
 
 
 @pytest.mark.asyncio
@@ -571,7 +658,7 @@ async def test_create_movie_and_related_models(client, admin_token, db_session):
     - 201 Created
     - Response body matches submitted movie data
     - Missing related entities are created in the database
-    - Newly created movie has empty `comments`, `reactions`, and `ratings`
+    - Newly created movie has no comments and empty reaction/rating summaries
     """
     token = admin_token["token"]
 
@@ -625,8 +712,11 @@ async def test_create_movie_and_related_models(client, admin_token, db_session):
     assert country is not None, f"Country '{sample_movie['country']}' was not created."
 
     assert response_data["comments"] == [], "Expected no comments on newly created movie."
-    assert response_data["reactions"] == [], "Expected no reactions on newly created movie."
-    assert response_data["ratings"] == [], "Expected no ratings on newly created movie."
+    assert response_data["comments_count"] == 0, "Expected no comments on newly created movie."
+    assert response_data["reactions"] == {"likes": 0, "dislikes": 0}, "Expected no reactions on newly created movie."
+    assert response_data["ratings"] == {"count": 0, "average": None, "distribution": {}}, (
+        "Expected no ratings on newly created movie."
+    )
 
 
 @pytest.mark.asyncio
@@ -808,3 +898,231 @@ async def test_update_movie_not_found(client, admin_token, db_session):
     assert response_data["detail"] == expected_detail, (
         f"Expected detail message: {expected_detail}, but got: {response_data['detail']}"
     )
+
+
+@pytest.mark.asyncio
+async def test_movie_search_follows_writes(client, admin_token):
+    """
+    Test the movie list `search` parameter reflects creates, updates and deletes.
+
+    Steps:
+    - Create a movie and search by a prefix of its actor name.
+    - Update the movie description and search by a new word.
+    - Delete the movie and repeat the search.
+
+    Expected result:
+    - The created movie is found by actor prefix and by the updated description.
+    - The deleted movie is no longer found (404).
+    """
+    headers = {"Authorization": f"Bearer {admin_token['token']}"}
+
+    response = await client.post("/api/v1/cinema/movies/", json=jsonable_encoder(movie_data), headers=headers)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    movie_id = response.json()["id"]
+
+    response = await client.get("/api/v1/cinema/movies/", params={"search": "michael john"})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert [movie["id"] for movie in response.json()["movies"]] == [movie_id]
+
+    response = await client.patch(
+        f"/api/v1/cinema/movies/{movie_id}/", json={"description": "Submarine odyssey."}, headers=headers
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    response = await client.get("/api/v1/cinema/movies/", params={"search": "submarine"})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert [movie["id"] for movie in response.json()["movies"]] == [movie_id]
+
+    response = await client.delete(f"/api/v1/cinema/movies/{movie_id}/", headers=headers)
+    assert response.status_code == 204, f"Expected status code 204, but got {response.status_code}"
+
+    response = await client.get("/api/v1/cinema/movies/", params={"search": "submarine"})
+    assert response.status_code == 404, f"Expected status code 404, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_movie_search_ranks_title_matches_first(client, admin_token):
+    """
+    Test search results are ordered by relevance when no explicit sort is requested.
+
+    Steps:
+    - Create one movie mentioning the search word in its description only.
+    - Create another movie with the word in its title.
+    - Search for the word.
+
+    Expected result:
+    - Both movies are returned, the title match first.
+    """
+    headers = {"Authorization": f"Bearer {admin_token['token']}"}
+
+    description_match = {
+        **movie_data,
+        "uuid": "0c8a3f4e-51b2-4e7d-9d0a-6f3b2a1c9e11",
+        "name": "Quiet Harbour",
+        "description": "A story about a lighthouse keeper.",
+    }
+    title_match = {
+        **movie_data,
+        "uuid": "4e2d9b7a-8c16-4f35-a1e0-2b7c5d9f8a22",
+        "name": "Lighthouse",
+        "description": "A story about the sea.",
+    }
+    for payload in (description_match, title_match):
+        response = await client.post("/api/v1/cinema/movies/", json=jsonable_encoder(payload), headers=headers)
+        assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+
+    response = await client.get("/api/v1/cinema/movies/", params={"search": "lighthouse"})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    names = [movie["name"] for movie in response.json()["movies"]]
+    assert names == ["Lighthouse", "Quiet Harbour"], f"Expected title match first, got {names}"
+
+
+@pytest.mark.asyncio
+async def test_get_movie_by_id_rows_fetched_is_bounded(client, admin_token, db_session):
+    """
+    Regression benchmark: GET `/api/v1/cinema/movies/{movie_id}/` fetches a bounded number of rows.
+
+    Steps:
+    - Create a movie with 30 actors, then add 500 comments, 2,000 ratings and 2,000 reactions
+      and rebuild its aggregates.
+    - Record every SELECT the endpoint runs and count the rows each one returns.
+
+    Expected result:
+    - 200 OK with summaries matching the inserted data
+    - Rows fetched are the sum of the relation sizes plus the comments limit and the summary
+      groups, not their product (which would be 30 * 500 * 2,000 * 2,000 with a single join)
+    """
+    headers = {"Authorization": f"Bearer {admin_token['token']}"}
+    actors = [f"Benchmark Actor {i:02d}" for i in range(30)]
+    payload = {**jsonable_encoder(movie_data), "actors": actors}
+
+    response = await client.post("/api/v1/cinema/movies/", json=payload, headers=headers)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    movie_id = response.json()["id"]
+
+    group_id = (
+        await db_session.execute(select(UserGroupModel.id).where(UserGroupModel.name == UserGroupEnum.USER))
+    ).scalar_one()
+    users_count = 2000
+    result = await db_session.execute(
+        insert(UserModel).returning(UserModel.id),
+        [
+            {"email": f"bench{i}@email.com", "_hashed_password": "x", "group_id": group_id, "is_active": True}
+            for i in range(users_count)
+        ],
+    )
+    user_ids = result.scalars().all()
+    ratings = list(RatingTypeEnum)
+    await db_session.execute(
+        insert(RatingModel),
+        [{"movie_id": movie_id, "user_id": user_id, "rating": ratings[i % 10]} for i, user_id in enumerate(user_ids)],
+    )
+    await db_session.execute(
+        insert(MovieReactionModel),
+        [
+            {
+                "movie_id": movie_id,
+                "user_id": user_id,
+                "reaction": ReactionTypeEnum.LIKE if i % 4 else ReactionTypeEnum.DISLIKE,
+            }
+            for i, user_id in enumerate(user_ids)
+        ],
+    )
+    await db_session.execute(
+        insert(CommentModel),
+        [{"movie_id": movie_id, "user_id": user_ids[i], "comment": f"Comment {i}"} for i in range(500)],
+    )
+    await rebuild_movie_aggregates(db_session, [movie_id])
+    await db_session.commit()
+
+    statements = []
+
+    def record_select(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(sqlite_engine.sync_engine, "before_cursor_execute", record_select)
+    try:
+        response = await client.get(f"/api/v1/cinema/movies/{movie_id}/")
+    finally:
+        event.remove(sqlite_engine.sync_engine, "before_cursor_execute", record_select)
+
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    data = response.json()
+    assert data["comments_count"] == 500
+    assert len(data["comments"]) == MOVIE_DETAIL_COMMENTS_LIMIT
+    assert data["reactions"] == {"likes": 1500, "dislikes": 500}
+    assert data["ratings"]["count"] == users_count
+    assert data["ratings"]["distribution"] == {str(value): users_count // 10 for value in range(1, 11)}
+
+    connection = await db_session.connection()
+    rows_fetched = 0
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(statement, parameters)
+        rows_fetched += len(result.all())
+
+    expected_rows = (
+        1  # movie + country
+        + len(movie_data["genres"]) + len(actors) + len(movie_data["languages"]) + len(movie_data["directors"])
+        + MOVIE_DETAIL_COMMENTS_LIMIT
+        + 1  # comments count
+        + len(ReactionTypeEnum) + len(RatingTypeEnum)
+    )
+    assert rows_fetched <= expected_rows, f"Expected at most {expected_rows} rows fetched, got {rows_fetched}"
+
+
+@pytest.mark.asyncio
+async def test_create_movie_statement_count_is_constant(client, admin_token, db_session):
+    """
+    Regression benchmark: POST `/api/v1/cinema/movies/` runs a fixed number of statements
+    regardless of how many relations the movie has.
+
+    Steps:
+    - Create a movie so that the country, genres, directors and languages exist.
+    - Create a movie with 3 new actors and record every statement the endpoint runs.
+    - Create a movie with 60 actors (half of them already existing) and record again.
+
+    Expected result:
+    - Both requests return 201 with the submitted actors
+    - Both requests run the same number of statements
+    - No actor name ends up duplicated
+    """
+    headers = {"Authorization": f"Bearer {admin_token['token']}"}
+
+    async def create_and_count(payload):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(sqlite_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            response = await client.post("/api/v1/cinema/movies/", json=payload, headers=headers)
+        finally:
+            event.remove(sqlite_engine.sync_engine, "before_cursor_execute", record)
+
+        assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+        assert sorted(actor["name"] for actor in response.json()["actors"]) == sorted(payload["actors"])
+        return len(statements)
+
+    response = await client.post("/api/v1/cinema/movies/", json=jsonable_encoder(movie_data), headers=headers)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+
+    few_actors = [f"Statement Actor {i:02d}" for i in range(3)]
+    many_actors = [f"Statement Actor {i:02d}" for i in range(30, 60)] + [f"Statement Actor {i:02d}" for i in range(30)]
+
+    few_count = await create_and_count(
+        {**jsonable_encoder(movie_data), "uuid": "5c2e8a47-1b3d-4e9f-a6c0-7d8b9e1f2a35", "name": "Small Cast",
+         "actors": few_actors}
+    )
+    many_count = await create_and_count(
+        {**jsonable_encoder(movie_data), "uuid": "0d9b4c61-5a1e-4f6b-8c0a-2f7e9d3b6a14", "name": "Crowded Cast",
+         "actors": many_actors}
+    )
+
+    assert many_count == few_count, f"Expected {few_count} statements for 60 actors, got {many_count}"
+
+    actors_total = await db_session.scalar(
+        select(func.count(ActorModel.id)).where(ActorModel.name.like("Statement Actor %"))
+    )
+    assert actors_total == 60, f"Expected 60 distinct actors, got {actors_total}"
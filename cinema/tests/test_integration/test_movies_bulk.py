@@ -0,0 +1,202 @@
+import json
+from decimal import Decimal
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+
+from cinema.database import ingest
+from cinema.database.models.movies import ActorModel, MovieModel
+from cinema.routes.movies import movies_bulk
+
+base_movie = {
+    "year": 2021,
+    "duration": 101,
+    "imdb": Decimal("7.1"),
+    "imdb_votes": 1000,
+    "description": "Bulk imported movie.",
+    "budget": Decimal("1000000.00"),
+    "revenue": Decimal("2500000.00"),
+    "certification": "PG",
+    "price": Decimal("4.99"),
+    "country": "fr",
+    "genres": ["Drama"],
+    "actors": ["Bulk Actor", "Bulk Actress"],
+    "directors": ["Bulk Director"],
+    "languages": ["French"],
+}
+
+
+def make_movie(number: int, **overrides) -> dict:
+    return jsonable_encoder({
+        **base_movie,
+        "uuid": f"00000000-0000-4000-8000-{number:012d}",
+        "name": f"Bulk Movie {number}",
+        **overrides,
+    })
+
+
+async def stream(body: bytes, chunk_size: int = 7):
+    for i in range(0, len(body), chunk_size):
+        yield body[i: i + chunk_size]
+
+
+def parse_results(response) -> list:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_ndjson_reports_each_item(client, admin_token, db_session):
+    """
+    Test POST `/api/v1/cinema/movies/bulk/` with a streamed NDJSON body.
+
+    Steps:
+    - Stream two valid movies, a repeat of the first one, a line that is not JSON and a
+      movie missing required fields, split into small chunks.
+
+    Expected result:
+    - 200 OK with one NDJSON result line per item, in input order
+    - Statuses created, created, duplicate, invalid, invalid
+    - The created movies exist with their relations, and new names are in the typeahead index
+    """
+    headers = {"Authorization": f"Bearer {admin_token['token']}", "Content-Type": "application/x-ndjson"}
+    lines = [
+        json.dumps(make_movie(1)),
+        json.dumps(make_movie(2, actors=["Bulk Actor", "Second Lead"])),
+        json.dumps(make_movie(1)),
+        "{not json",
+        json.dumps({"name": "Incomplete"}),
+    ]
+
+    response = await client.post(
+        "/api/v1/cinema/movies/bulk/", content=stream("\n".join(lines).encode()), headers=headers
+    )
+
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    results = parse_results(response)
+    assert [result["index"] for result in results] == [0, 1, 2, 3, 4]
+    assert [result["status"] for result in results] == ["created", "created", "duplicate", "invalid", "invalid"]
+    assert results[3]["errors"][0]["msg"].startswith("Invalid JSON")
+    assert {"uuid"} <= {error["loc"][0] for error in results[4]["errors"]}
+
+    movie = (await db_session.execute(
+        select(MovieModel)
+        .options(selectinload(MovieModel.actors), selectinload(MovieModel.country))
+        .where(MovieModel.id == results[1]["id"])
+    )).scalar_one()
+    assert movie.name == "Bulk Movie 2"
+    assert movie.country.code == "FR"
+    assert sorted(actor.name for actor in movie.actors) == ["Bulk Actor", "Second Lead"]
+
+    actors_count = await db_session.scalar(select(func.count(ActorModel.id)).where(ActorModel.name == "Bulk Actor"))
+    assert actors_count == 1, f"Expected the shared actor to be created once, got {actors_count}"
+
+    response = await client.get("/api/v1/cinema/typeahead/", params={"q": "second le"})
+    assert response.json()["actors"][0]["name"] == "Second Lead"
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_json_array_in_chunks(client, admin_token, db_session, monkeypatch):
+    """
+    Test POST `/api/v1/cinema/movies/bulk/` with a streamed JSON array spanning several chunks.
+
+    Steps:
+    - Lower the chunk size to 2.
+    - Stream a JSON array of 5 movies, then send the same array again.
+
+    Expected result:
+    - The first request creates all 5 movies
+    - The second request reports all 5 as duplicates and creates nothing
+    """
+    monkeypatch.setattr(movies_bulk, "BULK_CHUNK_SIZE", 2)
+    headers = {"Authorization": f"Bearer {admin_token['token']}", "Content-Type": "application/json"}
+    body = json.dumps([make_movie(number) for number in range(10, 15)], indent=1).encode()
+
+    response = await client.post("/api/v1/cinema/movies/bulk/", content=stream(body), headers=headers)
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    results = parse_results(response)
+    assert [result["status"] for result in results] == ["created"] * 5
+    assert len({result["id"] for result in results}) == 5
+
+    response = await client.post("/api/v1/cinema/movies/bulk/", content=stream(body), headers=headers)
+    assert [result["status"] for result in parse_results(response)] == ["duplicate"] * 5
+
+    movies_count = await db_session.scalar(select(func.count(MovieModel.id)))
+    assert movies_count == 5, f"Expected 5 movies, got {movies_count}"
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_reports_failed_chunk(client, admin_token, db_session, monkeypatch):
+    """
+    Test POST `/api/v1/cinema/movies/bulk/` when a chunk fails to insert.
+
+    Steps:
+    - Lower the chunk size to 2 and make the search document refresh of the second chunk
+      fail with a database error, on the retry as well.
+    - Stream an NDJSON body of 5 movies.
+
+    Expected result:
+    - 200 OK with a result line for every item
+    - The items of the second chunk are invalid; the first and third chunks are created
+    - The second chunk leaves no movie behind
+    """
+    monkeypatch.setattr(movies_bulk, "BULK_CHUNK_SIZE", 2)
+    refresh = ingest.refresh_search_documents
+    calls = []
+
+    async def failing_refresh(session, movie_ids):
+        calls.append(movie_ids)
+        if len(calls) in (2, 3):
+            raise IntegrityError("INSERT", {}, Exception("concurrent insert"))
+        await refresh(session, movie_ids)
+
+    monkeypatch.setattr(ingest, "refresh_search_documents", failing_refresh)
+    headers = {"Authorization": f"Bearer {admin_token['token']}", "Content-Type": "application/x-ndjson"}
+    body = "\n".join(json.dumps(make_movie(number)) for number in range(30, 35)).encode()
+
+    response = await client.post("/api/v1/cinema/movies/bulk/", content=stream(body), headers=headers)
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    results = parse_results(response)
+    assert [result["index"] for result in results] == [0, 1, 2, 3, 4]
+    assert [result["status"] for result in results] == ["created", "created", "invalid", "invalid", "created"]
+    assert results[2]["errors"][0]["msg"] == movies_bulk.CHUNK_FAILED_MESSAGE
+
+    names = (await db_session.execute(select(MovieModel.name).order_by(MovieModel.name))).scalars().all()
+    assert names == ["Bulk Movie 30", "Bulk Movie 31", "Bulk Movie 34"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_malformed_array_and_access(client, admin_token, user_token):
+    """
+    Test POST `/api/v1/cinema/movies/bulk/` rejects bad requests.
+
+    Expected result:
+    - A regular user gets 403
+    - An unsupported content type gets 415
+    - A truncated JSON array keeps the items parsed so far and reports the rest as invalid
+    """
+    body = json.dumps([make_movie(20)]).encode()
+
+    response = await client.post(
+        "/api/v1/cinema/movies/bulk/",
+        content=body,
+        headers={"Authorization": f"Bearer {user_token['token']}", "Content-Type": "application/json"},
+    )
+    assert response.status_code == 403, f"Expected status code 403, but got {response.status_code}"
+
+    headers = {"Authorization": f"Bearer {admin_token['token']}"}
+    response = await client.post(
+        "/api/v1/cinema/movies/bulk/", content=body, headers={**headers, "Content-Type": "text/csv"}
+    )
+    assert response.status_code == 415, f"Expected status code 415, but got {response.status_code}"
+
+    truncated = body[:-1] + b', {"name": "Cut'
+    response = await client.post(
+        "/api/v1/cinema/movies/bulk/", content=truncated, headers={**headers, "Content-Type": "application/json"}
+    )
+    results = parse_results(response)
+    assert [result["status"] for result in results] == ["created", "invalid"]
+    assert results[1]["index"] == 1
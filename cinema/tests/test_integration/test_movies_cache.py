@@ -0,0 +1,265 @@
+import pytest
+from sqlalchemy import event, func, select, update
+from starlette.requests import Request
+
+from cinema.cache import ResponseCache
+from cinema.database.aggregates import rebuild_catalogue_counters
+from cinema.database.counts import read_counter
+from cinema.database.models.movies import MOVIES_COUNTER, CatalogueCounterModel, MovieModel
+from cinema.database.session_sqlite import sqlite_engine
+from cinema.schemas.movies import TypeaheadItemSchema
+
+
+class StatementCounter:
+    """
+    Count the statements sent to the test database while active.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(sqlite_engine.sync_engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(sqlite_engine.sync_engine, "before_cursor_execute", self)
+
+
+@pytest.mark.asyncio
+async def test_movie_detail_etag_and_invalidation(client, user_token, db_session, seed_database):
+    """
+    Test GET `/api/v1/cinema/movies/{movie_id}/` caching and conditional requests.
+
+    Steps:
+    - Fetch a movie twice, then once more with `If-None-Match` set to the returned ETag.
+    - Post a comment on the movie and repeat the conditional request.
+
+    Expected result:
+    - The first response carries a strong ETag; the repeated request is served from the
+      cache without any database statement and with the same body
+    - The conditional request gets 304 with an empty body, also without any statement
+    - After the comment, the conditional request gets 200 with a new ETag and the comment
+    """
+    movie = (await db_session.execute(select(MovieModel).limit(1))).scalar_one()
+    url = f"/api/v1/cinema/movies/{movie.id}/"
+
+    first = await client.get(url)
+    assert first.status_code == 200, f"Expected status code 200, but got {first.status_code}"
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+
+    with StatementCounter() as counter:
+        cached = await client.get(url)
+        not_modified = await client.get(url, headers={"If-None-Match": etag})
+    assert counter.count == 0, f"Expected no database statements, got {counter.count}"
+    assert cached.status_code == 200
+    assert cached.json() == first.json()
+    assert not_modified.status_code == 304, f"Expected status code 304, but got {not_modified.status_code}"
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    response = await client.post(
+        f"/api/v1/cinema/movies/{movie.id}/comments/",
+        json={"comment": "Cached no more"},
+        headers={"Authorization": f"Bearer {user_token['token']}"},
+    )
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+
+    refreshed = await client.get(url, headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200, f"Expected status code 200, but got {refreshed.status_code}"
+    assert refreshed.headers["etag"] != etag
+    assert refreshed.json()["comments"][-1]["comment"] == "Cached no more"
+
+
+@pytest.mark.asyncio
+async def test_movie_list_cache_key_and_invalidation(client, user_token, admin_token, db_session, seed_database):
+    """
+    Test GET `/api/v1/cinema/movies/` caching and invalidation by the movie writers.
+
+    Steps:
+    - Fetch the same list with the query parameters in different orders and with defaults spelled out.
+    - Rate a movie of the page, then update a movie's name.
+
+    Expected result:
+    - Equivalent queries share one ETag
+    - Rating invalidates the list, which then reports the new rating aggregates
+    - Updating a movie invalidates the list and the movie detail
+    """
+    first = await client.get("/api/v1/cinema/movies/?page=1&per_page=5&sort_by=price")
+    assert first.status_code == 200, f"Expected status code 200, but got {first.status_code}"
+    etag = first.headers["etag"]
+
+    same = await client.get("/api/v1/cinema/movies/?sort_by=price&sort_order=asc&per_page=5")
+    assert same.headers["etag"] == etag
+
+    movie = first.json()["movies"][0]
+    response = await client.post(
+        f"/api/v1/cinema/movies/{movie['id']}/ratings/",
+        json={"rating": "7"},
+        headers={"Authorization": f"Bearer {user_token['token']}"},
+    )
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+
+    rated = await client.get("/api/v1/cinema/movies/?page=1&per_page=5&sort_by=price", headers={"If-None-Match": etag})
+    assert rated.status_code == 200, f"Expected status code 200, but got {rated.status_code}"
+    assert rated.headers["etag"] != etag
+    assert rated.json()["movies"][0]["ratings_count"] == movie["ratings_count"] + 1
+
+    detail = await client.get(f"/api/v1/cinema/movies/{movie['id']}/")
+    response = await client.patch(
+        f"/api/v1/cinema/movies/{movie['id']}/",
+        json={"name": "Renamed While Cached"},
+        headers={"Authorization": f"Bearer {admin_token['token']}"},
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    renamed = await client.get(
+        f"/api/v1/cinema/movies/{movie['id']}/", headers={"If-None-Match": detail.headers["etag"]}
+    )
+    assert renamed.status_code == 200, f"Expected status code 200, but got {renamed.status_code}"
+    assert renamed.json()["name"] == "Renamed While Cached"
+
+    listed = await client.get("/api/v1/cinema/movies/?page=1&per_page=5&sort_by=price")
+    assert listed.json()["movies"][0]["name"] == "Renamed While Cached"
+
+
+def test_response_cache_ttl_and_lru():
+    """
+    Test `ResponseCache` expiry and eviction.
+
+    Expected result:
+    - An expired entry is not served
+    - Beyond `max_entries`, the least recently used entry is evicted first
+    """
+    request = Request({"type": "http", "method": "GET", "headers": []})
+    item = TypeaheadItemSchema(id=1, name="Cached")
+
+    expired = ResponseCache(ttl=0)
+    expired.store("a", expired.list_etag("a"), item)
+    assert expired.respond(request, "a", expired.list_etag("a")) is None
+
+    cache = ResponseCache(max_entries=2)
+    for key in ("a", "b"):
+        cache.store(key, cache.list_etag(key), item)
+    assert cache.respond(request, "a", cache.list_etag("a")) is not None
+    cache.store("c", cache.list_etag("c"), item)
+
+    assert cache.respond(request, "b", cache.list_etag("b")) is None
+    assert cache.respond(request, "a", cache.list_etag("a")).body == item.model_dump_json().encode()
+    assert cache.respond(request, "c", cache.list_etag("c")) is not None
+
+
+def test_response_cache_not_modified_needs_fresh_entry():
+    """
+    Test `ResponseCache.respond` with `If-None-Match` set to the current ETag.
+
+    Expected result:
+    - With an unexpired entry for that ETag, the response is a 304
+    - Without an entry, or once it has expired, the response has to be built again
+    """
+    item = TypeaheadItemSchema(id=1, name="Cached")
+
+    def conditional(etag):
+        return Request({"type": "http", "method": "GET", "headers": [(b"if-none-match", etag.encode())]})
+
+    cache = ResponseCache()
+    etag = cache.list_etag("a")
+    assert cache.respond(conditional(etag), "a", etag) is None
+    cache.store("a", etag, item)
+    assert cache.respond(conditional(etag), "a", etag).status_code == 304
+
+    expired = ResponseCache(ttl=0)
+    etag = expired.list_etag("a")
+    expired.store("a", etag, item)
+    assert expired.respond(conditional(etag), "a", etag) is None
+
+
+@pytest.mark.asyncio
+async def test_movie_list_totals_from_counter(client, admin_token, db_session, seed_database):
+    """
+    Test the unfiltered `total_items` of GET `/api/v1/cinema/movies/` comes from the movie counter.
+
+    Steps:
+    - Fetch the list, delete a movie and fetch it again.
+    - Tamper with the counter, then rebuild it with `rebuild_catalogue_counters`.
+
+    Expected result:
+    - The totals are exact, match `count(*)` and follow the delete, without any `count(` statement
+    - The rebuild restores the counter to the real number of movies
+    """
+    movies_count = await db_session.scalar(select(func.count(MovieModel.id)))
+
+    with StatementCounter() as counter:
+        response = await client.get("/api/v1/cinema/movies/?per_page=5")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.json()["total_items"] == movies_count
+    assert response.json()["total_exact"] is True
+    assert not any("count(" in statement.lower() for statement in counter.statements)
+
+    movie_id = response.json()["movies"][0]["id"]
+    response = await client.delete(
+        f"/api/v1/cinema/movies/{movie_id}/", headers={"Authorization": f"Bearer {admin_token['token']}"}
+    )
+    assert response.status_code == 204, f"Expected status code 204, but got {response.status_code}"
+
+    response = await client.get("/api/v1/cinema/movies/?per_page=5")
+    assert response.json()["total_items"] == movies_count - 1
+
+    await db_session.execute(
+        update(CatalogueCounterModel).where(CatalogueCounterModel.name == MOVIES_COUNTER).values(value=0)
+    )
+    await rebuild_catalogue_counters(db_session)
+    await db_session.commit()
+    assert await read_counter(db_session, MOVIES_COUNTER) == movies_count - 1
+
+
+@pytest.mark.asyncio
+async def test_movie_list_filtered_totals_cached(client, admin_token, db_session, seed_database):
+    """
+    Test filtered totals of GET `/api/v1/cinema/movies/` are cached per filter signature.
+
+    Steps:
+    - Fetch two different pages of the same filtered list.
+    - Request the estimate on SQLite.
+    - Delete a movie matching the filter and fetch the list again.
+
+    Expected result:
+    - The second page reuses the cached total: no `count(` statement is issued
+    - `count=estimate` falls back to the exact total on SQLite (`total_exact` is true)
+    - The delete invalidates the cached total
+    """
+    movie = (await db_session.execute(select(MovieModel).limit(1))).scalar_one()
+    year = movie.year
+    movies_count = await db_session.scalar(select(func.count(MovieModel.id)).where(MovieModel.year == year))
+
+    first = await client.get(f"/api/v1/cinema/movies/?year={year}&per_page=1")
+    assert first.status_code == 200, f"Expected status code 200, but got {first.status_code}"
+    assert first.json()["total_items"] == movies_count
+    assert first.json()["total_exact"] is True
+
+    with StatementCounter() as counter:
+        response = await client.get(f"/api/v1/cinema/movies/?year={year}&per_page=2")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.json()["total_items"] == movies_count
+    assert not any("count(" in statement.lower() for statement in counter.statements)
+
+    estimated = await client.get(f"/api/v1/cinema/movies/?year={year}&count=estimate")
+    assert estimated.json()["total_items"] == movies_count
+    assert estimated.json()["total_exact"] is True
+
+    response = await client.delete(
+        f"/api/v1/cinema/movies/{movie.id}/", headers={"Authorization": f"Bearer {admin_token['token']}"}
+    )
+    assert response.status_code == 204, f"Expected status code 204, but got {response.status_code}"
+
+    response = await client.get(f"/api/v1/cinema/movies/?year={year}&per_page=2")
+    if movies_count > 1:
+        assert response.json()["total_items"] == movies_count - 1
+    else:
+        assert response.status_code == 404, f"Expected status code 404, but got {response.status_code}"
@@ -1,9 +1,14 @@
+import asyncio
+from decimal import Decimal
+
 import pytest
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from cinema.database import MovieModel
-from cinema.database.models.movies import RatingTypeEnum, RatingModel
+from cinema.database.aggregates import rebuild_movie_aggregates
+from cinema.database.models.accounts import UserGroupModel, UserModel
+from cinema.database.models.movies import RatingTypeEnum, RatingModel, MovieReactionModel, ReactionTypeEnum
 
 
 @pytest.mark.asyncio
@@ -88,3 +93,118 @@ async def test_add_wrong_movie_rating(client, user_token, db_session, seed_datab
         headers=user_headers
     )
     assert response.status_code == 422, f"Expected status code 400, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_rating_aggregates_follow_toggles(client, user_token, db_session, seed_database):
+    """
+    Test the movie's rating aggregates are updated by the create, update and toggle-off branches.
+
+    Steps:
+    - Rate a movie 8, change the rating to 6, then send 6 again to remove it.
+    - After each step read the movie detail.
+
+    Expected result:
+    - count/average are 1/8.00, then 1/6.00, then 0/None
+    """
+    user_headers = {"Authorization": f"Bearer {user_token['token']}"}
+    movie = (await db_session.execute(select(MovieModel).limit(1))).scalar_one()
+
+    for rating, expected_count, expected_average in (
+        (RatingTypeEnum.EIGHT, 1, "8.00"),
+        (RatingTypeEnum.SIX, 1, "6.00"),
+        (RatingTypeEnum.SIX, 0, None),
+    ):
+        response = await client.post(
+            f"/api/v1/cinema/movies/{movie.id}/ratings/",
+            json={"rating": rating.value},
+            headers=user_headers
+        )
+        assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+
+        detail = (await client.get(f"/api/v1/cinema/movies/{movie.id}/")).json()
+        assert detail["ratings"]["count"] == expected_count
+        assert detail["ratings"]["average"] == expected_average
+
+
+@pytest.mark.asyncio
+async def test_rebuild_movie_aggregates(db_session, seed_database):
+    """
+    Test `rebuild_movie_aggregates` recomputes the aggregates from the raw rating and reaction rows.
+
+    Steps:
+    - Insert ratings and reactions directly, bypassing the endpoints.
+    - Reset the aggregate columns as if the triggers had been bypassed.
+    - Rebuild the aggregates.
+
+    Expected result:
+    - ratings_count, ratings_sum, likes and dislikes match the inserted rows
+    """
+    movie = (await db_session.execute(select(MovieModel).limit(1))).scalar_one()
+    group = (await db_session.execute(select(UserGroupModel).limit(1))).scalar_one()
+    users = [UserModel(email=f"rater{i}@email.com", _hashed_password="x", group_id=group.id) for i in range(3)]
+    db_session.add_all(users)
+    await db_session.flush()
+
+    db_session.add_all([
+        RatingModel(movie_id=movie.id, user_id=users[0].id, rating=RatingTypeEnum.TEN),
+        RatingModel(movie_id=movie.id, user_id=users[1].id, rating=RatingTypeEnum.FIVE),
+        MovieReactionModel(movie_id=movie.id, user_id=users[0].id, reaction=ReactionTypeEnum.LIKE),
+        MovieReactionModel(movie_id=movie.id, user_id=users[1].id, reaction=ReactionTypeEnum.LIKE),
+        MovieReactionModel(movie_id=movie.id, user_id=users[2].id, reaction=ReactionTypeEnum.DISLIKE),
+    ])
+    await db_session.flush()
+    await db_session.execute(
+        update(MovieModel).values(ratings_count=0, ratings_sum=0, likes=0, dislikes=0)
+        .execution_options(synchronize_session=False)
+    )
+
+    await rebuild_movie_aggregates(db_session)
+    await db_session.commit()
+    await db_session.refresh(movie)
+
+    assert (movie.ratings_count, movie.ratings_sum, movie.likes, movie.dislikes) == (2, 15, 2, 1)
+    assert movie.average_rating == Decimal("7.50")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rating_toggles(client, concurrent_db, concurrent_user_token):
+    """
+    Test hundreds of parallel rating toggles for one (user, movie) pair stay consistent.
+
+    Steps:
+    - Fire 200 concurrent POST requests alternating between two rating values.
+    - Read the remaining rating rows and the movie aggregates.
+
+    Expected result:
+    - Every request succeeds with 201 (no unique constraint errors)
+    - At most one rating row exists for the pair
+    - ratings_count/ratings_sum match the remaining rows
+    """
+    user_headers = {"Authorization": f"Bearer {concurrent_user_token['token']}"}
+    async with concurrent_db() as session:
+        movie = (await session.execute(select(MovieModel).limit(1))).scalar_one()
+    values = (RatingTypeEnum.EIGHT, RatingTypeEnum.SIX)
+
+    responses = await asyncio.gather(*[
+        client.post(
+            f"/api/v1/cinema/movies/{movie.id}/ratings/",
+            json={"rating": values[i % 2].value},
+            headers=user_headers,
+        )
+        for i in range(200)
+    ])
+    assert [response.status_code for response in responses] == [201] * 200
+
+    async with concurrent_db() as session:
+        ratings = (await session.execute(
+            select(RatingModel).where(
+                RatingModel.movie_id == movie.id,
+                RatingModel.user_id == concurrent_user_token["user_id"],
+            )
+        )).scalars().all()
+        assert len(ratings) <= 1, f"Expected at most one rating row, got {len(ratings)}"
+
+        movie = await session.get(MovieModel, movie.id)
+        assert movie.ratings_count == len(ratings)
+        assert movie.ratings_sum == sum(int(rating.rating.value) for rating in ratings)
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from sqlalchemy import select
@@ -87,3 +89,76 @@ async def test_add_wrong_movie_reaction(client, user_token, db_session, seed_dat
         headers=user_headers
     )
     assert response.status_code == 422, f"Expected status code 400, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_reaction_aggregates_follow_toggles(client, user_token, db_session, seed_database):
+    """
+    Test the movie's like/dislike counters are updated by the create, update and toggle-off branches.
+
+    Steps:
+    - Like a movie, switch to dislike, then dislike again to remove the reaction.
+    - After each step read the movie from the list endpoint.
+
+    Expected result:
+    - likes/dislikes are 1/0, then 0/1, then 0/0
+    """
+    user_headers = {"Authorization": f"Bearer {user_token['token']}"}
+    movie = (await db_session.execute(select(MovieModel).order_by(MovieModel.id.desc()).limit(1))).scalar_one()
+
+    for reaction, expected in (
+        (ReactionTypeEnum.LIKE, (1, 0)),
+        (ReactionTypeEnum.DISLIKE, (0, 1)),
+        (ReactionTypeEnum.DISLIKE, (0, 0)),
+    ):
+        response = await client.post(
+            f"/api/v1/cinema/movies/{movie.id}/reactions/",
+            json={"reaction": reaction.value},
+            headers=user_headers,
+        )
+        assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+
+        movies = (await client.get("/api/v1/cinema/movies/", params={"per_page": 1})).json()["movies"]
+        assert movies[0]["id"] == movie.id
+        assert (movies[0]["likes"], movies[0]["dislikes"]) == expected
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reaction_toggles(client, concurrent_db, concurrent_user_token):
+    """
+    Test hundreds of parallel reaction toggles for one (user, movie) pair stay consistent.
+
+    Steps:
+    - Fire 200 concurrent POST requests with the same reaction.
+    - Read the remaining reaction rows and the movie counters.
+
+    Expected result:
+    - Every request succeeds with 201 (no unique constraint errors)
+    - At most one reaction row exists for the pair
+    - likes/dislikes match the remaining rows
+    """
+    user_headers = {"Authorization": f"Bearer {concurrent_user_token['token']}"}
+    async with concurrent_db() as session:
+        movie = (await session.execute(select(MovieModel).limit(1))).scalar_one()
+
+    responses = await asyncio.gather(*[
+        client.post(
+            f"/api/v1/cinema/movies/{movie.id}/reactions/",
+            json={"reaction": ReactionTypeEnum.LIKE.value},
+            headers=user_headers,
+        )
+        for _ in range(200)
+    ])
+    assert [response.status_code for response in responses] == [201] * 200
+
+    async with concurrent_db() as session:
+        reactions = (await session.execute(
+            select(MovieReactionModel).where(
+                MovieReactionModel.movie_id == movie.id,
+                MovieReactionModel.user_id == concurrent_user_token["user_id"],
+            )
+        )).scalars().all()
+        assert len(reactions) <= 1, f"Expected at most one reaction row, got {len(reactions)}"
+
+        movie = await session.get(MovieModel, movie.id)
+        assert (movie.likes, movie.dislikes) == (len(reactions), 0)
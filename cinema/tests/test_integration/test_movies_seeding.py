@@ -0,0 +1,174 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload
+
+from cinema.database.models.accounts import UserGroupModel, UserModel
+from cinema.database.models.movies import ActorModel, GenreModel, MovieModel, RatingModel, RatingTypeEnum
+from cinema.database.populate import SEED_STAGES, CSVDatabaseSeeder, SyncSummary
+
+CSV_HEADER = (
+    "uuid,name,year,duration,imdb,imdb_votes,description,budget,revenue,"
+    "country,certification,price,genres,languages,actors,directors\n"
+)
+
+
+def csv_row(number: int, name: str, year: int, genres: str, actors: str, price: str = "4.10") -> str:
+    return (
+        f"00000000-0000-4000-8000-{number:012d},{name},{year},100,7.30,1000,Seeded movie.,"
+        f"1000000.10,2000000.20,US,PG,{price},\"{genres}\",English,\"{actors}\",Some Director\n"
+    )
+
+
+@pytest.mark.asyncio
+async def test_seeder_streams_csv_in_chunks(db_session, tmp_path):
+    """
+    Test seeding a CSV with `CSVDatabaseSeeder` two rows at a time.
+
+    Steps:
+    - Write a CSV of five rows: the fourth repeats the (name, year) of the first, so the
+      duplicate is in a later chunk; names carry stray whitespace, a non-breaking space
+      and a repeated actor.
+    - Seed it with a chunk size of 2.
+
+    Expected result:
+    - The four distinct movies are inserted, with exact decimal values
+    - Names shared across chunks resolve to a single row, and repeated names within a
+      movie to a single association
+    - Every stage is timed, and the CSV file is left unchanged
+    """
+    csv_path = tmp_path / "movies.csv"
+    csv_path.write_text(
+        CSV_HEADER
+        + csv_row(1, "First", 2001, "Drama, Comedy", "Ann Smith, Bob Jones, Ann Smith", price="0.10")
+        + csv_row(2, "Second", 2002, "Drama", "Bob Jones")
+        + csv_row(3, "Third", 2003, "Comedy", "Cid Moe")
+        + csv_row(4, "First", 2001, "Horror", "Dee Ray")
+        + csv_row(5, "Fifth", 2005, "Drama, Horror", "AnnSmith"),
+        encoding="utf-8",
+    )
+    original_csv = csv_path.read_bytes()
+
+    seeder = CSVDatabaseSeeder(str(csv_path), db_session, chunk_size=2)
+    await seeder.seed()
+
+    result = await db_session.execute(
+        select(MovieModel)
+        .options(selectinload(MovieModel.genres), selectinload(MovieModel.actors))
+        .order_by(MovieModel.year)
+    )
+    movies = result.scalars().all()
+    assert [(movie.name, movie.year) for movie in movies] == [
+        ("First", 2001), ("Second", 2002), ("Third", 2003), ("Fifth", 2005)
+    ]
+    first = movies[0]
+    assert first.price == Decimal("0.10")
+    assert first.budget == Decimal("1000000.10")
+    assert sorted(genre.name for genre in first.genres) == ["Comedy", "Drama"]
+    assert sorted(actor.name for actor in first.actors) == ["AnnSmith", "BobJones"]
+    assert [actor.name for actor in movies[-1].actors] == ["AnnSmith"]
+
+    genre_count = await db_session.scalar(select(func.count(GenreModel.id)))
+    actor_count = await db_session.scalar(select(func.count(ActorModel.id)))
+    assert genre_count == 3
+    assert actor_count == 3
+
+    assert seeder.rows_seeded == 4
+    assert list(seeder.stage_seconds) == list(SEED_STAGES)
+    assert all(seconds > 0 for seconds in seeder.stage_seconds.values())
+    assert csv_path.read_bytes() == original_csv
+
+
+@pytest.mark.asyncio
+async def test_seeder_sync_applies_only_changes(db_session, tmp_path):
+    """
+    Test re-seeding a changed CSV with `CSVDatabaseSeeder.sync`.
+
+    Steps:
+    - Seed a CSV of three movies.
+    - Rewrite it: the first movie keeps its row, the second gets a new price and genres,
+      the third is dropped and a fourth is added. Sync it, then sync it once more.
+
+    Expected result:
+    - The first sync reports one insert, one update, one delete and one unchanged movie
+    - The updated movie keeps its ID, with the new price and exactly the new genres
+    - The dropped movie is gone, and a second sync changes nothing
+    """
+    csv_path = tmp_path / "movies.csv"
+    first = csv_row(1, "First", 2001, "Drama", "Ann Smith")
+    csv_path.write_text(
+        CSV_HEADER
+        + first
+        + csv_row(2, "Second", 2002, "Drama, Comedy", "Bob Jones")
+        + csv_row(3, "Third", 2003, "Comedy", "Cid Moe"),
+        encoding="utf-8",
+    )
+    await CSVDatabaseSeeder(str(csv_path), db_session).seed()
+    second_id = await db_session.scalar(select(MovieModel.id).where(MovieModel.name == "Second"))
+
+    csv_path.write_text(
+        CSV_HEADER
+        + first
+        + csv_row(2, "Second", 2002, "Comedy, Horror", "Bob Jones", price="9.99")
+        + csv_row(4, "Fourth", 2004, "Horror", "Dee Ray"),
+        encoding="utf-8",
+    )
+    summary = await CSVDatabaseSeeder(str(csv_path), db_session).sync()
+    assert summary == SyncSummary(inserted=1, updated=1, deleted=1, unchanged=1)
+
+    db_session.expunge_all()
+    result = await db_session.execute(
+        select(MovieModel).options(selectinload(MovieModel.genres)).order_by(MovieModel.year)
+    )
+    movies = result.scalars().all()
+    assert [movie.name for movie in movies] == ["First", "Second", "Fourth"]
+    second = movies[1]
+    assert second.id == second_id
+    assert second.price == Decimal("9.99")
+    assert sorted(genre.name for genre in second.genres) == ["Comedy", "Horror"]
+
+    summary = await CSVDatabaseSeeder(str(csv_path), db_session).sync()
+    assert summary == SyncSummary(unchanged=3)
+
+
+@pytest.mark.asyncio
+async def test_seeder_sync_keeps_movies_with_user_content(db_session, tmp_path):
+    """
+    Test `CSVDatabaseSeeder.sync` when a rated movie is dropped from the CSV.
+
+    Steps:
+    - Seed a CSV of three movies and rate the third one.
+    - Rewrite the CSV with the first movie only and sync it.
+
+    Expected result:
+    - The unrated second movie is deleted
+    - The rated third movie is kept with its rating, and reported as kept
+    """
+    csv_path = tmp_path / "movies.csv"
+    first = csv_row(1, "First", 2001, "Drama", "Ann Smith")
+    csv_path.write_text(
+        CSV_HEADER
+        + first
+        + csv_row(2, "Second", 2002, "Comedy", "Bob Jones")
+        + csv_row(3, "Third", 2003, "Horror", "Cid Moe"),
+        encoding="utf-8",
+    )
+    await CSVDatabaseSeeder(str(csv_path), db_session).seed()
+
+    third_id = await db_session.scalar(select(MovieModel.id).where(MovieModel.name == "Third"))
+    group_id = await db_session.scalar(select(UserGroupModel.id).limit(1))
+    user = UserModel(email="rater@email.com", _hashed_password="x", group_id=group_id)
+    db_session.add(user)
+    await db_session.flush()
+    db_session.add(RatingModel(movie_id=third_id, user_id=user.id, rating=RatingTypeEnum.NINE))
+    await db_session.commit()
+
+    csv_path.write_text(CSV_HEADER + first, encoding="utf-8")
+    summary = await CSVDatabaseSeeder(str(csv_path), db_session).sync()
+    assert summary == SyncSummary(deleted=1, unchanged=1, kept=1)
+
+    names = (await db_session.execute(select(MovieModel.name).order_by(MovieModel.year))).scalars().all()
+    assert names == ["First", "Third"]
+    rating_count = await db_session.scalar(select(func.count(RatingModel.id)).where(RatingModel.movie_id == third_id))
+    assert rating_count == 1
@@ -0,0 +1,115 @@
+import pytest
+
+from sqlalchemy import select
+
+from cinema.database.models.movies import ActorModel, GenreModel
+
+
+@pytest.mark.asyncio
+async def test_typeahead_matches_seeded_names(client, db_session, seed_database):
+    """
+    Test GET `/api/v1/cinema/typeahead/` completes seeded actor, genre and movie names.
+
+    Steps:
+    - Seed the database.
+    - Request completions for prefixes of an actor, a genre word and movie titles.
+
+    Expected result:
+    - 200 OK
+    - Every returned name matches the query, case-insensitively
+    - The number of matches per kind never exceeds `limit`
+    """
+    actor = (await db_session.execute(select(ActorModel).order_by(ActorModel.id).limit(1))).scalar_one()
+    genre = (await db_session.execute(select(GenreModel).where(GenreModel.name == "Science Fiction"))).scalar_one()
+
+    response = await client.get("/api/v1/cinema/typeahead/", params={"q": actor.name[:4].upper()})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    actors = response.json()["actors"]
+    assert {"id": actor.id, "name": actor.name} in actors, f"Expected {actor.name} in {actors}"
+
+    response = await client.get("/api/v1/cinema/typeahead/", params={"q": "fict"})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.json()["genres"] == [{"id": genre.id, "name": genre.name}]
+
+    response = await client.get("/api/v1/cinema/typeahead/", params={"q": "seed movie", "limit": 3})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    movies = response.json()["movies"]
+    assert len(movies) == 3, f"Expected 3 movies, got {len(movies)}"
+    assert all(movie["name"].lower().startswith("seed movie") for movie in movies)
+
+
+@pytest.mark.asyncio
+async def test_typeahead_follows_movie_writes(client, admin_token):
+    """
+    Test the typeahead index picks up names added, renamed and removed by the movie endpoints.
+
+    Steps:
+    - Query once so the index is loaded.
+    - Create a movie with a new actor, rename it, then delete it, querying after each step.
+
+    Expected result:
+    - New movie and actor names are returned right after creation.
+    - The renamed title replaces the old one.
+    - The deleted movie is no longer returned.
+    """
+    headers = {"Authorization": f"Bearer {admin_token['token']}"}
+
+    response = await client.get("/api/v1/cinema/typeahead/", params={"q": "horizon"})
+    assert response.json()["movies"] == []
+
+    payload = {
+        "uuid": "5b1f0a7e-2c3d-4e8f-9a6b-7c0d1e2f3a44",
+        "name": "The Silent Horizon",
+        "year": 2023,
+        "duration": 128,
+        "imdb": "8.4",
+        "imdb_votes": 154321,
+        "description": "A gripping sci-fi drama.",
+        "budget": "120000000.00",
+        "revenue": "356450000.00",
+        "certification": "PG13",
+        "price": "9.99",
+        "country": "US",
+        "genres": ["Drama"],
+        "actors": ["Zelda Quartermaine"],
+        "directors": ["Christopher Nolan"],
+        "languages": ["English"],
+    }
+    response = await client.post("/api/v1/cinema/movies/", json=payload, headers=headers)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    movie_id = response.json()["id"]
+
+    response = await client.get("/api/v1/cinema/typeahead/", params={"q": "horizon"})
+    assert response.json()["movies"] == [{"id": movie_id, "name": "The Silent Horizon"}]
+
+    response = await client.get("/api/v1/cinema/typeahead/", params={"q": "quarter", "kinds": ["actors"]})
+    data = response.json()
+    assert [actor["name"] for actor in data["actors"]] == ["Zelda Quartermaine"]
+    assert data["movies"] == [], "Kinds that were not requested must be empty."
+
+    response = await client.patch(
+        f"/api/v1/cinema/movies/{movie_id}/", json={"name": "The Loud Horizon"}, headers=headers
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    response = await client.get("/api/v1/cinema/typeahead/", params={"q": "horizon"})
+    assert response.json()["movies"] == [{"id": movie_id, "name": "The Loud Horizon"}]
+
+    response = await client.delete(f"/api/v1/cinema/movies/{movie_id}/", headers=headers)
+    assert response.status_code == 204, f"Expected status code 204, but got {response.status_code}"
+
+    response = await client.get("/api/v1/cinema/typeahead/", params={"q": "horizon"})
+    assert response.json()["movies"] == []
+
+
+@pytest.mark.asyncio
+async def test_typeahead_invalid_parameters(client):
+    """
+    Test GET `/api/v1/cinema/typeahead/` validates its query parameters.
+
+    Expected result:
+    - 422 for an empty query, an out-of-range limit and an unknown kind
+    """
+    for params in ({"q": ""}, {"q": "a", "limit": 0}, {"q": "a", "kinds": ["languages"]}):
+        response = await client.get("/api/v1/cinema/typeahead/", params=params)
+        assert response.status_code == 422, f"Expected status code 422 for {params}, but got {response.status_code}"
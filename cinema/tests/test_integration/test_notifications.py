@@ -0,0 +1,148 @@
+import asyncio
+import os
+
+import pytest
+
+from cinema.exceptions import BaseEmailError
+from cinema.notifications.emails import EmailSender
+from cinema.notifications.templates import TemplateRegistry
+from cinema.tests.doubles.fakes.smtp import FakeSMTPServer
+
+
+def make_sender(settings, port: int, **pool_options) -> EmailSender:
+    return EmailSender(
+        hostname="127.0.0.1",
+        port=port,
+        email="",
+        password="",
+        use_tls=False,
+        template_dir=settings.PATH_TO_EMAIL_TEMPLATES_DIR,
+        activation_email_template_name=settings.ACTIVATION_EMAIL_TEMPLATE_NAME,
+        activation_complete_email_template_name=settings.ACTIVATION_COMPLETE_EMAIL_TEMPLATE_NAME,
+        password_email_template_name=settings.PASSWORD_RESET_TEMPLATE_NAME,
+        password_complete_email_template_name=settings.PASSWORD_RESET_COMPLETE_TEMPLATE_NAME,
+        **pool_options,
+    )
+
+
+@pytest.mark.asyncio
+async def test_email_sender_reuses_smtp_connections(settings):
+    """
+    Test `EmailSender` sends over pooled, persistent SMTP connections.
+
+    Steps:
+    - Send three emails one after another.
+    - Have the relay drop its connections, then send another email.
+    - Send six emails at once with a pool of two connections.
+
+    Expected result:
+    - The first three emails share a single connection
+    - The dropped connection is replaced transparently and the email is delivered
+    - No more than two connections are opened for the concurrent emails
+    - `aclose` leaves no idle connection behind
+    """
+    async with FakeSMTPServer() as smtp_server:
+        sender = make_sender(settings, smtp_server.port)
+        for number in range(3):
+            await sender.send_activation_email(f"user{number}@mate.com", "http://test/activate")
+        assert len(smtp_server.messages) == 3
+        assert smtp_server.connections == 1, f"Expected 1 connection, got {smtp_server.connections}"
+
+        smtp_server.drop_connections()
+        await asyncio.sleep(0)
+        await sender.send_password_reset_email("user@mate.com", "http://test/reset")
+        assert len(smtp_server.messages) == 4
+        assert smtp_server.connections == 2, f"Expected a reconnect, got {smtp_server.connections} connections"
+        await sender.aclose()
+        assert sender.pool.idle_count == 0
+
+        concurrent = make_sender(settings, smtp_server.port, pool_max_size=2)
+        await asyncio.gather(*(
+            concurrent.send_activation_complete_email(f"user{number}@mate.com", "http://test/login")
+            for number in range(6)
+        ))
+        assert len(smtp_server.messages) == 10
+        assert concurrent.pool.connections_opened <= 2
+        await concurrent.aclose()
+
+
+@pytest.mark.asyncio
+async def test_email_sender_pool_idle_timeout(settings):
+    """
+    Test pooled SMTP connections are not reused once idle for longer than the idle timeout.
+
+    Expected result:
+    - With a zero idle timeout, every email opens a new connection and the old one is closed
+    """
+    async with FakeSMTPServer() as smtp_server:
+        sender = make_sender(settings, smtp_server.port, pool_idle_timeout=0)
+        await sender.send_activation_email("user@mate.com", "http://test/activate")
+        await asyncio.sleep(0.01)
+        await sender.send_activation_email("user@mate.com", "http://test/activate")
+
+        assert len(smtp_server.messages) == 2
+        assert smtp_server.connections == 2, f"Expected 2 connections, got {smtp_server.connections}"
+        await sender.aclose()
+
+
+@pytest.mark.asyncio
+async def test_email_sender_pool_retries_only_reused_connections(settings):
+    """
+    Test a connection drop while sending is retried only on a connection taken from the pool.
+
+    Steps:
+    - Send an email, so a connection is pooled.
+    - Have the relay drop every connection as soon as a message starts, then send twice more.
+
+    Expected result:
+    - The first failing email is retried once over a fresh connection, then reported
+    - The second one fails on the fresh connection it opened and is not retried
+    """
+    async with FakeSMTPServer() as smtp_server:
+        sender = make_sender(settings, smtp_server.port)
+        await sender.send_activation_email("user@mate.com", "http://test/activate")
+        smtp_server.drop_on_mail = True
+
+        with pytest.raises(BaseEmailError):
+            await sender.send_activation_email("user@mate.com", "http://test/activate")
+        assert smtp_server.connections == 2, f"Expected 1 retry, got {smtp_server.connections} connections"
+
+        with pytest.raises(BaseEmailError):
+            await sender.send_activation_email("user@mate.com", "http://test/activate")
+        assert smtp_server.connections == 3, f"Expected no retry, got {smtp_server.connections} connections"
+        await sender.aclose()
+
+
+def test_template_registry_precompiles_templates(tmp_path):
+    """
+    Test `TemplateRegistry` renders the templates compiled when it was built.
+
+    Steps:
+    - Build a registry with and without auto-reload, with a bytecode cache, then edit the template.
+
+    Expected result:
+    - Without auto-reload the registry keeps rendering the compiled template
+    - With auto-reload the edit is picked up
+    - The compiled template is written to the bytecode cache
+    - Unregistered templates are rejected
+    """
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    template = template_dir / "greeting.html"
+    template.write_text("Hello {{ email }}")
+    cache_dir = tmp_path / "bytecode"
+    cache_dir.mkdir()
+
+    registry = TemplateRegistry(str(template_dir), ["greeting.html"], bytecode_cache_dir=str(cache_dir))
+    reloading = TemplateRegistry(str(template_dir), ["greeting.html"], auto_reload=True, bytecode_cache=False)
+    assert registry.render("greeting.html", email="user@mate.com") == "Hello user@mate.com"
+    assert list(cache_dir.iterdir()), "Expected the compiled template in the bytecode cache"
+
+    template.write_text("Goodbye {{ email }}")
+    os.utime(template, (template.stat().st_atime, template.stat().st_mtime + 10))
+    assert registry.render("greeting.html", email="user@mate.com") == "Hello user@mate.com"
+    assert reloading.render("greeting.html", email="user@mate.com") == "Goodbye user@mate.com"
+
+    for templates in (registry, reloading):
+        with pytest.raises(KeyError):
+            templates.render("other.html")
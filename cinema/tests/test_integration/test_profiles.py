@@ -5,10 +5,13 @@ import pytest
 from io import BytesIO
 from PIL import Image
 from sqlalchemy import select, func
+from starlette.datastructures import UploadFile
 
 from cinema.database import UserGroupEnum
 from cinema.database.models.accounts import UserModel, UserProfileModel, UserGroupModel
 from cinema.exceptions import S3FileUploadError
+from cinema.tests.doubles.fakes.storage import FakeS3Storage
+from cinema.validation.profile import validate_image
 
 
 @pytest.mark.asyncio
@@ -65,6 +68,7 @@ async def test_create_user_profile_with_fake_s3(
     assert "avatar" in profile_data, "Avatar URL is missing!"
 
     assert avatar_key in s3_storage_fake.storage, "Avatar file was not uploaded to Fake S3 Storage!"
+    assert s3_storage_fake.content_types[avatar_key] == "image/jpeg"
     expected_url = f"http://fake-s3.local/{avatar_key}"
     actual_url = await s3_storage_fake.get_file_url(avatar_key)
     assert actual_url == expected_url, "Avatar URL does not match expected URL."
@@ -657,3 +661,81 @@ async def test_profile_creation_empty_info(client, jwt_manager, info_value, expe
             in error_text or "Field required" in error_text), (
         f"Unexpected error message: {response.json()}"
     )
+
+
+class CountingFile(BytesIO):
+    """
+    In-memory file recording how many bytes were read from it.
+    """
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+@pytest.mark.unit
+def test_validate_image_streams_upload():
+    """
+    Test `validate_image` reads the avatar in chunks and checks it from its header bytes.
+
+    Expected result:
+    - A PNG is accepted; its contents come back as a view of a single buffer, read once
+    - An oversized upload is rejected after reading at most one byte past the limit
+    - A GIF is rejected as unsupported after its first chunk, and unknown data as invalid
+    """
+    png = BytesIO()
+    Image.new("RGB", (64, 64), color="green").save(png, format="PNG")
+    upload = CountingFile(png.getvalue())
+    image = validate_image(UploadFile(upload, filename="avatar.png"), chunk_size=16)
+    assert (image.format, image.content_type, image.filename) == ("PNG", "image/png", "avatar.png")
+    assert isinstance(image.data, memoryview) and image.data == png.getvalue()
+    assert upload.bytes_read == len(png.getvalue())
+
+    oversized = CountingFile(b"\xff\xd8\xff\xe0" + bytes(4 * 1024 * 1024))
+    with pytest.raises(ValueError, match="Image size exceeds 1 MB"):
+        validate_image(UploadFile(oversized, filename="avatar.jpg"))
+    assert oversized.bytes_read == 1024 * 1024 + 1
+
+    gif = CountingFile(b"GIF89a" + bytes(1024 * 1024))
+    with pytest.raises(ValueError, match="Unsupported image format: GIF"):
+        validate_image(UploadFile(gif, filename="avatar.gif"), chunk_size=1024)
+    assert gif.bytes_read == 1024
+
+    with pytest.raises(ValueError, match="Invalid image format"):
+        validate_image(UploadFile(BytesIO(b"fake"), filename="avatar.jpg"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_storage_streams_uploads_in_parts():
+    """
+    Test the storage interface accepts buffers, views and async byte streams.
+
+    Expected result:
+    - Files up to the multipart threshold are stored in one part, with their content type
+    - A stream above the threshold is read in parts of the chunk size, whatever its chunk sizes
+    - A view of a buffer is stored like the buffer
+    """
+    storage = FakeS3Storage(multipart_threshold=10, multipart_chunk_size=4)
+    payload = bytes(range(23))
+
+    async def stream():
+        for size in (1, 6, 3, 13):
+            yield payload[:size]
+
+    await storage.upload_file("small", memoryview(b"0123456789"), content_type="image/png")
+    assert storage.parts["small"] == [10]
+    assert storage.content_types["small"] == "image/png"
+
+    await storage.upload_file("large", stream())
+    assert storage.storage["large"] == payload[:1] + payload[:6] + payload[:3] + payload[:13]
+    assert storage.parts["large"] == [4, 4, 4, 4, 4, 3]
+
+    await storage.upload_file("view", memoryview(payload)[5:20])
+    assert storage.storage["view"] == payload[5:20]
+    assert storage.parts["view"] == [4, 4, 4, 3]
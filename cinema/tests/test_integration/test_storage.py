@@ -0,0 +1,57 @@
+import asyncio
+
+from cinema.storages.s3 import S3StorageClient
+
+
+class FakeClientContext:
+    """
+    Stand-in for the async context manager returned by `aioboto3.Session.client`.
+    """
+
+    def __init__(self, log: list):
+        self._log = log
+        self.client = object()
+
+    async def __aenter__(self):
+        self._log.append(("open", self.client))
+        return self.client
+
+    async def __aexit__(self, *exc_info):
+        self._log.append(("close", self.client))
+
+
+class FakeSession:
+    def __init__(self):
+        self.log = []
+
+    def client(self, *args, **kwargs):
+        return FakeClientContext(self.log)
+
+
+def test_s3_client_closes_previous_loop_client():
+    """
+    Test `S3StorageClient` used from two successive event loops.
+
+    Steps:
+    - Get the S3 client in one `asyncio.run`, then in another, then close the storage.
+
+    Expected result:
+    - Each loop gets its own client
+    - The first client is closed before the second one is opened, and `aclose` closes the second
+    """
+    storage = S3StorageClient("http://storage", "key", "secret", "bucket")
+    session = FakeSession()
+    storage._session = session
+
+    first = asyncio.run(storage._get_client())
+
+    async def reuse_and_close():
+        client = await storage._get_client()
+        assert await storage._get_client() is client
+        await storage.aclose()
+        return client
+
+    second = asyncio.run(reuse_and_close())
+
+    assert first is not second
+    assert session.log == [("open", first), ("close", first), ("open", second), ("close", second)]
@@ -1,34 +1,98 @@
 import re
+from dataclasses import dataclass
 from datetime import date
-from io import BytesIO
+from typing import Optional
 
-from PIL import Image
 from fastapi import UploadFile
 
 from cinema.database.models.accounts import GenderEnum
 
+AVATAR_MAX_SIZE = 1 * 1024 * 1024
+
+# Size of the reads from the uploaded file; an oversized upload is rejected after at most
+# AVATAR_MAX_SIZE + 1 bytes, however large it is.
+AVATAR_CHUNK_SIZE = 64 * 1024
+
+SUPPORTED_IMAGE_FORMATS = {"JPEG": "image/jpeg", "PNG": "image/png"}
+
+# Leading bytes ("magic numbers") of the image formats; the last ones are only recognised
+# to name them in the error.
+IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "JPEG"),
+    (b"\x89PNG\r\n\x1a\n", "PNG"),
+    (b"GIF87a", "GIF"),
+    (b"GIF89a", "GIF"),
+    (b"BM", "BMP"),
+)
+SIGNATURE_LENGTH = max(len(signature) for signature, _ in IMAGE_SIGNATURES)
+
+
+@dataclass(frozen=True)
+class AvatarImage:
+    """
+    A validated avatar: its format and its contents, as a view of the buffer it was read into.
+    """
+    filename: str
+    format: str
+    data: memoryview
+
+    @property
+    def content_type(self) -> str:
+        return SUPPORTED_IMAGE_FORMATS[self.format]
+
 
 def validate_name(name: str):
     if re.search(r'^[A-Za-z]*$', name) is None:
         raise ValueError(f'{name} contains non-english letters')
 
 
-def validate_image(avatar: UploadFile) -> None:
-    supported_image_formats = ["JPG", "JPEG", "PNG"]
-    max_file_size = 1 * 1024 * 1024
+def detect_image_format(header: bytes) -> Optional[str]:
+    """
+    Identify an image format from the first bytes of the file, without decoding the image.
+    """
+    for signature, image_format in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return image_format
+    return None
+
+
+def validate_image(
+        avatar: UploadFile,
+        max_size: int = AVATAR_MAX_SIZE,
+        chunk_size: int = AVATAR_CHUNK_SIZE,
+) -> AvatarImage:
+    """
+    Read an uploaded avatar in chunks, checking its format from the header bytes and its size as it goes.
+
+    The upload is read once, into a single buffer that the returned `AvatarImage` exposes
+    without copying; reading stops as soon as the format is wrong or the size exceeds `max_size`.
+
+    Raises:
+        ValueError: If the image is larger than `max_size`, or not a JPEG or PNG image.
+    """
+    buffer = bytearray()
+    image_format = None
+    while chunk := avatar.file.read(min(chunk_size, max_size + 1 - len(buffer))):
+        buffer += chunk
+        if image_format is None and len(buffer) >= SIGNATURE_LENGTH:
+            image_format = _check_format(buffer)
+        if len(buffer) > max_size:
+            raise ValueError(f"Image size exceeds {max_size / 1024 / 1024:g} MB")
+
+    if image_format is None:
+        image_format = _check_format(buffer)
+    return AvatarImage(filename=avatar.filename, format=image_format, data=memoryview(buffer))
 
-    contents = avatar.file.read()
-    if len(contents) > max_file_size:
-        raise ValueError("Image size exceeds 1 MB")
 
-    try:
-        image = Image.open(BytesIO(contents))
-        avatar.file.seek(0)
-        image_format = image.format
-        if image_format not in supported_image_formats:
-            raise ValueError(f"Unsupported image format: {image_format}. Use one of next: {supported_image_formats}")
-    except IOError:
+def _check_format(header: bytearray) -> str:
+    image_format = detect_image_format(bytes(header[:SIGNATURE_LENGTH]))
+    if image_format is None:
         raise ValueError("Invalid image format")
+    if image_format not in SUPPORTED_IMAGE_FORMATS:
+        raise ValueError(
+            f"Unsupported image format: {image_format}. Use one of next: {list(SUPPORTED_IMAGE_FORMATS)}"
+        )
+    return image_format
 
 
 def validate_gender(gender: str) -> None: